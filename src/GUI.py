@@ -167,6 +167,12 @@ if __name__ == "__main__":
     # Fenster aus Designer laden
     win = uic.loadUi("MainWindow.ui")
 
+    # vorberechnete Qualitätsstufen nutzen, falls vorhanden (qs_table.py)
+    try:
+        Hero.load_qs_table()
+    except FileNotFoundError:
+        pass
+
     # charakter initialisieren, zum Testen
     # charakter = Hero.load("Tore_Bjornson",r'D:\Voovo\Documents\RPG\DSA')
 
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the import time of the modules used at startup.
+
+Each module is imported in a fresh interpreter, several times, and the
+median is compared with its budget. Besides, importing must not load any of
+the heavy dependencies in `DEFERRED`, which are imported on first use only
+(pandas for tables, matplotlib for plots).
+
+Run via command line
+    python bench_startup.py [-n repeat] [module ...]
+The exit code is 1 if a budget is exceeded or a deferred dependency is
+loaded, so the benchmark may guard against regressions.
+
+Created on Sun Oct 18 16:02:31 2026
+
+@author: Mirko Ulrich
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+
+# median import time in milliseconds, numpy alone takes about 100 ms
+BUDGETS = {'hero': 300, 'twinkle': 300, 'compact': 300, 'npc': 300,
+           'roster': 300, 'plottery': 300}
+DEFERRED = ('pandas', 'matplotlib', 'pylab')
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000,
+                  'loaded': sorted(name for name in {deferred!r}
+                                   if name in sys.modules)}}))
+'''
+
+
+def measure(module, repeat=5):
+    """Import a module in fresh interpreters and measure the time.
+
+    Parameters
+    ----------
+    module : str
+        Name of the module, importable from the directory of this file.
+    repeat : int, optional
+        Number of interpreters.
+        The default is 5.
+
+    Raises
+    ------
+    RuntimeError
+        Raised when the import fails.
+
+    Returns
+    -------
+    milliseconds : float
+        Median of the import time.
+    loaded : list
+        Modules of `DEFERRED`, which were loaded by the import.
+
+    """
+    code = _PROBE.format(module=module, deferred=DEFERRED)
+    times, loaded = [], set()
+    for _ in range(repeat):
+        probe = subprocess.run([sys.executable, '-c', code],
+                               cwd=pathlib.Path(__file__).parent,
+                               capture_output=True, text=True)
+        if probe.returncode:
+            raise RuntimeError(f'{module} kann nicht importiert werden:\n'
+                               f'{probe.stderr}')
+        result = json.loads(probe.stdout.splitlines()[-1])
+        times.append(result['ms'])
+        loaded.update(result['loaded'])
+    return statistics.median(times), sorted(loaded)
+
+
+def check(modules=None, repeat=5):
+    """Measure modules and compare them with their budgets.
+
+    Parameters
+    ----------
+    modules : iterable or None, optional
+        Names of the modules. If not specified, all modules of `BUDGETS`.
+        The default is None.
+    repeat : int, optional
+        Number of interpreters per module.
+        The default is 5.
+
+    Returns
+    -------
+    list
+        One row (module, milliseconds, budget, loaded, passed) per module;
+        modules without budget only fail on deferred dependencies.
+
+    """
+    rows = []
+    for module in modules or BUDGETS:
+        milliseconds, loaded = measure(module, repeat)
+        budget = BUDGETS.get(module)
+        passed = not loaded and (budget is None or milliseconds <= budget)
+        rows.append((module, milliseconds, budget, loaded, passed))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Misst die Importzeit der Module beim Programmstart.')
+    parser.add_argument('modules', nargs='*',
+                        help='Module, standardmäßig alle mit Budget.')
+    parser.add_argument('-n', '--repeat', type=int, default=5,
+                        help='Anzahl der Messungen je Modul.')
+    args = parser.parse_args()
+
+    rows = check(args.modules, args.repeat)
+    for module, milliseconds, budget, loaded, passed in rows:
+        limit = '-' if budget is None else f'{budget} ms'
+        status = 'ok' if passed else 'FEHLER'
+        if loaded:
+            status += ', lädt ' + ', '.join(loaded)
+        print(f'{module:<10} {milliseconds:7.1f} ms  (Budget {limit})'
+              f'  {status}')
+    sys.exit(0 if all(row[-1] for row in rows) else 1)
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""Memory saving representation of heroes, e.g. for thousands of NPCs.
+
+A CompactHero keeps attributes and skills as int8 arrays and gifted skills
+as well as incompetences as bitsets over `Hero.SKILL_CHECKS`. Read-only,
+dict-like views stand in for `_attributes`, `_skills`, `_gifted` and
+`_incompetences`, so all evaluations of `hero.HeroBase` work unchanged.
+Only the arrays and bitsets are stored, none of the dictionaries of Hero.
+
+Created on Sun Oct 18 13:40:52 2026
+
+@author: Mirko Ulrich
+"""
+
+from collections.abc import Mapping, Set
+
+import numpy as np
+
+from hero import Hero, HeroBase
+
+
+class _ArrayView(Mapping):
+    """Read-only mapping from designations to values of an array."""
+
+    __slots__ = ('_keys', '_positions', '_values')
+
+    def __init__(self, keys, positions, values):
+        self._keys = keys
+        self._positions = positions
+        self._values = values
+
+    def __getitem__(self, key):
+        return int(self._values[self._positions[key]])
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class _BitsetView(Set):
+    """Read-only set of skills, stored as bits of an integer."""
+
+    __slots__ = ('_bits',)
+
+    def __init__(self, bits):
+        self._bits = bits
+
+    def __contains__(self, skill):
+        row = Hero._SKILL_ROWS.get(skill)
+        return row is not None and bool(self._bits >> row & 1)
+
+    def __iter__(self):
+        return (skill for skill, row in Hero._SKILL_ROWS.items()
+                if self._bits >> row & 1)
+
+    def __len__(self):
+        return bin(self._bits).count('1')
+
+    def __repr__(self):
+        return repr(set(self))
+
+
+class CompactHero(HeroBase):
+    """Immutable hero with array-backed values, see module description.
+
+    Unlike Hero no command line dialogue is started, all values must be
+    given.
+
+    Parameters
+    ----------
+    name : str
+        Name of the hero.
+    attribute_values : list
+        List of integer with length 8, representing the values for the
+        attributes.
+    skill_values : list
+        List of integer with length 59, representing the values for the
+        skills/talents.
+    incompetences : iterable or None, optional
+        String representation of incompetent skills/talents.
+        The default is None.
+    gifted : iterable or None, optional
+        String representation of gifted skills.
+        The default is None.
+    rng : int or numpy.random.Generator or None, optional
+        Source of all rolls of this hero, see `Hero.rng`.
+        The default is None.
+
+    Raises
+    ------
+    HeroValidationError
+        Raised when values are missing, no integers or out of range, when an
+        unknown skill is stated as gifted or incompetent or a skill as both,
+        see `Hero.from_arrays`.
+
+    """
+
+    __slots__ = ('_attribute_values', '_skill_values', '_gifted_bits',
+                 '_incompetent_bits')
+
+    _ATTRIBUTE_POSITIONS = {att: i for i, att in enumerate(Hero.ATTRIBUTES)}
+    _SKILLS = tuple(Hero.SKILL_CHECKS)
+
+    def __init__(self, name, attribute_values, skill_values,
+                 incompetences=None, gifted=None, rng=None):
+        self.name = name
+        self.rng = rng
+
+        # same checks as for many heroes, see Hero.from_arrays
+        attribute_values, skill_values, incompetences, gifted = \
+            self._validate_arrays([name], [attribute_values], [skill_values],
+                                  [incompetences or ()], [gifted or ()])
+        self._attribute_values = attribute_values[0].astype(np.int8)
+        self._skill_values = skill_values[0].astype(np.int8)
+        self._incompetent_bits = self._to_bits(incompetences[0])
+        self._gifted_bits = self._to_bits(gifted[0])
+        self._invalidate_objectives()
+
+    @classmethod
+    def from_arrays(cls, names, attribute_values, skill_values,
+                    incompetences=None, gifted=None, rng=None):
+        """Create many compact heroes at once, see `Hero.from_arrays`.
+
+        The values of all heroes share two int8 arrays, each hero only holds
+        a view on its row.
+
+        Parameters
+        ----------
+        names : list
+            Names of the N heroes.
+        attribute_values : array_like
+            Values of the attributes with shape (N, 8).
+        skill_values : array_like
+            Values of the skills with shape (N, 59).
+        incompetences : list or None, optional
+            One iterable of incompetent skills per hero.
+            The default is None.
+        gifted : list or None, optional
+            One iterable of gifted skills per hero.
+            The default is None.
+        rng : int or numpy.random.Generator or None, optional
+            See `Hero.from_arrays`.
+            The default is None.
+
+        Raises
+        ------
+        HeroValidationError
+            See `Hero.from_arrays`.
+
+        Returns
+        -------
+        list
+            Initiated compact heroes.
+
+        """
+        attribute_values, skill_values, incompetences, gifted = \
+            cls._validate_arrays(names, attribute_values, skill_values,
+                                 incompetences, gifted)
+        attribute_values = attribute_values.astype(np.int8)
+        skill_values = skill_values.astype(np.int8)
+        attribute_vectors = attribute_values.astype(int)
+        rngs = cls._spawn_batch(rng, len(names))
+
+        heroes = []
+        for i, name in enumerate(names):
+            hero = cls.__new__(cls)
+            hero.name = name
+            # deferred generator, see Hero._spawn_batch
+            hero._rng = rngs[i]
+            hero._dice = None
+            hero._attribute_values = attribute_values[i]
+            hero._skill_values = skill_values[i]
+            hero._incompetent_bits = cls._to_bits(incompetences[i])
+            hero._gifted_bits = cls._to_bits(gifted[i])
+            hero._attribute_vector = attribute_vectors[i]
+            hero._objective_cache = {}
+            heroes.append(hero)
+        return heroes
+
+    @classmethod
+    def from_hero(cls, hero):
+        """Convert any Hero into its compact form.
+
+        Spell-likes of a Twinkle are not kept.
+
+        Parameters
+        ----------
+        hero : Hero
+            Hero to convert.
+
+        Returns
+        -------
+        CompactHero
+            Compact copy of `hero`, sharing its generator.
+
+        """
+        return cls(hero.name,
+                   [hero._attributes[att] for att in cls.ATTRIBUTES],
+                   [hero._skills[skill] for skill in cls._SKILLS],
+                   [s for s in hero._incompetences if s in cls._SKILL_ROWS],
+                   [s for s in hero._gifted if s in cls._SKILL_ROWS],
+                   rng=hero.rng)
+
+    def to_hero(self):
+        """Convert into an ordinary, mutable Hero.
+
+        Returns
+        -------
+        Hero
+            Copy of this hero, sharing its generator.
+
+        """
+        return Hero(self.name, self._attribute_values.tolist(),
+                    self._skill_values.tolist(), set(self._incompetences),
+                    set(self._gifted), rng=self.rng)
+
+    def __getstate__(self):
+        # views and caches are derived, only the arrays are stored
+        return {name: getattr(self, name)
+                for name in ('name', '_rng') + self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._dice = None
+        self._invalidate_objectives()
+
+    @property
+    def _attributes(self):
+        return _ArrayView(self.ATTRIBUTES, self._ATTRIBUTE_POSITIONS,
+                          self._attribute_values)
+
+    @property
+    def _skills(self):
+        return _ArrayView(self._SKILLS, self._SKILL_ROWS, self._skill_values)
+
+    @property
+    def _gifted(self):
+        return _BitsetView(self._gifted_bits)
+
+    @property
+    def _incompetences(self):
+        return _BitsetView(self._incompetent_bits)
+
+    def update_attribute(self, attribute, by=1):
+        """Not supported, see `to_hero`."""
+        raise TypeError(f'{self.name} ist unveränderlich.')
+
+    def update_talent(self, talent, by=1):
+        """Not supported, see `to_hero`."""
+        raise TypeError(f'{self.name} ist unveränderlich.')
+
+    def update_special_abilities(self, also_permitted=[]):
+        """Not supported, see `to_hero`."""
+        raise TypeError(f'{self.name} ist unveränderlich.')
+
+    def _invalidate_objectives(self):
+        """Drop cached objectives, see `Hero._invalidate_objectives`."""
+        self._attribute_vector = self._attribute_values.astype(int)
+        self._objective_cache = {}
+
+    @classmethod
+    def _to_bits(cls, skills):
+        """Encode skills as bits, position given by `Hero._SKILL_ROWS`."""
+        bits = 0
+        for skill in skills or ():
+            if skill not in cls._SKILL_ROWS:
+                raise ValueError('{} ist keine'
+                                 ' gültige Fertigkeit.'.format(skill))
+            bits |= 1 << cls._SKILL_ROWS[skill]
+        return bits
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Exact analysis of competitive tests (Vergleichsproben).
+
+Both parties roll a test, the one with more quality levels wins; a failed
+test counts as zero quality levels and equal quality levels are a draw.
+See https://ulisses-regelwiki.de/index.php/GR_Proben.html
+
+Created on Sun Oct 18 12:31:07 2026
+
+@author: Mirko Ulrich
+"""
+
+import numpy as np
+import pandas as pd
+
+from hero import Hero
+from roster import distributions
+
+
+# joint outcome (q, r) contributes to difference q - r, shifted by 12
+_DIFFERENCE_MAP = np.eye(2 * Hero._QS_BINS - 1)[
+    (np.arange(Hero._QS_BINS)[:, None]
+     - np.arange(Hero._QS_BINS)[None, :]).reshape(-1) + Hero._QS_BINS - 1]
+
+
+def contest(hero, talent, opponent, opponent_talent, modifier=0,
+            opponent_modifier=0):
+    """Determine the chances of `hero` in a competitive test.
+
+    Parameters
+    ----------
+    hero : HeroBase
+        Active party, e.g. testing Überreden.
+    talent : str
+        Skill (or spell-like) of `hero`.
+    opponent : HeroBase
+        Opposing party, e.g. testing Willenskraft.
+    opponent_talent : str
+        Skill (or spell-like) of `opponent`.
+    modifier : int, optional
+        Modification set to the test of `hero`.
+        The default is 0.
+    opponent_modifier : int, optional
+        Modification set to the test of `opponent`.
+        The default is 0.
+
+    Returns
+    -------
+    win_prob : float
+        Probability that `hero` achieves more quality levels.
+    draw_prob : float
+        Probability of equal quality levels.
+    loss_prob : float
+        Probability that `opponent` achieves more quality levels.
+    difference_prob : numpy.ndarray
+        P(#QS(hero) - #QS(opponent) = d) for d = -12, ..., 12, i.e. index
+        d + 12, with shape (25,).
+
+    """
+    qs_prob = distributions([(hero, talent, modifier),
+                             (opponent, opponent_talent, opponent_modifier)])
+    win_prob, draw_prob, loss_prob, difference_prob = _contest_matrix(
+        qs_prob[0], qs_prob[1])
+    return float(win_prob), float(draw_prob), float(loss_prob), \
+        difference_prob
+
+
+def contest_roster(hero, talent, opponents, opponent_talent, modifier=0,
+                   opponent_modifier=0):
+    """Determine the chances of `hero` against each of `opponents`.
+
+    All tests are evaluated in one batched pass.
+
+    Parameters
+    ----------
+    hero : HeroBase
+        Active party.
+    talent : str
+        Skill (or spell-like) of `hero`.
+    opponents : list
+        Opposing heroes, e.g. from `roster.load_roster`.
+    opponent_talent : str
+        Skill (or spell-like) tested by every opponent.
+    modifier : int, optional
+        Modification set to the test of `hero`.
+        The default is 0.
+    opponent_modifier : int, optional
+        Modification set to the tests of the opponents.
+        The default is 0.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per opponent with the probabilities 'Sieg',
+        'Unentschieden' and 'Niederlage' of `hero` as well as the expected
+        difference of quality levels.
+
+    """
+    qs_prob = distributions(
+        [(hero, talent, modifier)]
+        + [(opponent, opponent_talent, opponent_modifier)
+           for opponent in opponents])
+    win_prob, draw_prob, loss_prob, difference_prob = _contest_matrix(
+        qs_prob[0], qs_prob[1:])
+    differences = np.arange(-Hero._QS_BINS + 1, Hero._QS_BINS)
+    return pd.DataFrame(
+        {'Sieg': win_prob,
+         'Unentschieden': draw_prob,
+         'Niederlage': loss_prob,
+         'Erwartete Differenz': difference_prob @ differences},
+        index=pd.Index([opponent.name for opponent in opponents],
+                       name='Gegner'))
+
+
+def _contest_matrix(qs_prob, opponent_qs_prob):
+    """Compare independent distributions of quality levels.
+
+    Parameters
+    ----------
+    qs_prob : numpy.ndarray
+        P(#QS=q) of the active party with shape (..., 13).
+    opponent_qs_prob : numpy.ndarray
+        P(#QS=q) of the opposing party with shape (..., 13), broadcasted
+        against `qs_prob`.
+
+    Returns
+    -------
+    tuple
+        Probabilities of win, draw and loss with shape (...) and the
+        distribution of differences with shape (..., 25), see `contest`.
+
+    """
+    joint = qs_prob[..., :, None] * opponent_qs_prob[..., None, :]
+    difference_prob = (joint.reshape(joint.shape[:-2] + (-1,))
+                       @ _DIFFERENCE_MAP)
+    center = Hero._QS_BINS - 1
+    return (difference_prob[..., center + 1:].sum(axis=-1),
+            difference_prob[..., center],
+            difference_prob[..., :center].sum(axis=-1),
+            difference_prob)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Bulk source of twenty-sided dice.
+
+Drawing a handful of numbers from a numpy generator is dominated by the
+overhead of the call itself. `DiceBuffer` draws many D20 at once and hands
+them out on demand, refilling chunk by chunk.
+
+Created on Sun Oct 18 11:20:05 2026
+
+@author: Mirko Ulrich
+"""
+
+import threading
+
+import numpy as np
+
+
+class DiceBuffer():
+    """Hand out results of D20 rolls from a pre-generated buffer.
+
+    The buffer is refilled with `size` dice whenever it is exhausted, thus
+    the sequence of results only depends on the seed of `rng` and on `size`,
+    not on how many dice are requested per call. Two buffers created from
+    equally seeded generators with same `size` yield identical rolls.
+    A buffer may be shared by threads, each roll is taken under a lock.
+
+    Parameters
+    ----------
+    rng : int or numpy.random.Generator or None, optional
+        Source of the random numbers; a seed or None is passed to
+        numpy.random.default_rng.
+        The default is None.
+    size : int, optional
+        Number of dice drawn per refill.
+        The default is 4096.
+
+    Raises
+    ------
+    ValueError
+        Raised when `size` is not positive.
+
+    """
+
+    def __init__(self, rng=None, size=4096):
+        if size < 1:
+            raise ValueError('Die Puffergröße muss positiv sein.')
+        if not isinstance(rng, np.random.Generator):
+            rng = np.random.default_rng(rng)
+        self.rng = rng
+        self.size = size
+        self._buffer = np.empty(0, dtype=np.int64)
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def roll(self, shape=1):
+        """Roll D20s.
+
+        Parameters
+        ----------
+        shape : int or tuple, optional
+            Shape of the returned array, e.g. 3 for a 3D20 test.
+            The default is 1.
+
+        Returns
+        -------
+        numpy.ndarray
+            Results from 1 to 20, a new array which may be modified.
+
+        """
+        # fast path for plain counts, np.prod costs more than the slicing
+        count = shape if isinstance(shape, int) else int(np.prod(shape))
+        with self._lock:
+            stop = self._position + count
+            if stop <= len(self._buffer):
+                dice = self._buffer[self._position:stop].copy()
+                self._position = stop
+                return dice if isinstance(shape, int) else dice.reshape(shape)
+
+            # take the rest and refill as often as needed
+            parts = [self._buffer[self._position:]]
+            missing = count - len(parts[0])
+            while missing > 0:
+                self._refill()
+                part = self._buffer[:missing]
+                self._position = len(part)
+                parts.append(part)
+                missing -= len(part)
+        return np.concatenate(parts).reshape(shape)
+
+    def remaining(self):
+        """Number of dice left in the buffer before next refill."""
+        return len(self._buffer) - self._position
+
+    def _refill(self):
+        """Replace the buffer by `size` new dice, called under the lock."""
+        self._buffer = self.rng.integers(1, 21, self.size)
+        self._position = 0
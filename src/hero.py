@@ -5,71 +5,50 @@ Created on Sat Jan 16 09:27:20 2021
 @author: Mirko Ulrich
 """
 
+import functools
+import hashlib
 import json
-import multiprocessing
 import pathlib
 
 import numpy as np
-import pandas as pd
 
-import plottery
+from dice import DiceBuffer
+from results import QSDistribution, RollResult
 
 
-class Hero():
-    """Baseclass for characters from the rpg `Das Shwarze Auge` (DSA).
-
-    This class is motivated by the need for automatic evaluation of test,
-    which is executed via the roll of three dices with twenty faces. This
-    independent random vector of three components must be lower than the
-    heros values in the corresponding attributes. See official rules at
-    https://ulisses-regelwiki.de/index.php/GR_Proben.html
-
-    Basic funtionality
-    ------------------
-    >>> from held import Held
-    >>> mary = Held('Mary Sue')
-    ==-> Nun Eigenschaften eingeben <-==
-        ...
-    ==->  Nun Fertigkeiten eingeben  <-==
-        ...
-    >>> print(mary.absoviere('Zechen', modifikator=-1))
-    Mary Sue absolviert eine Probe auf Zechen (Fertigkeistwert 5), um 1
-    erschwert.
-    Eigenschaften:
-        Klugheit - Konstitution - Körperkraft
-    Zielwerte:
-        [12 11 12]
-    Würfelergebnis:
-        [3 2 9]
-    Ergebnis:   Erfolg mit 2 Qualitätsstufen
+class HeroValidationError(ValueError):
+    """Invalid values for heroes created in bulk.
 
     Parameters
     ----------
-    name : str
-        Name of the hero.
-    attribute_values : list, optional
-        List of integer with lenght 8, representing the values for the
-        attributes. Are asked in command line dialogue if not specified.
-        The default is [].
-    skill_values : list, optional
-        List of integer with length 59, representing the values for the
-        skills/talents. Are asked in command line dialogue if not
-        specified.
+    message : str
+        Description of the problem.
+    field : str
+        Affected part, e.g. 'Eigenschaften' or 'Fertigkeiten'.
+    rows : list, optional
+        Positions of the affected heroes within the batch.
         The default is [].
-    incompetences : list or set or None, optional
-        String representation of incompetent skills/talents.
-        The default is None.
-    gifted : list or set or None, optional
-        String representation of gifted skills or spell-likes.
-        The default is None.
 
-    Raises
-    ------
-    TypeError
-        Raised when `incompetences` or `gifted` are not given as set, list
-        or None.
+    """
+
+    def __init__(self, message, field, rows=[]):
+        super().__init__(message)
+        self.field = field
+        self.rows = list(rows)
+
+
+class HeroBase():
+    """Evaluations shared by all representations of heroes.
+
+    Derived classes store the values of a hero and provide them as
+    `_attributes` and `_skills`, mapping designations to values, as well as
+    `_gifted` and `_incompetences`, containing skills. See Hero for values
+    held in dictionaries and `compact.CompactHero` for values held in arrays.
 
     """
+    __slots__ = ('name', '_rng', '_dice', '_attribute_vector',
+                 '_objective_cache')
+
     SKILL_CHECKS = {
         'Fliegen': ('Mut', 'Intuition', 'Gewandtheit'),
         'Gaukeleien': ('Mut', 'Charisma', 'Fingerfertigkeit'),
@@ -140,66 +119,104 @@ class Hero():
         'Stoffbearbeitung': ('Klugheit', 'Fingerfertigkeit',
                              'Fingerfertigkeit')
         }
+    ATTRIBUTES = ('Mut', 'Klugheit', 'Intuition', 'Charisma',
+                  'Fingerfertigkeit', 'Gewandtheit', 'Konstitution',
+                  'Körperkraft')
+    # position in ATTRIBUTES of the three attributes for each skill
+    _SKILL_ATTRIBUTE_INDEX = np.array(
+        list(map(ATTRIBUTES.index, sum(SKILL_CHECKS.values(), ()))),
+        dtype=np.intp).reshape(-1, 3)
+    # row in _SKILL_ATTRIBUTE_INDEX for each skill
+    _SKILL_ROWS = {skill: row for row, skill in enumerate(SKILL_CHECKS)}
+
+    # quality level by spare points, shifted by one: index 0 <=> spare < 0,
+    # index 17 <=> spare >= 16; see __determine_quality_level
+    _QUALITY_LEVEL_LUT = np.array([0, 1, 1, 1, 1, 2, 2, 2, 3, 3, 3,
+                                   4, 4, 4, 5, 5, 5, 6], dtype=np.int8)
+    # quality levels 0 to 12 (doubled on critical success)
+    _QS_BINS = 13
+    # all 20**3 possible results of a 3W20 roll, first dice changes slowest
+    _EVENTS_3W20 = np.stack(
+        np.meshgrid(*[np.arange(1, 21, dtype=np.int16)] * 3, indexing='ij'),
+        axis=-1).reshape(-1, 3)
+    _ONES_3W20 = np.count_nonzero(_EVENTS_3W20 == 1, axis=-1)
+    _TWENTIES_3W20 = np.count_nonzero(_EVENTS_3W20 == 20, axis=-1)
+    _CRIT_WIN_3W20 = _ONES_3W20 > 1
+    _CRIT_FAIL_3W20 = _TWENTIES_3W20 > 1
+    _CRIT_STATE_3W20 = _CRIT_WIN_3W20 + 2 * _CRIT_FAIL_3W20
+    # see _reroll_outcomes
+    _REROLL_OUTCOMES = None
+    # increase whenever the evaluation of tests changes, see _rule_hash
+    _RULES_VERSION = 1
+    # precomputed distributions, see load_qs_table
+    _QS_TABLE = None
+    # joint distributions computed so far by kind of test, see _cached_joint
+    _JOINT_CACHE = {}
+    # maximal number of tests evaluated at once, see _distribution_matrix
+    _CHUNK_SIZE = 256
+    # maximal number of cached objectives per hero, see _estimae_objective
+    _OBJECTIVE_CACHE_SIZE = 256
+    # message of tests to be preprocessed in both ways, see _perform_test
+    _REROLL_CONFLICT = ('A test can not be taken on a talent, which is'
+                        ' considered gifted an incompetent at the same time.')
+
+    @property
+    def rng(self):
+        """numpy.random.Generator: Source of all rolls of this hero.
+
+        Created from fresh entropy on first use, unless set before. May be
+        set to a seed (int), a Generator or None, so runs can be replayed
+        exactly. A numpy.random.SeedSequence is turned into a Generator on
+        first use only. Setting it also discards the dice in `dice`.
+        """
+        if isinstance(self._rng, tuple):
+            # deferred child of a batch, see _spawn_batch
+            root, index = self._rng
+            self._rng = np.random.SeedSequence(
+                root.entropy, spawn_key=root.spawn_key + (index,),
+                pool_size=root.pool_size)
+        if not isinstance(self._rng, np.random.Generator):
+            self._rng = np.random.default_rng(self._rng)
+        return self._rng
+
+    @rng.setter
+    def rng(self, value):
+        if value is None or isinstance(value, (np.random.Generator,
+                                               np.random.SeedSequence)):
+            self._rng = value
+        else:
+            self._rng = np.random.default_rng(value)
+        self._dice = None
 
-    def __init__(self, name, attribute_values=[], skill_values=[],
-                 incompetences=None, gifted=None):
-        self.name = name
-        self._attributes = dict.fromkeys(
-            ['Mut', 'Klugheit', 'Intuition', 'Charisma', 'Fingerfertigkeit',
-             'Gewandtheit', 'Konstitution', 'Körperkraft'])
-        self._skills = dict.fromkeys(
-            list(self.SKILL_CHECKS.keys()))
-
-        if len(attribute_values) != len(self._attributes):
-            # User Interaction
-            print('==->  Nun Eigenschaften eingeben  <-==')
-            attribute_values = self.__ask_for_values(self._attributes, (1, 25))
+    @property
+    def dice(self):
+        """DiceBuffer: Pre-generated D20s drawn from `rng` in bulk."""
+        if self._dice is None:
+            self._dice = DiceBuffer(self.rng)
+        return self._dice
 
-        if all([1 <= val <= 25 for val in attribute_values]):
-            # check given list of values
-            self._attributes = {
-                list(self._attributes.keys())[i]: attribute_values[i]
-                for i in range(len(attribute_values))}
-        else:
-            raise ValueError('Werte für Eigenschaften müssen'
-                             ' im Bereich von 1 bis 25 liegen.')
+    def spawn_rngs(self, n):
+        """Derive independent generators, e.g. one per worker.
 
-        if len(skill_values) != len(self._skills):
-            print('==->  Nun Fertigkeiten eingeben  <-==')
-            skill_values = self.__ask_for_values(self._skills, (0, 25))
+        The streams do not overlap with each other nor with `rng`, so parallel
+        rolls remain reproducible for a seeded hero.
 
-        if all([0 <= val <= 25 for val in skill_values]):
-            self._skills = {
-                list(self._skills.keys())[i]: skill_values[i]
-                for i in range(len(skill_values))}
-        else:
-            raise ValueError('Werte für Talente müssen im '
-                             'Bereich von 0 bis 25 liegen.')
+        Parameters
+        ----------
+        n : int
+            Number of generators.
 
-        if incompetences is None:
-            self._incompetences = set()
-        else:
-            if isinstance(incompetences, set):
-                self._incompetences = incompetences
-            elif isinstance(incompetences, list):
-                self._incompetences = set(incompetences)
-            else:
-                raise TypeError('`incompetences` is expected '
-                                'as set or list.')
+        Returns
+        -------
+        list
+            `n` instances of numpy.random.Generator.
 
-        if gifted is None:
-            self._gifted = set()
-        else:
-            if isinstance(gifted, set):
-                self._gifted = gifted
-            elif isinstance(gifted, list):
-                self._gifted = set(gifted)
-            else:
-                raise TypeError('`gifted` is expected as list.')
+        """
+        return self.rng.spawn(n)
 
     @classmethod
     def load(cls, character,
-             directory=pathlib.Path.cwd()):
+             directory=pathlib.Path.cwd(), rng=None):
         """Load character from harddrive and returns corresponding Hero object.
 
         Parameters
@@ -210,6 +227,9 @@ class Hero():
         directory : str, optional
             Specifies directory to load <name>.json from.
             The default is pathlib.Path.cwd(), i.e. current work directory.
+        rng : int or numpy.random.Generator or None, optional
+            Source of all rolls of the hero, see `Hero.rng`.
+            The default is None.
 
         Raises
         ------
@@ -228,12 +248,12 @@ class Hero():
             with open(final_file, 'r') as source:
                 data = json.load(source)
             return cls._from_json(name=character.replace('_', ' '),
-                                  stats=data)
+                                  stats=data, rng=rng)
         else:
             raise ValueError('Keine gültigen Daten gefunden.')
 
     @classmethod
-    def _from_json(cls, name, stats):
+    def _from_json(cls, name, stats, rng=None):
         """Initate an instance of Held from given `name` and specified `stats`.
 
         Since incompetences and gifted skills are optional, `stats` is checked
@@ -249,6 +269,9 @@ class Hero():
             Must provide stats:'Eigenschaften' -> a=[int], with len(a)=8
             and stats:'Fertigkeiten' -> b=[int], with len(b)=59;
             may contain Values for 'incompetences' and 'gifted'.
+        rng : int or numpy.random.Generator or None, optional
+            Source of all rolls of the hero, see `Hero.rng`.
+            The default is None.
 
         Returns
         -------
@@ -270,9 +293,279 @@ class Hero():
                    list(stats['Eigenschaften'].values()),
                    list(stats['Fertigkeiten'].values()),
                    incompetences,
-                   gifted_talents)
+                   gifted_talents,
+                   rng=rng)
         return hero
 
+    @classmethod
+    def from_arrays(cls, names, attribute_values, skill_values,
+                    incompetences=None, gifted=None, rng=None):
+        """Create many heroes at once, without any command line dialogue.
+
+        All values are validated for the whole batch before any hero is
+        created.
+
+        Parameters
+        ----------
+        names : list
+            Names of the N heroes.
+        attribute_values : array_like
+            Values of the attributes with shape (N, 8), ordered as
+            `ATTRIBUTES`.
+        skill_values : array_like
+            Values of the skills with shape (N, 59), ordered as
+            `SKILL_CHECKS`.
+        incompetences : list or None, optional
+            One iterable of incompetent skills per hero.
+            The default is None.
+        gifted : list or None, optional
+            One iterable of gifted skills per hero.
+            The default is None.
+        rng : int or numpy.random.Generator or None, optional
+            If given, each hero gets an independent stream spawned from it,
+            see `Hero.rng`.
+            The default is None.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised when shapes do not match or values are out of range or
+            unknown skills are stated or a skill is gifted and incompetent
+            at once; `rows` names the affected heroes.
+
+        Returns
+        -------
+        list
+            Initiated heroes.
+
+        """
+        attribute_values, skill_values, incompetences, gifted = \
+            cls._validate_arrays(names, attribute_values, skill_values,
+                                 incompetences, gifted)
+        attributes = [dict(zip(cls.ATTRIBUTES, values))
+                      for values in attribute_values.tolist()]
+        skills = [dict(zip(cls.SKILL_CHECKS, values))
+                  for values in skill_values.tolist()]
+        rngs = cls._spawn_batch(rng, len(names))
+
+        heroes = []
+        for i, name in enumerate(names):
+            hero = cls.__new__(cls)
+            hero._assemble(name, attributes[i], skills[i], incompetences[i],
+                           gifted[i], rngs[i], attribute_values[i])
+            heroes.append(hero)
+        return heroes
+
+    @classmethod
+    def from_records(cls, records, rng=None):
+        """Create many heroes from dictionaries, e.g. parsed json.
+
+        Parameters
+        ----------
+        records : list
+            Dictionaries as written by `save`, additionally with key 'Name'.
+            'Eigenschaften' and 'Fertigkeiten' may also be given as lists.
+        rng : int or numpy.random.Generator or None, optional
+            See `from_arrays`.
+            The default is None.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for missing keys or invalid values.
+
+        Returns
+        -------
+        list
+            Initiated heroes.
+
+        """
+        return cls.from_arrays(*cls._collect_records(records), rng=rng)
+
+    @classmethod
+    def _collect_records(cls, records):
+        """Split dictionaries into the arguments of `from_arrays`.
+
+        Parameters
+        ----------
+        records : list
+            See `from_records`.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for missing keys.
+
+        Returns
+        -------
+        tuple
+            names, attribute_values, skill_values, incompetences, gifted
+
+        """
+        def ordered(values, keys, field, row):
+            if isinstance(values, dict):
+                try:
+                    return [values[key] for key in keys]
+                except KeyError as err:
+                    raise HeroValidationError(
+                        f'{err.args[0]} fehlt in {field}.', field, [row])
+            return values
+
+        names, attributes, skills, incompetences, gifted = [], [], [], [], []
+        for row, record in enumerate(records):
+            for field in ('Name', 'Eigenschaften', 'Fertigkeiten'):
+                if field not in record:
+                    raise HeroValidationError(
+                        f'{field} fehlt.', field, [row])
+            names.append(record['Name'])
+            attributes.append(ordered(record['Eigenschaften'],
+                                      cls.ATTRIBUTES, 'Eigenschaften', row))
+            skills.append(ordered(record['Fertigkeiten'], cls.SKILL_CHECKS,
+                                  'Fertigkeiten', row))
+            incompetences.append(record.get('Unfähigkeiten', ()))
+            gifted.append(record.get('Begabungen', ()))
+        return names, attributes, skills, incompetences, gifted
+
+    @classmethod
+    def _validate_arrays(cls, names, attribute_values, skill_values,
+                         incompetences, gifted, permitted=()):
+        """Check a batch of values with vectorized range checks.
+
+        Parameters
+        ----------
+        names : list
+            Names of the N heroes.
+        attribute_values : array_like
+            Values of the attributes with shape (N, 8).
+        skill_values : array_like
+            Values of the skills with shape (N, 59).
+        incompetences : list or None
+            One iterable of incompetent skills per hero.
+        gifted : list or None
+            One iterable of gifted skills per hero.
+        permitted : iterable, optional
+            Additional legal designations for gifted skills, one iterable
+            per hero.
+            The default is (), i.e. none.
+
+        Raises
+        ------
+        HeroValidationError
+            See `from_arrays`.
+
+        Returns
+        -------
+        tuple
+            Attributes and skills as integer arrays, incompetences and
+            gifted as lists of sets.
+
+        """
+        count = len(names)
+        attribute_values = cls._checked_matrix(
+            attribute_values, (count, len(cls.ATTRIBUTES)), (1, 25),
+            'Eigenschaften')
+        skill_values = cls._checked_matrix(
+            skill_values, (count, len(cls.SKILL_CHECKS)), (0, 25),
+            'Fertigkeiten')
+
+        def checked_sets(values, field, permitted):
+            if values is None:
+                return [set() for _ in range(count)]
+            if len(values) != count:
+                raise HeroValidationError(
+                    f'Es werden {count} Einträge für {field} benötigt.',
+                    field)
+            sets = [set(skills) for skills in values]
+            rows = [row for row, skills in enumerate(sets)
+                    if not skills <= set(cls.SKILL_CHECKS).union(
+                        permitted[row] if permitted else ())]
+            if rows:
+                raise HeroValidationError(
+                    f'Unbekannte Fertigkeiten in {field}.', field, rows)
+            return sets
+
+        incompetences = checked_sets(incompetences, 'Unfähigkeiten', ())
+        gifted = checked_sets(gifted, 'Begabungen', permitted)
+        # a reroll is either in favour or against the hero, never both
+        rows = [row for row in range(count)
+                if incompetences[row] & gifted[row]]
+        if rows:
+            raise HeroValidationError(
+                'Fertigkeiten können nicht zugleich Begabung und Unfähigkeit'
+                ' sein.', 'Begabungen', rows)
+        return attribute_values, skill_values, incompetences, gifted
+
+    @staticmethod
+    def _checked_matrix(values, shape, limits, field):
+        """Convert to integer array and check shape and limits at once.
+
+        Parameters
+        ----------
+        values : array_like
+            Values for all heroes.
+        shape : tuple
+            Expected shape.
+        limits : tuple
+            Lowest and highest legal value.
+        field : str
+            Name for error messages.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for a wrong shape, non integer or illegal values.
+
+        Returns
+        -------
+        numpy.ndarray
+            Validated values as native integers, so modifiers can be added
+            without overflow of small dtypes like uint8.
+
+        """
+        try:
+            values = np.asarray(values)
+        except ValueError:
+            raise HeroValidationError(
+                f'Alle Helden benötigen gleich viele {field}.', field)
+        if values.size == 0 and shape[0] == 0:
+            # an empty batch, e.g. from [], lacks the second dimension
+            values = values.reshape(shape)
+        if values.shape != shape:
+            raise HeroValidationError(
+                f'{field} werden mit Form {shape} erwartet,'
+                f' nicht {values.shape}.', field)
+        if shape[0] and not np.issubdtype(values.dtype, np.integer):
+            raise HeroValidationError(
+                f'{field} müssen ganze Zahlen sein.', field)
+        low, high = limits
+        rows = np.flatnonzero(np.any((values < low) | (values > high),
+                                     axis=-1))
+        if rows.size:
+            raise HeroValidationError(
+                f'Werte für {field} müssen im Bereich von {low} bis {high}'
+                ' liegen.', field, rows.tolist())
+        return values.astype(int)
+
+    @staticmethod
+    def _spawn_batch(rng, count):
+        """Independent seeds for a batch, None if `rng` is None.
+
+        A single child of `rng` is spawned for the whole batch. Each hero
+        only gets a pair (child, index), the seed sequence and generator
+        are derived from it by `Hero.rng` on the first roll. Creating them
+        eagerly would dominate the creation of large batches.
+        """
+        if rng is None:
+            return [None] * count
+        if isinstance(rng, np.random.Generator):
+            seed = rng.bit_generator.seed_seq
+        elif isinstance(rng, np.random.SeedSequence):
+            seed = rng
+        else:
+            seed = np.random.SeedSequence(rng)
+        root = seed.spawn(1)[0]
+        return [(root, index) for index in range(count)]
+
     def execute(self, talent, modifier=-0):
         """Perform a test on a certin talent, w.r.t. skikll value and modifier.
 
@@ -295,6 +588,29 @@ class Hero():
         str
             Formatted result of the skill test.
 
+        """
+        return str(self.execute_result(talent, modifier))
+
+    def execute_result(self, talent, modifier=0):
+        """Perform a test like `execute`, but keep the values of the roll.
+
+        No text is built; it is only formatted when the result is converted
+        via `str()`, which makes this the choice for many rolls in a row.
+
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        RollResult
+            Dice, objectives, success, crit and quality levels of the test.
+
         """
         # estimate objectives for rolling
         objective, impossible = self._estimae_objective(
@@ -302,11 +618,13 @@ class Hero():
             attribute_source=self.SKILL_CHECKS)
 
         if impossible:
-            msg = (f'Die Erschwernis von {abs(modifier)} '
-                   'macht diese Probe unmöglich.')
-            return msg
+            return RollResult(self.name, talent, None, None, False,
+                              modifier=modifier,
+                              skill_level=self._skills[talent],
+                              attributes=tuple(self.SKILL_CHECKS[talent]),
+                              impossible=True)
 
-        _3w20 = np.random.randint(1, 21, 3)
+        _3w20 = self.dice.roll(3)
 
         # Zufallsereignis auswerten
         suc, crit, quality_level, quality_level_app = self._perform_test(
@@ -315,8 +633,7 @@ class Hero():
             gifted=(talent in self._gifted),
             incompetent=(talent in self._incompetences))
 
-        # Ausgabe bestimmen
-        out = self._format_outcome(
+        return self._roll_result(
             skill=talent,
             goals=objective,
             random_event=_3w20,
@@ -326,9 +643,8 @@ class Hero():
             crit=crit,
             quality_level=(quality_level, quality_level_app),
             modification=modifier)
-        return out
 
-    def analyze_talent(self, talent, modifier=0):
+    def analyze_talent(self, talent, modifier=0, mode='cube'):
         """Visualize the probability of the stated test with plot and string.
 
         Wrapper for `_analyze_success`, specifies the source for the
@@ -342,6 +658,12 @@ class Hero():
             Modification set to the test; negative values for a more difficult,
             positve values for an easier test
             The default is 0.
+        mode : str, optional
+            Kind of plot: 'cube' scatters all rolls in 3D, 'heatmap' shows
+            the mean quality level per pair of dice, 'bars' the distribution
+            of quality levels and 'curve' the chance of success over
+            modifiers, see `plottery.plot`.
+            The default is 'cube'.
 
         Returns
         -------
@@ -353,12 +675,72 @@ class Hero():
         return self._analyze_success(talent=talent,
                                      attribute_source=self.SKILL_CHECKS,
                                      skill_value_source=self._skills,
-                                     modifier=modifier)
+                                     modifier=modifier, mode=mode)
+
+    def analyze_talent_result(self, talent, modifier=0):
+        """Determine the distribution of `analyze_talent` without plotting.
+
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        QSDistribution
+            Distribution of quality levels, formatted by `str()`.
+
+        """
+        return self._distribution_result(talent=talent,
+                                         attribute_source=self.SKILL_CHECKS,
+                                         skill_value_source=self._skills,
+                                         modifier=modifier)
+
+    def _distribution_result(self, talent, attribute_source,
+                             skill_value_source, modifier=0):
+        """Determine the exact distribution of quality levels of a test.
+
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            See `_analyze_success`.
+        skill_value_source : dict
+            See `_analyze_success`.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        QSDistribution
+            Distribution of quality levels.
+
+        """
+        objective, impossible = self._estimae_objective(
+            talent=talent, modifier=modifier,
+            attribute_source=attribute_source)
+
+        if impossible:
+            return QSDistribution.impossible_test(self.name, talent, modifier)
+
+        qs_prob, qs_app_prob, crit_prob, botch_prob = self._qs_distribution(
+            aims=objective, skill_level=skill_value_source[talent],
+            gifted=talent in self._gifted,
+            incompetent=talent in self._incompetences)
+        return QSDistribution(self.name, talent, qs_prob, qs_app_prob,
+                              crit_prob, botch_prob, modifier=modifier)
 
     def _analyze_success(self, talent,
                          attribute_source,
                          skill_value_source,
-                         modifier=0):
+                         modifier=0, mode='cube'):
         """Visualize the probability of the statet test with plot and string.
 
         Parameters
@@ -377,10 +759,14 @@ class Hero():
             Modification set to the test; negative values for a more difficult,
             positve values for an easier test
             The default is 0.
+        mode : str, optional
+            Kind of plot, see `analyze_talent`.
+            The default is 'cube'.
 
         Note
         ----
-        As sideeffect a matplotlib panel is displayed within a further process.
+        As sideeffect a matplotlib panel is displayed by the plot worker, see
+        `plottery.PlotWorker`.
 
         Returns
         -------
@@ -389,867 +775,2343 @@ class Hero():
             specified talent/skill.
 
         """
-        # estimate objectives for rolling
-        objective, impossible = self._estimae_objective(
-            talent=talent, modifier=modifier,
-            attribute_source=attribute_source)
+        distribution = self._distribution_result(
+            talent=talent, attribute_source=attribute_source,
+            skill_value_source=skill_value_source, modifier=modifier)
+        if distribution.impossible:
+            return str(distribution)
 
-        if impossible:
-            msg = (f'Die Erschwernis von {abs(modifier)} '
-                   'macht diese Probe unmöglich.')
-            return msg
-
-        # generate table with all possible random events
-        table = self._n_cartesian_three(20, talent, attribute_source)
-        header = list(table.columns)
-        qualities = []
-
-        # estimate all possible random events
-        for index, row in table.iterrows():
-            _, _, quality_level, _ = self._perform_test(
-                aim=objective,
-                random_event=row.to_numpy(),
-                skill_level=skill_value_source[talent],
-                gifted=(talent in self._gifted),
-                incompetent=(talent in self._incompetences))
-            qualities.append(quality_level)
-        table['#QS'] = qualities
-
-        # begin plotting process
-        title = f'Verteilung der Qualitätsstufen von {talent}'
-        proc = multiprocessing.Process(
-            target=plottery.plot_cube_of_success,
-            args=(table, title,))
-        proc.start()
-
-        # begin describing probabilities
-        distribution = (f'Erfolgsaussichten für ein Probe auf {talent} mit '
-                        f'Modifikator {modifier}:\n\n')
-
-        results = table.groupby('#QS').count().index
-        prob = table.groupby('#QS').count()[header[0]].to_numpy(dtype='float')
-        prob /= sum(prob)
-        expected_value = sum(results * prob)
-
-        # following string formating
-        delimiter = ' | '
-        upper = '     q   ' + delimiter
-        lower = ' P(#QS=q)' + delimiter
-        for i in range(len(results)):
-            if results[i] < 10:
-                upper += ('  ' + str(results[i]) + '  ' + delimiter)
-            else:
-                upper += ('  ' + str(results[i]) + ' ' + delimiter)
-            lower += (
-                '{:5.2f}'.format(np.round(prob[i]*100, 2))
-                + delimiter)
-        # correct last char
-        upper = upper[:-1]
-        lower = lower[:-1]
-        line = '-' * len(upper)
-
-        distribution += upper + '\n' + line + '\n' + lower + '\n'
-        distribution += ' '*len(line[:-3]) + '[in Prozent]'
-        distribution += f'\nErwartungswert: {expected_value:.2f}'
-
-        # phrase non-determenistic warning if analyzed talent is a special one
-        if talent in self._gifted or talent in self._incompetences:
-            if talent in self._gifted:
-                speciality = 'Begabung'
-            else:
-                speciality = 'Unfähigkeit'
-            warning = f'\n Achtung! Das Talent {talent} ist eine {speciality}'
-            warning += (', daher unterliegt die Wahrscheinlichkeitsverteilung'
-                        ' gewissen (vernachlässigbaren) Schwankungen. Durch '
-                        'diesen Nichtdeterminismus begründet sich auch das '
-                        'besondere Erscheinungsbild der Visualisierung.')
+        import plottery
 
-            distribution += warning
-        return distribution
+        plottery.plot(mode, *self._plot_payload(
+            talent, attribute_source, skill_value_source, modifier, mode,
+            distribution))
+        return str(distribution)
 
-    def update_special_abilities(self, also_permitted=[]):
-        """Initiate command line dialogue to update gifted and incompetences.
+    def render_talent(self, talent, modifier=0, fmt='png', path=None,
+                      mode='cube'):
+        """Render the plot of `analyze_talent` headless as image.
 
-        After confirmation the corresponding sets are updated.
+        Images are cached, see `plottery.render`.
 
         Parameters
         ----------
-        also_permitted : list, optional
-            List of strings representing additional legal skills for gifted
-            and incompetences. Enable derived classes to allow spell-likes as
-            gifted skills.
-            The default is [].
+        talent : str
+            State the talent/skill to be tested.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+        fmt : str, optional
+            Image format, 'png' or 'svg'.
+            The default is 'png'.
+        path : str or pathlib.Path or None, optional
+            File to write the image to additionally.
+            The default is None.
+        mode : str, optional
+            Kind of plot, see `analyze_talent`.
+            The default is 'cube'.
 
         Raises
         ------
         ValueError
-            Raised when user try to...
-                ...set more than 3 gifted skills.
-                ...set more than 2 incompetences.
-                ...set the same skill as gifted and incompetence.
-                ...choose a non legal option (typo, attributes, etc.)
+            Raised when the modifier makes the test impossible.
 
         Returns
         -------
-        None.
+        bytes
+            Content of the image.
 
         """
-        # Whether gifts shall be updated
-        val = self._clean_read(text='Begabungen aktualisieren?\n(j/n) ',
-                               legal_response=['j', 'n'])
-        if val == 'j':
-            temp = self._show_and_update_set(
-                f'{self.name}\'s Begabungen:',
-                self._gifted)
-            if len(temp) > 3:
-                raise ValueError('Nicht mehr als 3 Begabungen erlaubt.')
-            for t in temp:
-                in_skills = t in self.SKILL_CHECKS.keys()
-                in_further_skills = t in also_permitted
-                if not in_skills and not in_further_skills:
-                    raise ValueError(f'{t} ist keine zulässige Fertigkeit.')
-            if temp.isdisjoint(self._incompetences):
-                self._gifted = temp
-            else:
-                raise ValueError('Begabungen und Unfähigkeiten'
-                                 ' dürfen sich nicht überlappen.')
-
-        # whether inability shall be updated
-        val = self._clean_read(text='Unfähigkeiten aktualisieren?\n(j/n) ',
-                               legal_response=['j', 'n'])
-        if val == 'j':
-            temp = self._show_and_update_set(
-                f'{self.name}\'s Unfähigkeiten:',
-                self._incompetences)
-            if len(temp) > 2:
-                raise ValueError('Nicht mehr als 2 Unfähigkeiten erlaubt.')
-            for t in temp:
-                if t not in self.SKILL_CHECKS.keys():
-                    raise ValueError('{t} ist keine zulässige Fertigkeit.')
-            if temp.isdisjoint(self._gifted):
-                self._incompetences = temp
-            else:
-                raise ValueError('Begabungen und Unfähigkeiten'
-                                 ' dürfen sich nicht überlappen.')
+        return self._render_success(talent, self.SKILL_CHECKS, self._skills,
+                                    modifier, fmt, path, mode)
 
-        val = self._clean_read(
-            text='Weitere Aktualisierungen vornehmen?\n(j/n) ',
-            legal_response=['j', 'n'])
+    def _render_success(self, talent, attribute_source, skill_value_source,
+                        modifier=0, fmt='png', path=None, mode='cube'):
+        """Render a plot of the test headless, see `render_talent`."""
+        _, impossible = self._estimae_objective(
+            talent=talent, modifier=modifier,
+            attribute_source=attribute_source)
+        if impossible:
+            raise ValueError(f'Die Erschwernis von {abs(modifier)} '
+                             'macht diese Probe unmöglich.')
 
-        # whether more updates shall be happen
-        if val == 'j':
-            self.update_special_abilities(
-                also_permitted=also_permitted)
+        import plottery
 
-    def save(self, directory=pathlib.Path.cwd()):
-        """Store character describing dictionaries as json on harddrive.
+        return plottery.render(
+            mode, *self._plot_payload(talent, attribute_source,
+                                      skill_value_source, modifier, mode),
+            fmt=fmt, path=path)
 
-        File is written as <name>.json, whereby spaces are removed.
+    def _plot_payload(self, talent, attribute_source, skill_value_source,
+                      modifier=0, mode='cube', distribution=None):
+        """Aggregated arrays for a plot of the test, see `plottery.plot`.
 
         Parameters
         ----------
-        directory : str, optional
-            Directory to store the char.
-            The default is directory=pathlib.Path.cwd(), i.e. current work
-            directory.
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            See `_analyze_success`.
+        skill_value_source : dict
+            See `_analyze_success`.
+        modifier : int, optional
+            Modification set to the test. The test must be possible.
+            The default is 0.
+        mode : str, optional
+            Kind of plot, see `analyze_talent`.
+            The default is 'cube'.
+        distribution : QSDistribution or None, optional
+            Already determined distribution of the test, used for 'bars'.
+            The default is None.
 
         Raises
         ------
-        OSError
-            Raised in cases of problems concerning writing permissions or
-            errors in specified path.
+        ValueError
+            Raised for an unknown mode.
 
         Returns
         -------
-        None.
+        tuple
+            Arguments of the drawing function of `mode`.
 
         """
-        directory = pathlib.Path(directory)
-        if directory.exists() and directory.is_dir():
-            file = '{}.json'.format(self.name.replace(' ', '_'))
-            data_to_dump = {'Eigenschaften': self._attributes,
-                            'Fertigkeiten': self._skills,
-                            'Begabungen': list(self._gifted),
-                            'Unfähigkeiten': list(self._incompetences)}
-            with open(pathlib.Path(directory, file),
-                      'w') as file:
-                json.dump(data_to_dump, file)
-        else:
-            raise OSError('Mit gültigem Pfad erneut versuchen.'
-                          ' Eventuell Schreibrechte überprüfen.')
-
-    def test(self, attribute, modifikator=0):
-        """Perform an attribute check, meaning a 1D20 roll.
+        if mode in ('cube', 'heatmap'):
+            return self._cube_of_success(talent, attribute_source,
+                                         skill_value_source, modifier)
+        if mode == 'bars':
+            if distribution is None:
+                distribution = self._distribution_result(
+                    talent, attribute_source, skill_value_source, modifier)
+            return (distribution.qs_prob, distribution.qs_app_prob,
+                    f'Verteilung der Qualitätsstufen von {talent} mit '
+                    f'Modifikator {modifier}')
+        if mode == 'curve':
+            # the default range, widened to include the current modifier
+            modifiers = range(min(-10, modifier), max(6, modifier + 1))
+            modifiers, _, success_prob, expected_value = \
+                self._sweep_success(talent, attribute_source,
+                                    skill_value_source, modifiers)
+            return (modifiers, success_prob, expected_value,
+                    f'Erfolgsaussichten für {talent}', modifier)
+        raise ValueError(f'{mode} ist keine bekannte Darstellung.')
+
+    def _cube_of_success(self, talent, attribute_source, skill_value_source,
+                         modifier=0):
+        """Quality levels of all possible rolls for plotting.
 
         Parameters
         ----------
-        attribute : str
-            Attribute to be checked.
-        modifikator : int, optional
-            Modification set to the test; negative values for a more difficult,
-            positve values for an easier test
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            See `_analyze_success`.
+        skill_value_source : dict
+            See `_analyze_success`.
+        modifier : int, optional
+            Modification set to the test. The test must be possible.
             The default is 0.
 
         Returns
         -------
-        msg : str
-            Formatted result of the attribute check.
+        qualities : numpy.ndarray
+            Quality levels with shape (20, 20, 20), indexed by the dice;
+            mean over the outcomes of a reroll for gifted/incompetent skills.
+        labels : list
+            Designation of the axes.
+        title : str
+            Title of the plot.
 
         """
-        assert attribute in self._attributes.keys(),\
-            '{} ist keine gültige Eigenschaft.'.format(attribute)
-        eigenschaftswert_mod = min(
-            self._attributes[attribute] + modifikator, 19)
-        _1w20 = np.random.randint(1, 21, 1)
+        objective, _ = self._estimae_objective(
+            talent=talent, modifier=modifier,
+            attribute_source=attribute_source)
+        qualities = self._mean_qualities(
+            tuple(objective.tolist()), skill_value_source[talent],
+            talent in self._gifted, talent in self._incompetences)
+        return (qualities,
+                [f'[{i}] {attribute}' for i, attribute
+                 in enumerate(attribute_source[talent], start=1)],
+                f'Verteilung der Qualitätsstufen von {talent}')
+
+    def sweep_talent(self, talent, modifiers=range(-10, 6)):
+        """Determine the chances of a test for a whole range of modifiers.
+
+        Wrapper for `_sweep_success`, specifies the source for the
+        combination of attributes.
 
-        suc, _, _, _ = self._perform_test(
-            aim=np.array(eigenschaftswert_mod),
-            random_event=_1w20)
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        modifiers : iterable of int, optional
+            Modifications to evaluate; negative values for a more difficult,
+            positive values for an easier test.
+            The default is range(-10, 6).
 
-        msg = f'{self.name} testet {attribute} ({self._attributes[attribute]})'
+        Returns
+        -------
+        tuple
+            See `_sweep_success`.
 
-        if modifikator == 0:
-            msg += ':\n'
-        elif modifikator > 0:
-            msg += f', erleichtert um {abs(modifikator)}:\n'
-        elif modifikator < 0:
-            msg += f', erschwert um {abs(modifikator)}:\n'
+        """
+        return self._sweep_success(talent=talent,
+                                   attribute_source=self.SKILL_CHECKS,
+                                   skill_value_source=self._skills,
+                                   modifiers=modifiers)
 
-        if suc:
-            msg += '\nGeschafft mit einem Wurf von {}.'.format(*_1w20)
-        else:
-            msg += '\nNicht geschafft mit einem Wurf von {}.'.format(*_1w20)
+    def _sweep_success(self, talent, attribute_source, skill_value_source,
+                       modifiers=range(-10, 6)):
+        """Determine the chances of a test for a whole range of modifiers.
 
-        return msg
+        A modifier only shifts and caps the objective, so all modifiers are
+        evaluated in one vectorized pass, whereby each distinct objective is
+        evaluated only once. Impossible tests count as failure.
 
-    def show_special_abilities(self):
-        """Show talents which are marked as gifted or incompetent.
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            Look up dictionary to determine attributes for intended analyzing
+            objective. Must contain `talent` as key and 3-string-tuple,
+            representing attributes, as values.
+        skill_value_source : dict
+            Look up dictionary to determine skill level (value) for intended
+            analyzing objective. Must contain `talent` as key and integer as
+            values.
+        modifiers : iterable of int, optional
+            Modifications to evaluate.
+            The default is range(-10, 6).
+
+        Raises
+        ------
+        ValueError
+            Raised when specified talent is not legal, i.e. is not a key in
+            specified `attribute_source`.
 
         Returns
         -------
-        out : str
-            Formatted representation.
+        modifiers : numpy.ndarray
+            Evaluated modifications, shape (K,).
+        qs_prob : numpy.ndarray
+            P(#QS=q) for q = 0, ..., 12 for each modifier, shape (K, 13).
+        success_prob : numpy.ndarray
+            Probability to pass the test for each modifier, shape (K,).
+        expected_value : numpy.ndarray
+            Expected quality level for each modifier, shape (K,).
 
         """
-        msg_1 = f'{self.name}\'s Begabungen:'
-        line = '='*len(msg_1)
-        msg_1 += f'\n{line}\n\t'
-        for t in self._gifted:
-            msg_1 += f'{t} '
-
-        msg_2 = f'{self.name}\'s Unfähigkeiten:'
-        line = '='*len(msg_2)
-        msg_2 += f'\n{line}\n\t'
-        for u in self._incompetences:
-            msg_2 += f'{u} '
+        modifiers = np.asarray(list(modifiers), dtype=int)
+        try:
+            attributes = np.array(
+                [self._attributes[eig] for eig in attribute_source[talent]])
+        except KeyError:
+            raise ValueError('{} ist keine'
+                             ' gültige Fertigkeit.'.format(talent))
 
-        out = msg_1 + '\n' + msg_2
-        return out
+        aims = np.minimum(attributes + modifiers[:, None], 19)
+        possible = np.all(aims >= 1, axis=-1)
+
+        qs_prob = np.zeros((len(modifiers), self._QS_BINS))
+        qs_prob[:, 0] = 1
+        if possible.any():
+            # capped objectives repeat for easy tests
+            unique_aims, inverse = np.unique(aims[possible], axis=0,
+                                             return_inverse=True)
+            distribution, _, _, _ = self._qs_distribution(
+                aims=unique_aims, skill_level=skill_value_source[talent],
+                gifted=(talent in self._gifted),
+                incompetent=(talent in self._incompetences))
+            qs_prob[possible] = distribution[inverse.reshape(-1)]
 
-    def show_attributes(self):
-        """Show attributes and values.
+        success_prob = 1 - qs_prob[:, 0]
+        expected_value = qs_prob @ np.arange(self._QS_BINS)
+        return modifiers, qs_prob, success_prob, expected_value
 
-        Returns
-        -------
-        str
-            Formatted representation.
+    def simulate_talent(self, talent, modifier=0, **options):
+        """Estimate the chances of a test by Monte Carlo simulation.
 
-        """
-        return self._show_pretty_dicts(
-            f'{self.name}\'s Eigenschaften:', self._attributes)
+        Wrapper for `_simulate_success`, specifies the source for the
+        combination of attributes.
 
-    def show_skills(self):
-        """Show skills and values.
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+        **options
+            Passed to `simulation.simulate`, e.g. trials, workers or
+            tolerance.
 
         Returns
         -------
-        str
-            Formatted representation.
+        tuple
+            See `simulation.simulate`.
 
         """
-        return self._show_pretty_dicts(
-            f'{self.name}\'s Fertigkeiten:', self._skills)
+        return self._simulate_success(talent=talent,
+                                      attribute_source=self.SKILL_CHECKS,
+                                      skill_value_source=self._skills,
+                                      modifier=modifier, **options)
 
-    def update_attribute(self, attribute: str, by=1):
-        """Update attribute value by given integer.
+    def _simulate_success(self, talent, attribute_source, skill_value_source,
+                          modifier=0, **options):
+        """Estimate the chances of a test by Monte Carlo simulation.
+
+        Unless a seed is given in `options`, the seed is drawn from `rng`, so
+        a seeded hero yields reproducible simulations.
 
         Parameters
         ----------
-        attribute : str
-            Attribute to update.
-        by : int, optional
-            Value for additive manipulation.
-            The default is 1.
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            Look up dictionary to determine attributes for the test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for the test.
+        modifier : int, optional
+            Modification set to the test.
+            The default is 0.
+        **options
+            Passed to `simulation.simulate`.
 
         Raises
         ------
         ValueError
-            Iff updated attribute value would violent legal limits.
-        KeyError
-            Iff argument `attribute` is not among the attributes.
+            Raised when the test is impossible due to `modifier`.
 
         Returns
         -------
-        None.
+        tuple
+            See `simulation.simulate`.
 
         """
-        assert isinstance(by, int),\
-            'Entwicklungsdiffernez muss als ganze Zahl gegeben sein.'
+        import simulation
 
-        try:
-            old_val = self._attributes[attribute]
-            new_val = old_val + by
-            if 1 <= new_val <= 25:
-                msg = (f'Attribut {attribute} von {old_val} auf {new_val} '
-                       'setzen?\n(j/n) ')
-                res = self._clean_read(msg, legal_response=['j', 'n'])
-                if res == 'j':
-                    self._attributes[attribute] = new_val
-                    print('Wert angepasst.')
-                else:
-                    print('Keine Änderungen vorgenommen.')
-            else:
-                raise ValueError('Entwickelter Wert muss im '
-                                 'Bereich 1 bis 25 liegen.')
-        except KeyError:
-            raise KeyError(f'{attribute} ist kein gültiges Attribut.')
+        objective, impossible = self._estimae_objective(
+            talent=talent, modifier=modifier,
+            attribute_source=attribute_source)
+        if impossible:
+            raise ValueError(f'Die Erschwernis von {abs(modifier)} '
+                             'macht diese Probe unmöglich.')
 
-    def update_talent(self, talent: str, by=1):
-        """Update talent value by given integer.
+        scenario = simulation.TestScenario(
+            aims=objective, skill_level=skill_value_source[talent],
+            gifted=(talent in self._gifted),
+            incompetent=(talent in self._incompetences))
+        options.setdefault('seed', self.rng.integers(2**32, size=4))
+        return simulation.simulate(scenario, **options)
+
+    def extended_talent(self, talent, target, attempts, modifier=0,
+                        penalty=0, abort_on_botch=True):
+        """Determine the chances of an extended test (Sammelprobe).
+
+        Wrapper for `_extended_success`, specifies the source for the
+        combination of attributes.
 
         Parameters
         ----------
         talent : str
-            Talent/skill to update.
-        by : int, optional
-            Value for additive manipulation.
-            The default is 1.
+            State the talent/skill to be tested.
+        target : int
+            Accumulated quality levels needed.
+        attempts : int
+            Maximal number of tests.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each further test.
+            The default is 0.
+        abort_on_botch : bool, optional
+            Iff a botch fails the whole extended test.
+            The default is True.
+
+        Returns
+        -------
+        tuple
+            See `_extended_success`.
+
+        """
+        return self._extended_success(talent=talent,
+                                      attribute_source=self.SKILL_CHECKS,
+                                      skill_value_source=self._skills,
+                                      target=target, attempts=attempts,
+                                      modifier=modifier, penalty=penalty,
+                                      abort_on_botch=abort_on_botch)
+
+    def _extended_success(self, talent, attribute_source, skill_value_source,
+                          target, attempts, modifier=0, penalty=0,
+                          abort_on_botch=True):
+        """Determine the exact chances of an extended test.
+
+        The accumulated quality levels form a Markov chain with states
+        0, ..., `target` (reached, absorbing) and, if `abort_on_botch`, an
+        absorbing state for a botch. The transition of each attempt is the
+        distribution of a single test, see `_distribution_matrix`; attempt i
+        (counting from zero) is modified by `modifier` - i * `penalty`.
+        Impossible attempts count as failure.
+
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            Look up dictionary to determine attributes for the test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for the test.
+        target : int
+            Accumulated quality levels needed, at least one.
+        attempts : int
+            Maximal number of tests, at least one.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each further test.
+            The default is 0.
+        abort_on_botch : bool, optional
+            Iff a botch fails the whole extended test.
+            The default is True.
 
         Raises
         ------
         ValueError
-            Iff updated skill value would violent legal limits.
-        KeyError
-            Iff argument `talent` is not among the talents/skills.
+            Raised when `talent` is not legal or `target` or `attempts` are
+            not positive.
 
         Returns
         -------
-        None.
+        success_prob : numpy.ndarray
+            P(target reached within i + 1 attempts) for each attempt i,
+            shape (`attempts`,).
+        qs_prob : numpy.ndarray
+            Distribution of accumulated quality levels, capped at `target`,
+            after all attempts with shape (`target` + 1,). Aborted tests are
+            not included.
+        abort_prob : float
+            Probability that a botch failed the extended test.
 
         """
-        assert isinstance(by, int),\
-            'Entwicklungsdiffernez muss als ganze Zahl gegeben sein.'
+        if target < 1 or attempts < 1:
+            raise ValueError('Ziel und Anzahl der Versuche müssen positiv'
+                             ' sein.')
+        if talent not in attribute_source:
+            raise ValueError('{} ist keine'
+                             ' gültige Fertigkeit.'.format(talent))
 
-        try:
-            old_val = self._skills[talent]
-            new_val = old_val + by
-            if 0 <= new_val <= 25:
-                msg = \
-                    (f'Fertigkeitswert von {talent} von {old_val} auf '
-                     f'{new_val} setzen?\n(j/n) ')
-                res = self._clean_read(msg, legal_response=['j', 'n'])
-                if res == 'j':
-                    self._skills[talent] = new_val
-                    print('Wert angepasst.')
-                else:
-                    print('Keine Änderungen vorgenommen.')
-            else:
-                raise ValueError('Entwickelter Wert muss im '
-                                 'Bereich 0 bis 25 liegen.')
-        except KeyError:
-            raise KeyError(f'{talent} ist kein gültiges Talent.')
+        qs_single, botch_single = self._attempt_distributions(
+            talent, attribute_source, skill_value_source,
+            modifiers=modifier - penalty * np.arange(attempts))
+        if abort_on_botch:
+            qs_single[:, 0] -= botch_single
+        else:
+            botch_single = np.zeros(attempts)
+
+        # states 0, ..., target - 1 are open; target is reached
+        state = np.zeros(target + 1)
+        state[0] = 1
+        abort_prob = 0
+        success_prob = np.empty(attempts)
+        for i in range(attempts):
+            open_states = state[:target]
+            moved = np.convolve(open_states, qs_single[i])
+            abort_prob += open_states.sum() * botch_single[i]
+            state = np.append(moved[:target],
+                              state[target] + moved[target:].sum())
+            success_prob[i] = state[target]
+        return success_prob, state, float(abort_prob)
+
+    def retry_talent(self, talent, modifier=0, penalty=1, attempts=None,
+                     abort_on_botch=True):
+        """Determine the chances of retrying a failed test.
+
+        Wrapper for `_retry_success`, specifies the source for the
+        combination of attributes.
 
-    @classmethod
-    def get_all_skills_gui(cls):
-        """Getter for skills; concerning GUI.
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each retry.
+            The default is 1.
+        attempts : int or None, optional
+            Maximal number of tests.
+            The default is None, i.e. until the test becomes impossible.
+        abort_on_botch : bool, optional
+            Iff a botch prevents any further retry.
+            The default is True.
 
         Returns
         -------
-        skill_set : list
-            List of strings representing all skills.
+        tuple
+            See `_retry_success`.
 
         """
-        skill_set = []
+        return self._retry_success(talent=talent,
+                                   attribute_source=self.SKILL_CHECKS,
+                                   skill_value_source=self._skills,
+                                   modifier=modifier, penalty=penalty,
+                                   attempts=attempts,
+                                   abort_on_botch=abort_on_botch)
+
+    def _retry_success(self, talent, attribute_source, skill_value_source,
+                       modifier=0, penalty=1, attempts=None,
+                       abort_on_botch=True):
+        """Determine the chances of retrying a failed test.
+
+        A failed test may be retried, each retry is more difficult by
+        `penalty`. The distribution of each attempt is evaluated once, see
+        `_attempt_distributions`.
 
-        for skill in cls.SKILL_CHECKS.keys():
-            skill_set.append(cls._tamper_designation(skill))
-        return skill_set
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            Look up dictionary to determine attributes for the test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for the test.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each retry.
+            The default is 1.
+        attempts : int or None, optional
+            Maximal number of tests.
+            The default is None, i.e. until the test becomes impossible.
+        abort_on_botch : bool, optional
+            Iff a botch prevents any further retry.
+            The default is True.
 
-    def get_gifted_skills_gui(self):
-        """Getter for gifted skills(`Begabungen`); concerning GUI.
+        Raises
+        ------
+        ValueError
+            Raised when `talent` is not legal or when the number of attempts
+            is unlimited without any penalty.
 
         Returns
         -------
-        gifted_skills : list
-            List of strings representing the heros' gifted skills.
+        attempt_prob : numpy.ndarray
+            P(first success at attempt i + 1) for each attempt i.
+        success_prob : float
+            Probability to succeed at all.
+        expected_value : float
+            Expected quality level, given the test succeeds at all.
 
         """
-        gifted_skills = []
-        for skill in self._gifted:
-            gifted_skills.append(self._tamper_designation(skill))
-        return gifted_skills
+        if talent not in attribute_source:
+            raise ValueError('{} ist keine'
+                             ' gültige Fertigkeit.'.format(talent))
+        if attempts is None:
+            if penalty <= 0:
+                raise ValueError('Ohne Erschwernis muss die Anzahl der'
+                                 ' Versuche begrenzt werden.')
+            # last attempt with all objectives at least one
+            lowest = min(self._attributes[att]
+                         for att in attribute_source[talent])
+            attempts = max((lowest + modifier - 1) // penalty + 1, 0)
+        if attempts < 1:
+            return np.zeros(0), 0.0, 0.0
+
+        qs_single, botch_single = self._attempt_distributions(
+            talent, attribute_source, skill_value_source,
+            modifiers=modifier - penalty * np.arange(attempts))
+        failure = qs_single[:, 0]
+        retry = failure - botch_single if abort_on_botch else failure
+        # probability to reach attempt i at all
+        reached = np.cumprod(np.append(1, retry[:-1]))
+
+        attempt_prob = reached * (1 - failure)
+        success_prob = attempt_prob.sum()
+        if success_prob == 0:
+            return attempt_prob, 0.0, 0.0
+        expected_value = (reached @ (qs_single @ np.arange(self._QS_BINS))
+                          / success_prob)
+        return attempt_prob, float(success_prob), float(expected_value)
+
+    def _attempt_distributions(self, talent, attribute_source,
+                               skill_value_source, modifiers):
+        """Determine the distribution of a test for each modifier.
 
-    def get_incompetent_skills_gui(self):
-        """Getter for incompetences(`Unfähigkeiten`); concerning GUI.
+        Parameters
+        ----------
+        talent : str
+            State the talent/skill to be tested.
+        attribute_source : dict
+            Look up dictionary to determine attributes for the test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for the test.
+        modifiers : numpy.ndarray
+            Modification of each attempt with shape (K,).
 
         Returns
         -------
-        incompetent_skills : list
-            List of strings representing the heros' incompetences.
+        qs_prob : numpy.ndarray
+            P(#QS=q) for each attempt with shape (K, 13).
+        botch_prob : numpy.ndarray
+            Probability of a botch for each attempt with shape (K,).
 
         """
-        incompetent_skills = []
-        for skill in self._incompetences:
-            incompetent_skills.append(self._tamper_designation(skill))
-        return incompetent_skills
-
-    def _estimae_objective(self, talent, modifier, attribute_source):
-        """Derives objective for random event for a test on talent.
-
-        Each talent correspond to three attributes, which values make up the
-        objective to roll against (random event). These values may be modified
-        on DM decision, marked by modfier. Each value is lower or equal to 19.
-        If any value is lower than one, the test is considered as impossible.
+        attributes = np.array([self._attributes[att]
+                               for att in attribute_source[talent]])
+        aims = np.minimum(attributes + np.asarray(modifiers)[:, None], 19)
+        qs_prob, _, botch_prob = self._distribution_matrix(
+            aims, np.full(len(aims), skill_value_source[talent]),
+            np.full(len(aims), talent in self._gifted),
+            np.full(len(aims), talent in self._incompetences))
+        return qs_prob, botch_prob
+
+    def analyze_all(self, modifier=0):
+        """Summarize the chances of all skills, without any plot.
+
+        Wrapper for `_analyze_all`, specifies the source for the
+        combination of attributes.
 
         Parameters
         ----------
-        talent : str
-            skill or spell like to be tested.
-        modifier : int
-            Alleviation (positive Values) or difficulty on objective.
-        attribute_source : dict
-            Source to look up attributes for the test of talent. Therefore
-            `talent` must be among `attribute_source.keys()`.
-
-        Raises
-        ------
-        ValueError
-            Raised when specified talent is not legal, i.e. is not a key in
-            specified `attribute_source`.
+        modifier : int, optional
+            Modification set to all tests; negative values for a more
+            difficult, positve values for an easier test
+            The default is 0.
 
         Returns
         -------
-        objective : numpy.ndarry
-            Estimated objective for test.
-        impossible : bool
-            Iff any objective value is lower than one after considering the
-            modifier.
+        pandas.DataFrame
+            See `_analyze_all`.
 
         """
-        try:
-            objective = np.array(
-                [self._attributes[eig]
-                 for eig in attribute_source[talent]])
-            add_cap_19 = np.vectorize(
-                lambda x: min(19, x + modifier)
-                )
-            objective = add_cap_19(objective)
-        except KeyError:
-            raise ValueError('{} ist keine'
-                             ' gültige Fertigkeit.'.format(talent))
-
-        if any(objective < 1):                  # detect impossible tests
-            impossible = True
-        else:
-            impossible = False
+        return self._analyze_all(attribute_source=self.SKILL_CHECKS,
+                                 skill_value_source=self._skills,
+                                 modifier=modifier,
+                                 attribute_index=self._SKILL_ATTRIBUTE_INDEX)
 
-        return objective, impossible
+    def _analyze_all(self, attribute_source, skill_value_source, modifier=0,
+                     attribute_index=None):
+        """Summarize the chances of all tests from `attribute_source`.
 
-    def _format_outcome(self, skill: str, goals, random_event,
-                        talent_level: dict,
-                        talent_composition: dict,
-                        success: bool, crit: bool, quality_level: (int, int),
-                        kind_of_test='absolviert eine Probe auf',
-                        modification=0):
-        """Summarize the results of a (3D20) roll with all necessary values.
+        All tests are evaluated together in one batched pass, see
+        `_distribution_matrix`.
 
         Parameters
         ----------
-        skill : str
-            Talent which was tested.
-        goals : numpy.ndarry
-            Values to achieve lower rolls.
-        random_event : numpy.ndarray
-            Representing the roll.
-        talent_level : dict
-            Must contain `skill` as key.
-        talent_composition : dict
-            Must contain `skill` as key.
-        success : bool
-            Iff test was passed.
-        crit : bool
-            Iff test was passed outstanding (success or fail).
-        quality_level : int
-            Measurement of success (if accomplished).
-        kind_of_test : str, optional
-            Allows to formate also spell-likes from derived classes.
-            The default is 'absolviert eine Probe auf'.
-        modification : int, optional
-            Modification set to the test; negative values for a more difficult,
-            positve values for an easier test
+        attribute_source : dict
+            Look up dictionary to determine attributes for each test, see
+            `_analyze_success`.
+        skill_value_source : dict
+            Look up dictionary to determine skill level (value) for each
+            test, see `_analyze_success`.
+        modifier : int, optional
+            Modification set to all tests.
             The default is 0.
+        attribute_index : numpy.ndarray or None, optional
+            Position in `ATTRIBUTES` of the attributes for each test with
+            shape (len(attribute_source), 3). Derived from `attribute_source`
+            if not specified.
+            The default is None.
 
         Returns
         -------
-        out : str
-            Summarized information.
+        pandas.DataFrame
+            One row per test with columns `Fertigkeitswert`, `Erfolg`,
+            `Erwartungswert`, `Kritischer Erfolg` and `Patzer`; all but the
+            first given as probability or expected quality level.
 
         """
-        out = ''
-        if modification == 0:
-            test = '{} {} {} (Fertigkeitswert {}).'
-        else:
-            if modification < 0:
-                test = '{} {} {} (Fertigkeitswert {}), um ' +\
-                    str(abs(modification)) + ' erschwert.'
-            else:
-                test = '{} {} {} (Fertigkeitswert {}), um ' +\
-                    str(abs(modification)) + ' erleichtert.'
-        out += test.format(self.name, kind_of_test, skill,
-                           talent_level[skill])
-
-        goal_to_aim = ('\nEigenschaften:\n\t{} - {} -'
-                       ' {}\nZielwerte:\n\t{}').format(
-            *talent_composition[skill], goals)
-        out += '\n' + goal_to_aim
-
-        outcome_rng = 'Würfelergebnis:\n\t{}\n'.format(random_event)
-        out += '\n' + outcome_rng
-
-        if skill in self._gifted:
-            kind_of_result = 'Ergebnis der Begabung'
-        elif skill in self._incompetences:
-            kind_of_result = 'Ergebnis der Unfähigkeit'
-        else:
-            kind_of_result = 'Ergebnis'
+        import pandas as pd
 
-        if success:
-            if crit:
-                final_result = ('{}:\nKritischer Erfolg mit {} ({})'
-                                'Qualitätsstufen.\t:-D'.format(
-                                    kind_of_result,
-                                    quality_level[0],
-                                    quality_level[1]))
-            else:
-                final_result = ('{}:\nErfolg mit '
-                                '{} ({}) Qualitätsstufen.'.format(
-                                    kind_of_result,
-                                    quality_level[0],
-                                    quality_level[1]))
-        else:
-            if crit:
-                final_result = '{}:\nPatzer\t>:-|'.format(kind_of_result)
-            else:
-                final_result = ('{}:\nFehlschlag ({} QS)').format(
-                    kind_of_result, quality_level[1])
-        out += '\n' + final_result
+        talents, aims, skill_levels, gifted, incompetent = self._test_matrix(
+            attribute_source, skill_value_source, modifier, attribute_index)
+        qs_prob, crit_prob, botch_prob = self._distribution_matrix(
+            aims, skill_levels, gifted, incompetent)
 
-        return out
+        return pd.DataFrame(
+            {'Fertigkeitswert': skill_levels,
+             'Erfolg': 1 - qs_prob[:, 0],
+             'Erwartungswert': qs_prob @ np.arange(self._QS_BINS),
+             'Kritischer Erfolg': crit_prob,
+             'Patzer': botch_prob},
+            index=pd.Index(talents, name='Probe'))
 
-    @staticmethod
-    def _n_cartesian_three(n: int, skill: str,
-                           attribute_source: dict):
-        """Generate DataFrame with n**3 rows, corresponding to attributes.
+    def _test_matrix(self, attribute_source, skill_value_source, modifier=0,
+                     attribute_index=None):
+        """Collect everything to evaluate all tests from `attribute_source`.
 
         Parameters
         ----------
-        n : int
-            One to n describes the base set for cartesian product.
-        skill : str
-            Designate talent. Must be among keys from attribute_source.
         attribute_source : dict
-            Look up dictionary to determine attributes for given skill.
+            Look up dictionary to determine attributes for each test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for each test.
+        modifier : int, optional
+            Modification set to all tests.
+            The default is 0.
+        attribute_index : numpy.ndarray or None, optional
+            See `_analyze_all`.
+            The default is None.
 
         Returns
         -------
-        out : pandas.DataFrame
-            DESCRIPTION.
+        talents : list
+            Designation of the tests.
+        aims : numpy.ndarray
+            Modified and capped objectives with shape (N, 3).
+        skill_levels : numpy.ndarray
+            Skill levels with shape (N,).
+        gifted : numpy.ndarray
+            Boolean mask of gifted tests with shape (N,).
+        incompetent : numpy.ndarray
+            Boolean mask of incompetent tests with shape (N,).
 
         """
-        base = list(range(1, n+1))
-        third = base * (n**2)
-        second = []
-        first = []
-        for e in base:
-            second += [e]*n
-            first += [e]*(n**2)
-
-        second = second * n
-        '[1] ' + attribute_source[skill][0]
-        out = pd.DataFrame({
-            '[1] ' + attribute_source[skill][0]: first,
-            '[2] ' + attribute_source[skill][1]: second,
-            '[3] ' + attribute_source[skill][2]: third})
-        return out
+        talents = list(attribute_source.keys())
+        if attribute_index is None:
+            attribute_index = np.array(
+                [[self.ATTRIBUTES.index(att) for att in attribute_source[t]]
+                 for t in talents], dtype=np.intp).reshape(-1, 3)
+
+        attributes = np.array([self._attributes[att]
+                               for att in self.ATTRIBUTES])
+        aims = np.minimum(attributes[attribute_index] + modifier, 19)
+        skill_levels = np.array([skill_value_source[t] for t in talents],
+                                dtype=int)
+        gifted = np.array([t in self._gifted for t in talents], dtype=bool)
+        incompetent = np.array([t in self._incompetences for t in talents],
+                               dtype=bool)
+        return talents, aims, skill_levels, gifted, incompetent
 
-    def _perform_test(self, aim, random_event, skill_level=0,
-                      gifted=False, incompetent=False):
-        """Evalutae the performance of random event and measure the success.
+    @classmethod
+    def _distribution_matrix(cls, aims, skill_levels, gifted, incompetent):
+        """Determine the distributions of many different tests at once.
 
-        Core functionality of this class, evaluate the signature content from
-        DSA: the 3D20 test. All rolls that surpass the corresponding value in
-        `aim` must be compensated with `skill_level`. If this is possible, the
-        test is consierd as success.
-        See https://ulisses-regelwiki.de/index.php/GR_Proben.html for more
-        information.
-        Special cases: If `random_event` contain more than one ones or
-        twenties, the test is accomplished with a critical result and the test
-        is passed (ones) or failed (twenty) independet from the spare points
-        from `skill_level`.
-        May also be used for nDm-test against a target value `aim`, as long as
-        `skill_level` equals zero.
+        Tests are grouped by kind (ordinary, gifted, incompetent) and each
+        distinct test of a group is evaluated once, in chunks of
+        `_CHUNK_SIZE` tests per call of `_qs_distribution`.
+        Impossible tests, i.e. any objective lower than one, count as
+        failure.
 
         Parameters
         ----------
-        aim : numpy.ndarray
-            Target values (integer) to fall below. Must match the length of
-            `random_event`.
-        random_event : numpy.ndarray
-            Roll to be evaluated if (and how good) accomplished. Must match the
-            length of `aim`.
-        skill_level : int, optional
-            Number of points to compensate high rolls.
-            The default is 0.
-        gifted : bool, optional
-            Random event is preprocessed: The highest roll will be rerolled and
-            the better (lower) event will be taken for further process.
-            See https://ulisses-regelwiki.de/index.php/V_Begabung.html
-            The default is False.
-        incompetent : bool, optional
-            Random event is preprocessed: The lowest (best) roll will be
-            rerolled and then taken for further process. Therefore
-            `random_event` actual may be improved.
-            See http://ulisses-gamereference.com/index.php/N_Unf%C3%A4hig.html
-            The default is False.
+        aims : numpy.ndarray
+            Objectives with shape (N, 3), already modified and capped.
+        skill_levels : numpy.ndarray
+            Skill levels with shape (N,).
+        gifted : numpy.ndarray
+            Boolean mask of gifted tests with shape (N,).
+        incompetent : numpy.ndarray
+            Boolean mask of incompetent tests with shape (N,).
 
         Raises
         ------
         ValueError
-            Raised if `random_event` shall be preprocessed in both ways.
+            Raised if a test is marked gifted and incompetent at once.
 
         Returns
         -------
-        success : bool
-            True iff test was accomplished.
-        critical : bool
-            True iff result is outstanding (either success or failure).
-        quality_level : int
-            Measurement of success.
+        qs_prob : numpy.ndarray
+            P(#QS=q) for q = 0, ..., 12 with shape (N, 13).
+        crit_prob : numpy.ndarray
+            Probability of a critical success with shape (N,).
+        botch_prob : numpy.ndarray
+            Probability of a botch with shape (N,).
 
         """
-        if gifted and incompetent:
-            raise ValueError('A test can not be taken on a talent, which'
-                             ' is considered gifted an incompetent at the'
-                             ' same time.')
+        aims = np.asarray(aims)
+        skill_levels = np.asarray(skill_levels)
+        gifted = np.asarray(gifted, dtype=bool)
+        incompetent = np.asarray(incompetent, dtype=bool)
+        if np.any(gifted & incompetent):
+            raise ValueError(cls._REROLL_CONFLICT)
+        possible = np.all(aims >= 1, axis=-1)
+
+        qs_prob = np.zeros((len(aims), cls._QS_BINS))
+        qs_prob[:, 0] = 1
+        crit_prob = np.zeros(len(aims))
+        botch_prob = np.zeros(len(aims))
+
+        for is_gifted, is_incompetent in ((False, False), (True, False),
+                                          (False, True)):
+            rows = (possible & (gifted == is_gifted)
+                    & (incompetent == is_incompetent))
+            if not rows.any():
+                continue
+            # identical tests, e.g. among a party, are evaluated only once
+            tests, inverse = np.unique(
+                np.column_stack((aims[rows], skill_levels[rows])),
+                axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            unique_qs = np.empty((len(tests), cls._QS_BINS))
+            unique_crit = np.empty(len(tests))
+            unique_botch = np.empty(len(tests))
+            # bounded memory for large batches
+            for start in range(0, len(tests), cls._CHUNK_SIZE):
+                chunk = slice(start, start + cls._CHUNK_SIZE)
+                qs, _, crit, botch = cls._qs_distribution(
+                    tests[chunk, :3], tests[chunk, 3],
+                    gifted=is_gifted, incompetent=is_incompetent)
+                unique_qs[chunk] = qs
+                unique_crit[chunk] = crit
+                unique_botch[chunk] = botch
+            qs_prob[rows] = unique_qs[inverse]
+            crit_prob[rows] = unique_crit[inverse]
+            botch_prob[rows] = unique_botch[inverse]
+        return qs_prob, crit_prob, botch_prob
 
-        if incompetent:           # estimate and execute reroll of imcompetence
-            idx = np.argmin(random_event)
-            random_event[idx] = np.random.randint(1, 21)
+    def save(self, directory=pathlib.Path.cwd()):
+        """Store character describing dictionaries as json on harddrive.
 
-        compensation = random_event - aim
-        compensation[compensation < 0] = 0
+        File is written as <name>.json, whereby spaces are removed.
 
-        if gifted:                          # estimate reroll for gifted skills
-            idx = np.argmax(compensation)
-            reroll = np.random.randint(1, 21)
-            better_roll = min(random_event[idx], reroll)
-            random_event[idx] = better_roll
-            # recursive call with updated rand toggled gifted flag
-            return self._perform_test(aim=aim, random_event=random_event,
-                                      skill_level=skill_level,
-                                      gifted=False)
+        Parameters
+        ----------
+        directory : str, optional
+            Directory to store the char.
+            The default is directory=pathlib.Path.cwd(), i.e. current work
+            directory.
 
-        spare = skill_level - sum(compensation)
-        # concerning `field of application` rule:
-        spare_application = spare + 2
+        Raises
+        ------
+        OSError
+            Raised in cases of problems concerning writing permissions or
+            errors in specified path.
 
-        fail_copy = random_event.copy()
-        fail_copy[fail_copy != 20] = 0
-        crit_fail = sum(fail_copy) > 20
+        Returns
+        -------
+        None.
 
-        win_copy = random_event.copy()
-        win_copy[win_copy != 1] = 0
-        crit_win = sum(win_copy) > 1
+        """
+        directory = pathlib.Path(directory)
+        if directory.exists() and directory.is_dir():
+            file = '{}.json'.format(self.name.replace(' ', '_'))
+            data_to_dump = {'Eigenschaften': dict(self._attributes),
+                            'Fertigkeiten': dict(self._skills),
+                            'Begabungen': list(self._gifted),
+                            'Unfähigkeiten': list(self._incompetences)}
+            with open(pathlib.Path(directory, file),
+                      'w') as file:
+                json.dump(data_to_dump, file)
+        else:
+            raise OSError('Mit gültigem Pfad erneut versuchen.'
+                          ' Eventuell Schreibrechte überprüfen.')
 
-        success = ((spare >= 0) or crit_win) and not crit_fail
+    def test(self, attribute, modifikator=0):
+        """Perform an attribute check, meaning a 1D20 roll.
+
+        Parameters
+        ----------
+        attribute : str
+            Attribute to be checked.
+        modifikator : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        msg : str
+            Formatted result of the attribute check.
+
+        """
+        return str(self.test_result(attribute, modifikator))
+
+    def test_result(self, attribute, modifikator=0):
+        """Perform an attribute check like `test`, but keep its values.
+
+        Parameters
+        ----------
+        attribute : str
+            Attribute to be checked.
+        modifikator : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        RollResult
+            Die, objective and success of the check.
+
+        """
+        assert attribute in self._attributes.keys(),\
+            '{} ist keine gültige Eigenschaft.'.format(attribute)
+        eigenschaftswert_mod = min(
+            self._attributes[attribute] + modifikator, 19)
+        _1w20 = self.dice.roll(1)
+
+        suc, _, _, _ = self._perform_test(
+            aim=np.array(eigenschaftswert_mod),
+            random_event=_1w20)
+
+        return RollResult(self.name, attribute,
+                          np.array(eigenschaftswert_mod), _1w20, suc,
+                          modifier=modifikator,
+                          attribute_value=self._attributes[attribute])
+
+    def show_special_abilities(self):
+        """Show talents which are marked as gifted or incompetent.
+
+        Returns
+        -------
+        out : str
+            Formatted representation.
+
+        """
+        msg_1 = f'{self.name}\'s Begabungen:'
+        line = '='*len(msg_1)
+        msg_1 += f'\n{line}\n\t'
+        for t in self._gifted:
+            msg_1 += f'{t} '
+
+        msg_2 = f'{self.name}\'s Unfähigkeiten:'
+        line = '='*len(msg_2)
+        msg_2 += f'\n{line}\n\t'
+        for u in self._incompetences:
+            msg_2 += f'{u} '
+
+        out = msg_1 + '\n' + msg_2
+        return out
+
+    def show_attributes(self):
+        """Show attributes and values.
+
+        Returns
+        -------
+        str
+            Formatted representation.
+
+        """
+        return self._show_pretty_dicts(
+            f'{self.name}\'s Eigenschaften:', self._attributes)
+
+    def show_skills(self):
+        """Show skills and values.
+
+        Returns
+        -------
+        str
+            Formatted representation.
+
+        """
+        return self._show_pretty_dicts(
+            f'{self.name}\'s Fertigkeiten:', self._skills)
+
+    @classmethod
+    def get_all_skills_gui(cls):
+        """Getter for skills; concerning GUI.
+
+        Returns
+        -------
+        skill_set : list
+            List of strings representing all skills.
+
+        """
+        skill_set = []
+
+        for skill in cls.SKILL_CHECKS.keys():
+            skill_set.append(cls._tamper_designation(skill))
+        return skill_set
+
+    def get_gifted_skills_gui(self):
+        """Getter for gifted skills(`Begabungen`); concerning GUI.
+
+        Returns
+        -------
+        gifted_skills : list
+            List of strings representing the heros' gifted skills.
+
+        """
+        gifted_skills = []
+        for skill in self._gifted:
+            gifted_skills.append(self._tamper_designation(skill))
+        return gifted_skills
+
+    def get_incompetent_skills_gui(self):
+        """Getter for incompetences(`Unfähigkeiten`); concerning GUI.
+
+        Returns
+        -------
+        incompetent_skills : list
+            List of strings representing the heros' incompetences.
+
+        """
+        incompetent_skills = []
+        for skill in self._incompetences:
+            incompetent_skills.append(self._tamper_designation(skill))
+        return incompetent_skills
+
+    @classmethod
+    def load_qs_table(cls, directory=None):
+        """Use precomputed distributions of quality levels for analysis.
+
+        Tables are generated once via `python qs_table.py [directory]`.
+        Afterwards every analysis is a lookup in memory mapped arrays.
+
+        Parameters
+        ----------
+        directory : str or None, optional
+            Directory of the tables. If not specified, the default directory
+            of `qs_table` is used.
+            The default is None.
+
+        Raises
+        ------
+        FileNotFoundError
+            Raised when no tables for the current rules are found.
+
+        Returns
+        -------
+        None.
+
+        """
+        import qs_table
+
+        if directory is None:
+            directory = qs_table.DEFAULT_DIRECTORY
+        HeroBase._QS_TABLE = qs_table.QSTable(HeroBase._rule_hash(),
+                                              directory)
+
+    @classmethod
+    def unload_qs_table(cls):
+        """Compute distributions of quality levels again on each analysis."""
+        HeroBase._QS_TABLE = None
+
+    @staticmethod
+    def _rule_hash():
+        """Fingerprint of the rules to invalidate precomputed tables.
+
+        Returns
+        -------
+        str
+            Hex digest over `_RULES_VERSION` and the quality level mapping.
+
+        """
+        digest = hashlib.sha1()
+        digest.update(str(HeroBase._RULES_VERSION).encode())
+        digest.update(HeroBase._QUALITY_LEVEL_LUT.tobytes())
+        return digest.hexdigest()[:12]
+
+    def _ability_sources(self, talent):
+        """Look up dictionaries for attributes and skill level of `talent`.
+
+        Parameters
+        ----------
+        talent : str
+            Skill to be tested.
+
+        Raises
+        ------
+        ValueError
+            Raised when `talent` is not known to the hero.
+
+        Returns
+        -------
+        attribute_source : dict
+            Look up dictionary to determine attributes for the test.
+        skill_value_source : dict
+            Look up dictionary to determine skill level for the test.
+
+        """
+        if talent not in self.SKILL_CHECKS:
+            raise ValueError('{} ist keine'
+                             ' gültige Fertigkeit.'.format(talent))
+        return self.SKILL_CHECKS, self._skills
+
+    def _test_row(self, talent, modifier=0):
+        """Collect everything to evaluate a single test of any ability.
+
+        Same layout as one row of `_test_matrix`, for use with
+        `_distribution_matrix`.
+
+        Parameters
+        ----------
+        talent : str
+            Skill (or spell-like) to be tested, see `_ability_sources`.
+        modifier : int, optional
+            Modification set to the test.
+            The default is 0.
+
+        Returns
+        -------
+        aims : numpy.ndarray
+            Modified and capped objective with shape (3,).
+        skill_level : int
+            Skill level.
+        gifted : bool
+            Iff the skill is gifted.
+        incompetent : bool
+            Iff the skill is an incompetence.
+
+        """
+        attribute_source, skill_value_source = self._ability_sources(talent)
+        attributes = np.array([self._attributes[att]
+                               for att in attribute_source[talent]])
+        return (np.minimum(attributes + modifier, 19),
+                skill_value_source[talent],
+                talent in self._gifted,
+                talent in self._incompetences)
+
+    def _estimae_objective(self, talent, modifier, attribute_source):
+        """Derives objective for random event for a test on talent.
+
+        Each talent correspond to three attributes, which values make up the
+        objective to roll against (random event). These values may be modified
+        on DM decision, marked by modfier. Each value is lower or equal to 19.
+        If any value is lower than one, the test is considered as impossible.
+
+        Parameters
+        ----------
+        talent : str
+            skill or spell like to be tested.
+        modifier : int
+            Alleviation (positive Values) or difficulty on objective.
+        attribute_source : dict
+            Source to look up attributes for the test of talent. Therefore
+            `talent` must be among `attribute_source.keys()`.
+
+        Raises
+        ------
+        ValueError
+            Raised when specified talent is not legal, i.e. is not a key in
+            specified `attribute_source`.
+
+        Returns
+        -------
+        objective : numpy.ndarry
+            Estimated objective for test, read-only since it is cached.
+        impossible : bool
+            Iff any objective value is lower than one after considering the
+            modifier.
+
+        """
+        try:
+            attributes = tuple(attribute_source[talent])
+        except KeyError:
+            raise ValueError('{} ist keine'
+                             ' gültige Fertigkeit.'.format(talent))
+        # by content, the same test may come from different sources
+        key = (talent, attributes, modifier)
+        try:
+            return self._objective_cache[key]
+        except KeyError:
+            pass
+
+        if attribute_source is self.SKILL_CHECKS and \
+                talent in self._SKILL_ROWS:
+            index = self._SKILL_ATTRIBUTE_INDEX[self._SKILL_ROWS[talent]]
+        else:
+            try:
+                index = [self.ATTRIBUTES.index(eig) for eig in attributes]
+            except ValueError:
+                raise ValueError('{} ist keine'
+                                 ' gültige Fertigkeit.'.format(talent))
+
+        objective = np.minimum(self._attribute_vector[index] + modifier, 19)
+        objective.flags.writeable = False
+        # detect impossible tests
+        result = (objective, bool(objective.min() < 1))
+        if len(self._objective_cache) >= self._OBJECTIVE_CACHE_SIZE:
+            # drop the oldest entry, e.g. of a long sweep over modifiers
+            del self._objective_cache[next(iter(self._objective_cache))]
+        self._objective_cache[key] = result
+        return result
+
+    def _invalidate_objectives(self):
+        """Drop cached objectives, needed after any change of attributes.
+
+        Also call after changing the attributes of a test, e.g. of a
+        spell-like.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._attribute_vector = np.array(
+            [self._attributes[att] for att in self.ATTRIBUTES])
+        self._objective_cache = {}
+
+    def _roll_result(self, skill: str, goals, random_event,
+                     talent_level: dict,
+                     talent_composition: dict,
+                     success: bool, crit: bool, quality_level: (int, int),
+                     kind_of_test='absolviert eine Probe auf',
+                     modification=0):
+        """Collect the results of a (3D20) roll with all necessary values.
+
+        Parameters
+        ----------
+        skill : str
+            Talent which was tested.
+        goals : numpy.ndarry
+            Values to achieve lower rolls.
+        random_event : numpy.ndarray
+            Representing the roll.
+        talent_level : dict
+            Must contain `skill` as key.
+        talent_composition : dict
+            Must contain `skill` as key.
+        success : bool
+            Iff test was passed.
+        crit : bool
+            Iff test was passed outstanding (success or fail).
+        quality_level : (int, int)
+            Measurement of success (if accomplished), plain and w.r.t.
+            field of application.
+        kind_of_test : str, optional
+            Allows to formate also spell-likes from derived classes.
+            The default is 'absolviert eine Probe auf'.
+        modification : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        RollResult
+            Summarized information, formatted by `str()`.
+
+        """
+        if skill in self._gifted:
+            kind_of_result = 'Ergebnis der Begabung'
+        elif skill in self._incompetences:
+            kind_of_result = 'Ergebnis der Unfähigkeit'
+        else:
+            kind_of_result = 'Ergebnis'
+
+        return RollResult(
+            self.name, skill, goals, random_event, success, critical=crit,
+            quality_level=quality_level[0],
+            quality_level_application=quality_level[1],
+            modifier=modification, skill_level=talent_level[skill],
+            attributes=tuple(talent_composition[skill]),
+            kind_of_test=kind_of_test, kind_of_result=kind_of_result)
+
+    def _perform_test(self, aim, random_event, skill_level=0,
+                      gifted=False, incompetent=False):
+        """Evalutae the performance of random event and measure the success.
+
+        Core functionality of this class, evaluate the signature content from
+        DSA: the 3D20 test. All rolls that surpass the corresponding value in
+        `aim` must be compensated with `skill_level`. If this is possible, the
+        test is consierd as success.
+        See https://ulisses-regelwiki.de/index.php/GR_Proben.html for more
+        information.
+        Special cases: If `random_event` contain more than one ones or
+        twenties, the test is accomplished with a critical result and the test
+        is passed (ones) or failed (twenty) independet from the spare points
+        from `skill_level`.
+        May also be used for nDm-test against a target value `aim`, as long as
+        `skill_level` equals zero.
+
+        Parameters
+        ----------
+        aim : numpy.ndarray
+            Target values (integer) to fall below. Must match the length of
+            `random_event`.
+        random_event : numpy.ndarray
+            Roll to be evaluated if (and how good) accomplished. Must match the
+            length of `aim`.
+        skill_level : int, optional
+            Number of points to compensate high rolls.
+            The default is 0.
+        gifted : bool, optional
+            Random event is preprocessed: The highest roll will be rerolled and
+            the better (lower) event will be taken for further process.
+            See https://ulisses-regelwiki.de/index.php/V_Begabung.html
+            The default is False.
+        incompetent : bool, optional
+            Random event is preprocessed: The lowest (best) roll will be
+            rerolled and then taken for further process. Therefore
+            `random_event` actual may be improved.
+            See http://ulisses-gamereference.com/index.php/N_Unf%C3%A4hig.html
+            The default is False.
+
+        Raises
+        ------
+        ValueError
+            Raised if `random_event` shall be preprocessed in both ways.
+
+        Returns
+        -------
+        success : bool
+            True iff test was accomplished.
+        critical : bool
+            True iff result is outstanding (either success or failure).
+        quality_level : int
+            Measurement of success.
+
+        """
+        if gifted and incompetent:
+            raise ValueError(self._REROLL_CONFLICT)
+
+        if incompetent:           # estimate and execute reroll of imcompetence
+            idx = np.argmin(random_event)
+            random_event[idx] = self.dice.roll()[0]
+
+        compensation = random_event - aim
+        compensation[compensation < 0] = 0
+
+        if gifted:                          # estimate reroll for gifted skills
+            idx = np.argmax(compensation)
+            reroll = self.dice.roll()[0]
+            better_roll = min(random_event[idx], reroll)
+            random_event[idx] = better_roll
+            # recursive call with updated rand toggled gifted flag
+            return self._perform_test(aim=aim, random_event=random_event,
+                                      skill_level=skill_level,
+                                      gifted=False)
+
+        spare = skill_level - sum(compensation)
+        # concerning `field of application` rule:
+        spare_application = spare + 2
+
+        fail_copy = random_event.copy()
+        fail_copy[fail_copy != 20] = 0
+        crit_fail = sum(fail_copy) > 20
+
+        win_copy = random_event.copy()
+        win_copy[win_copy != 1] = 0
+        crit_win = sum(win_copy) > 1
+
+        success = ((spare >= 0) or crit_win) and not crit_fail
+
+        critical = crit_win or crit_fail
+
+        if crit_win:
+            spare = max(spare, 0)
+            quality_level = self.__determine_quality_level(spare)
+            quality_level *= 2
+            quality_level_application = self.__determine_quality_level(
+                spare_application)
+            quality_level_application *= 2
+        elif crit_fail:
+            quality_level = 0
+            quality_level_application = 0
+        else:
+            quality_level = self.__determine_quality_level(spare)
+            quality_level_application = self.__determine_quality_level(
+                spare_application)
+
+        return success, critical, quality_level, quality_level_application
+
+    @classmethod
+    def _perform_test_batch(cls, aims, random_events, skill_level=0,
+                            gifted=False, incompetent=False, rerolls=None,
+                            rng=None):
+        """Evaluate many random events at once, vectorized `_perform_test`.
+
+        Same rules as `_perform_test`, but all arguments are broadcasted
+        against each other, whereby the last axis of `random_events` and
+        `aims` holds the dices of a single test. The input is not modified.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Target values with shape (..., n), e.g. (3,) or (N, 3).
+        random_events : numpy.ndarray
+            Rolls to be evaluated with shape (..., n), e.g. (N, 3).
+        skill_level : int or numpy.ndarray, optional
+            Number of points to compensate high rolls, scalar or shape (...).
+            The default is 0.
+        gifted : bool or numpy.ndarray, optional
+            Flag(s) for the reroll of gifted skills, scalar or shape (...).
+            The default is False.
+        incompetent : bool or numpy.ndarray, optional
+            Flag(s) for the reroll of incompetences, scalar or shape (...).
+            The default is False.
+        rerolls : numpy.ndarray or None, optional
+            Results of the reroll dice with shape (...), only used where
+            `gifted` or `incompetent` is set. Rolled if not specified.
+            The default is None.
+        rng : numpy.random.Generator or None, optional
+            Generator for rerolls not given by `rerolls`; a fresh one if not
+            specified.
+            The default is None.
+
+        Raises
+        ------
+        ValueError
+            Raised if any test shall be preprocessed in both ways.
+
+        Returns
+        -------
+        success : numpy.ndarray
+            True iff test was accomplished.
+        critical : numpy.ndarray
+            True iff result is outstanding (either success or failure).
+        quality_level : numpy.ndarray
+            Measurement of success.
+        quality_level_application : numpy.ndarray
+            Measurement of success w.r.t. `field of application` rule.
+
+        """
+        random_events = np.asarray(random_events)
+        aims = np.asarray(aims)
+        skill_level = np.asarray(skill_level)
+        gifted = np.asarray(gifted, dtype=bool)
+        incompetent = np.asarray(incompetent, dtype=bool)
+
+        shape = np.broadcast_shapes(random_events.shape, aims.shape,
+                                    skill_level.shape + (1,),
+                                    gifted.shape + (1,),
+                                    incompetent.shape + (1,))
+        if rerolls is not None:
+            shape = np.broadcast_shapes(shape,
+                                        np.shape(rerolls) + (1,))
+        events = np.broadcast_to(random_events, shape).astype(np.int16)
+
+        if np.any(gifted & incompetent):
+            raise ValueError(cls._REROLL_CONFLICT)
+
+        if gifted.any() or incompetent.any():
+            if rerolls is None:
+                if rng is None:
+                    rng = np.random.default_rng()
+                rerolls = rng.integers(1, 21, shape[:-1])
+            rerolls = np.broadcast_to(rerolls, shape[:-1])[..., None]
+            cls._apply_rerolls(events, aims, gifted, incompetent, rerolls)
+
+        spare = skill_level - np.clip(events - aims, 0, None).sum(axis=-1)
+        crit_fail = np.count_nonzero(events == 20, axis=-1) > 1
+        crit_win = np.count_nonzero(events == 1, axis=-1) > 1
+
+        return cls._rate_spare(spare, crit_win, crit_fail)
+
+    @staticmethod
+    def _apply_rerolls(events, aims, gifted, incompetent, rerolls):
+        """Replace the rerolled dice of many tests, see `_perform_test`.
+
+        Parameters
+        ----------
+        events : numpy.ndarray
+            Writable rolls with shape (..., n), modified in place.
+        aims : numpy.ndarray
+            Target values, broadcastable against `events`.
+        gifted : numpy.ndarray
+            Flag(s) for the reroll of gifted skills with shape (...).
+        incompetent : numpy.ndarray
+            Flag(s) for the reroll of incompetences with shape (...).
+        rerolls : numpy.ndarray
+            Results of the reroll dice with shape (..., 1).
+
+        Returns
+        -------
+        numpy.ndarray
+            `events`, holding the dice actually used.
+
+        """
+        if incompetent.any():     # reroll of lowest (best) dice
+            idx = np.argmin(events, axis=-1)[..., None]
+            current = np.take_along_axis(events, idx, axis=-1)
+            np.put_along_axis(
+                events, idx,
+                np.where(incompetent[..., None], rerolls, current),
+                axis=-1)
+
+        if gifted.any():          # reroll of most expensive dice
+            compensation = np.clip(events - aims, 0, None)
+            idx = np.argmax(compensation, axis=-1)[..., None]
+            current = np.take_along_axis(events, idx, axis=-1)
+            np.put_along_axis(
+                events, idx,
+                np.where(gifted[..., None],
+                         np.minimum(current, rerolls), current),
+                axis=-1)
+        return events
+
+    @classmethod
+    def _rate_spare(cls, spare, crit_win, crit_fail):
+        """Vectorized rating of spare points, see `_perform_test`.
+
+        Parameters
+        ----------
+        spare : numpy.ndarray
+            Skill points left after compensation, may be negative.
+        crit_win : numpy.ndarray
+            True iff the roll contains at least two ones.
+        crit_fail : numpy.ndarray
+            True iff the roll contains at least two twenties.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            success, critical, quality level and quality level w.r.t.
+            `field of application` rule.
+
+        """
+        spare_application = spare + 2
+        success = ((spare >= 0) | crit_win) & ~crit_fail
+        critical = crit_win | crit_fail
+
+        lut = cls._QUALITY_LEVEL_LUT
+        # critical success: doubled quality level, at least 1 (then 2)
+        factor = (1 + crit_win - crit_fail).astype(np.int8)
+        quality_level = factor * lut[
+            np.minimum(np.maximum(spare, -1 + crit_win), 16) + 1]
+        quality_level_application = factor * lut[
+            np.minimum(np.maximum(spare_application, -1), 16) + 1]
+
+        return success, critical, quality_level, quality_level_application
+
+    @classmethod
+    def _evaluate_all_events(cls, aims, skill_level,
+                             gifted=False, incompetent=False):
+        """Evaluate every possible 3W20 roll against the given objectives.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3).
+        skill_level : int or numpy.ndarray
+            Skill level(s), scalar or shape (M,).
+        gifted : bool, optional
+            Iff the tested skill is gifted. The default is False.
+        incompetent : bool, optional
+            Iff the tested skill is an incompetence. The default is False.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Same as `_perform_test_batch`, with shape (8000, R) or
+            (M, 8000, R) in order of `_EVENTS_3W20`. The last axis holds the
+            R = 20 equally likely results of the reroll dice for gifted or
+            incompetent skills, else R = 1.
+
+        """
+        aims = np.asarray(aims, dtype=np.int16)[..., None, :]
+        skill_level = np.asarray(skill_level, dtype=np.int16)[..., None, None]
+        if gifted and incompetent:
+            raise ValueError(cls._REROLL_CONFLICT)
+
+        if not (gifted or incompetent):
+            # without rerolls the compensation is separable by dice
+            compensation = np.maximum(
+                np.arange(1, 21, dtype=np.int16) - aims[..., 0, :, None], 0)
+            total = (compensation[..., 0, :, None, None]
+                     + compensation[..., 1, None, :, None]
+                     + compensation[..., 2, None, None, :])
+            spare = skill_level - total.reshape(aims.shape[:-2] + (-1, 1))
+            return cls._rate_spare(spare, cls._CRIT_WIN_3W20[:, None],
+                                   cls._CRIT_FAIL_3W20[:, None])
+
+        # the reroll replaces a single dice, the other two stay untouched
+        compensation = np.maximum(cls._EVENTS_3W20 - aims, 0)
+        events = np.broadcast_to(cls._EVENTS_3W20, compensation.shape)
+        if gifted:
+            idx = np.argmax(compensation, axis=-1)[..., None]
+        else:
+            idx = np.argmin(events, axis=-1)[..., None]
+        dice = np.take_along_axis(events, idx, axis=-1)
+        aim = np.take_along_axis(np.broadcast_to(aims, compensation.shape),
+                                 idx, axis=-1)
+        rest = (compensation.sum(axis=-1, keepdims=True)
+                - np.take_along_axis(compensation, idx, axis=-1))
+        ones_rest = ((cls._EVENTS_3W20 == 1).sum(axis=-1)[:, None]
+                     - (dice == 1))
+        twenties_rest = ((cls._EVENTS_3W20 == 20).sum(axis=-1)[:, None]
+                         - (dice == 20))
+
+        rerolls = np.arange(1, 21, dtype=np.int16)
+        if gifted:
+            rerolls = np.minimum(dice, rerolls)
+        spare = skill_level - rest - np.maximum(rerolls - aim, 0)
+        crit_win = ones_rest + (rerolls == 1) > 1
+        crit_fail = twenties_rest + (rerolls == 20) > 1
+        return cls._rate_spare(spare, crit_win, crit_fail)
+
+    @classmethod
+    def _qs_distribution(cls, aims, skill_level,
+                         gifted=False, incompetent=False):
+        """Determine the exact distribution of quality levels for a test.
+
+        All possible rolls are taken into account, so no sampling is
+        involved. For gifted or incompetent skills the reroll dice is
+        enumerated as well, giving 20**4 equally likely outcomes. Those are
+        counted by total compensation and criticality first (see
+        `_joint_distribution`), so only 58 x 3 classes have to be rated.
+        These counts are kept in memory per objective (see `_cached_joint`).
+        If precomputed tables are loaded (see `load_qs_table`), the result
+        is looked up instead.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3), see `_estimae_objective`.
+        skill_level : int or numpy.ndarray
+            Skill level(s), scalar or shape (M,).
+        gifted : bool, optional
+            Iff the tested skill is gifted. The default is False.
+        incompetent : bool, optional
+            Iff the tested skill is an incompetence. The default is False.
+
+        Returns
+        -------
+        qs_prob : numpy.ndarray
+            P(#QS=q) for q = 0, ..., 12; shape (13,) or (M, 13).
+        qs_app_prob : numpy.ndarray
+            Same as `qs_prob` w.r.t. `field of application` rule.
+        crit_prob : float or numpy.ndarray
+            Probability of a critical success.
+        botch_prob : float or numpy.ndarray
+            Probability of a botch (`Patzer`).
+
+        """
+        table = HeroBase._QS_TABLE
+        if table is not None and table.covers(aims, skill_level):
+            return table.lookup(aims, skill_level, gifted, incompetent)
+
+        joint = cls._cached_joint(aims, gifted, incompetent)
+        return cls._rate_joint(joint, skill_level)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _mean_qualities(cls, aims, skill_level, gifted, incompetent):
+        """Quality levels of all rolls for `_cube_of_success`, memoized.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only quality levels with shape (20, 20, 20).
+
+        """
+        _, _, qualities, _ = cls._evaluate_all_events(
+            aims=np.array(aims), skill_level=skill_level, gifted=gifted,
+            incompetent=incompetent)
+        # the events are in order of the cube
+        qualities = qualities.mean(axis=-1).reshape(20, 20, 20)
+        qualities.flags.writeable = False
+        return qualities
+
+    @classmethod
+    def _cached_joint(cls, aims, gifted=False, incompetent=False):
+        """Joint distribution of `_joint_distribution`, kept in memory.
+
+        The joint distribution only depends on the objectives, so each of
+        the 19**3 legal triples is evaluated once per kind of test and
+        process. This makes gifted and incompetent skills, which need the
+        reroll dice, as fast as ordinary ones after their first analysis,
+        without precomputed tables on disk.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3).
+        gifted : bool, optional
+            Iff the tested skill is gifted. The default is False.
+        incompetent : bool, optional
+            Iff the tested skill is an incompetence. The default is False.
+
+        Returns
+        -------
+        numpy.ndarray
+            Same as `_joint_distribution`.
+
+        """
+        aims = np.asarray(aims)
+        if aims.size == 0 or aims.min() < 1 or aims.max() > 19:
+            # not a legal objective, nothing to cache
+            return cls._joint_distribution(aims, gifted, incompetent)
+
+        variant = (gifted, incompetent)
+        if variant not in cls._JOINT_CACHE:
+            # raises for gifted and incompetent at once
+            cls._joint_distribution(np.ones(3), gifted, incompetent)
+            cls._JOINT_CACHE[variant] = (
+                np.zeros((19, 19, 19), dtype=bool),
+                np.zeros((19, 19, 19, 58, 3), dtype=np.int32))
+        known, joints = cls._JOINT_CACHE[variant]
+
+        index = tuple(np.moveaxis(aims.reshape(-1, 3) - 1, -1, 0))
+        missing = ~known[index]
+        if missing.any():
+            new = np.unique(aims.reshape(-1, 3)[missing], axis=0)
+            new_index = tuple((new - 1).T)
+            joints[new_index] = cls._joint_distribution(new, gifted,
+                                                        incompetent)
+            # marked after writing, so readers never see partial entries
+            known[new_index] = True
+        return joints[index].reshape(aims.shape[:-1] + (58, 3))
+
+    @classmethod
+    def _joint_distribution(cls, aims, gifted=False, incompetent=False):
+        """Count all outcomes of a test by compensation and criticality.
+
+        The compensation is the sum of points by which the dices surpass
+        `aims`. Criticality is 0 for ordinary rolls, 1 for at least two ones
+        and 2 for at least two twenties. Since the skill level is not
+        involved, the result may be rated for any skill level afterwards.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3).
+        gifted : bool, optional
+            Iff the tested skill is gifted. The default is False.
+        incompetent : bool, optional
+            Iff the tested skill is an incompetence. The default is False.
+
+        Raises
+        ------
+        ValueError
+            Raised if `gifted` and `incompetent` are both set.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counts with shape (58, 3) or (M, 58, 3), summing up to 20**3 or
+            20**4 (with reroll dice).
+
+        """
+        if gifted and incompetent:
+            raise ValueError(cls._REROLL_CONFLICT)
+        aims = np.asarray(aims, dtype=np.int16)
+        leading = aims.shape[:-1]
+        aims = aims.reshape(-1, 1, 3)
+        faces = np.arange(1, 21, dtype=np.int16)
+
+        if not (gifted or incompetent):
+            # without rerolls the compensation is separable by dice
+            compensation = np.maximum(faces - aims[:, 0, :, None], 0)
+            total = (compensation[:, 0, :, None, None]
+                     + compensation[:, 1, None, :, None]
+                     + compensation[:, 2, None, None, :])
+            joint = cls._histogram(
+                3 * total.reshape(len(aims), -1) + cls._CRIT_STATE_3W20,
+                bins=58 * 3)
+            return joint.reshape(leading + (58, 3))
+
+        # split each roll into the rerolled dice and the rest of the roll
+        events = cls._EVENTS_3W20
+        compensation = np.maximum(events - aims, 0)
+        if gifted:
+            idx = np.argmax(compensation, axis=-1)
+        else:
+            idx = np.broadcast_to(np.argmin(events, axis=-1),
+                                  compensation.shape[:-1])
+        dice = events[np.arange(len(events)), idx]
+        rest = (compensation.sum(axis=-1)
+                - np.take_along_axis(compensation, idx[..., None],
+                                     axis=-1)[..., 0])
+        ones = cls._ONES_3W20 - (dice == 1)
+        twenties = cls._TWENTIES_3W20 - (dice == 20)
+
+        # rest of the roll by position and value of the rerolled dice
+        group = 20 * idx + dice - 1
+        rest_key = (3 * rest + ones) * 3 + twenties
+        before = cls._histogram(351 * group + rest_key,
+                                bins=60 * 351).reshape(-1, 60, 351)
+
+        # result of the rerolled dice for each position and value
+        if gifted:
+            value = np.minimum(np.tile(faces, 3)[:, None], faces)
+        else:
+            value = np.broadcast_to(faces, (60, 20))
+        reroll_aims = np.repeat(aims[:, 0, :], 20, axis=-1)[..., None]
+        reroll_key = ((2 * np.maximum(value - reroll_aims, 0)
+                       + (value == 1)) * 2 + (value == 20))
+        after = cls._histogram(reroll_key, bins=80)
+
+        # convolve both parts, summed up over all groups
+        combined = np.matmul(before.transpose(0, 2, 1).astype(float),
+                             after.astype(float))
+        outcome = np.broadcast_to(cls._reroll_outcomes(), combined.shape)
+        joint = cls._histogram(outcome.reshape(len(aims), -1),
+                               weights=combined.reshape(len(aims), -1),
+                               bins=58 * 3)
+        return np.rint(joint).astype(np.int64).reshape(leading + (58, 3))
+
+    @classmethod
+    def _reroll_outcomes(cls):
+        """Map rest of a roll and rerolled dice to the joint outcome.
+
+        See `_joint_distribution` for the encoding of both parts.
+
+        Returns
+        -------
+        numpy.ndarray
+            Flat index of (compensation, criticality) with shape (351, 80).
+
+        """
+        if cls._REROLL_OUTCOMES is None:
+            rest_key = np.arange(351)[:, None]
+            reroll_key = np.arange(80)
+            compensation = rest_key // 9 + reroll_key // 4
+            ones = (rest_key // 3) % 3 + (reroll_key // 2) % 2
+            twenties = rest_key % 3 + reroll_key % 2
+            state = np.where(ones > 1, 1, np.where(twenties > 1, 2, 0))
+            cls._REROLL_OUTCOMES = 3 * compensation + state
+        return cls._REROLL_OUTCOMES
+
+    @classmethod
+    def _rate_joint(cls, joint, skill_level, normalize=True):
+        """Rate a joint distribution from `_joint_distribution`.
+
+        Parameters
+        ----------
+        joint : numpy.ndarray
+            Counts with shape (58, 3) or (M, 58, 3).
+        skill_level : int or numpy.ndarray
+            Skill level(s), scalar or shape (M,).
+        normalize : bool, optional
+            Iff probabilities instead of counts shall be returned.
+            The default is True.
+
+        Returns
+        -------
+        tuple
+            Same as `_qs_distribution`.
+
+        """
+        joint = np.asarray(joint, dtype=float)
+        total = joint.sum(axis=(-2, -1)) if normalize else np.ones(())
+        spare = (np.asarray(skill_level)[..., None, None]
+                 - np.arange(58)[:, None])
+        _, _, quality_level, quality_level_app = cls._rate_spare(
+            spare, np.array([False, True, False]),
+            np.array([False, False, True]))
+
+        # weight by counts and normalize afterwards to stay exact
+        shape = np.broadcast_shapes(joint.shape, quality_level.shape)
+        flat_shape = shape[:-2] + (-1,)
+        weights = np.broadcast_to(joint, shape).reshape(flat_shape)
+        total = np.broadcast_to(total, shape[:-2])
+        qs_prob = cls._histogram(
+            np.broadcast_to(quality_level, shape).reshape(flat_shape),
+            weights=weights) / total[..., None]
+        qs_app_prob = cls._histogram(
+            np.broadcast_to(quality_level_app, shape).reshape(flat_shape),
+            weights=weights) / total[..., None]
+        crit_prob = joint[..., 1].sum(axis=-1) / total
+        botch_prob = joint[..., 2].sum(axis=-1) / total
+        return qs_prob, qs_app_prob, crit_prob, botch_prob
+
+    @classmethod
+    def _histogram(cls, values, weights=None, bins=None):
+        """Count integer values along the last axis.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Integer array with values in 0, ..., `bins` - 1.
+        weights : numpy.ndarray or None, optional
+            Weights with the same shape as `values`. The default is None.
+        bins : int or None, optional
+            Number of bins, the quality levels 0, ..., 12 if not specified.
+            The default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counts with shape `values.shape[:-1] + (bins,)`.
+
+        """
+        if bins is None:
+            bins = cls._QS_BINS
+        leading = values.shape[:-1]
+        flat = values.reshape(-1, values.shape[-1])
+        offset = bins * np.arange(len(flat))[:, None]
+        if weights is not None:
+            weights = np.reshape(weights, -1)
+        counts = np.bincount((flat + offset).ravel(), weights=weights,
+                             minlength=bins * len(flat))
+        return counts.reshape(leading + (bins,))
+
+    def _show_and_update_set(self, title, group):
+        """Initate command line dialogue (german) to update given set.
+
+        User get `group` displayed and asked for an element to update. If the
+        given input is already in `group`, it will be removed from that set,
+        else the given input is added to the set. In both cases a confirmation
+        is asked for.
+
+        Parameters
+        ----------
+        title : str
+            Is displayed to user before `group` is shown.
+        group : set
+            Set to be updated.
+
+        Returns
+        -------
+        group : set
+            Updated copy of `group`.
+
+        """
+        group = group.copy()
+        print('{}\n{}'.format(title, '='*len(title)))
+        print(group)
+        val = input('Aktualisiere um Element: ')
+        if val in group:
+            confirm = self._clean_read('{} entfernen?\n(j/n) '.format(val),
+                                       ['j', 'n'])
+            if confirm == 'j':
+                group.discard(val)
+        else:
+            confirm = self._clean_read('{} hinzufügen?\n(j/n) '.format(val),
+                                       ['j', 'n'])
+            if confirm == 'j':
+                group.add(val)
+        return group
+
+    def _show_pretty_dicts(self, title, dictionary, alphabetical_order=True,
+                           depth=1):
+        """Formate dictionary to pleasant readable string.
+
+        Parameters
+        ----------
+        title : str
+            Prefix and first line of formulated string.
+        dictionary : dict
+            Dictionary to display.
+        alphabetical_order : bool, optional
+            True <=> key-value-pairs are shown in the keys alphabetical order.
+            The default is True.
+        depth : int, optional
+            Used for nested dictionaries. Regulate underlines and indentation.
+            The default is 1.
+
+        Returns
+        -------
+        msg : str
+            Pretty print version of dictionary.
+
+        """
+        gifted = ' (+)'
+        incomp = ' (-)'
+        msg = ''
+        list_of_keys = list(dictionary.keys())
+        if alphabetical_order:
+            list_of_keys.sort()
+        if depth == 1:
+            underline = '\n' + '=' * len(title)
+        elif depth == 2:
+            underline = '\n' + '-' * len(title)
+        else:
+            underline = ''
+        msg += ('\n' + title + underline)
+        for key in list_of_keys:
+            if isinstance(dictionary[key], dict):
+                value = str(self._show_pretty_dicts(
+                    title=key,
+                    dictionary=dictionary[key],
+                    depth=depth+1))
+                msg += ('\t'*depth + value)
+            else:
+                value = str(dictionary[key])
+                if key in self._incompetences:
+                    msg += ('\n' + key + incomp + ':\n' + '\t'*depth + value)
+                elif key in self._gifted:
+                    msg += ('\n' + key + gifted + ':\n' + '\t'*depth + value)
+                else:
+                    msg += ('\n' + key + ':\n' + '\t'*depth + value)
+        return msg
 
-        critical = crit_win or crit_fail
+    @staticmethod
+    def _clean_read(text, legal_response):
+        """Helperfunction for command line interaction.
 
-        if crit_win:
-            spare = max(spare, 0)
-            quality_level = self.__determine_quality_level(spare)
-            quality_level *= 2
-            quality_level_application = self.__determine_quality_level(
-                spare_application)
-            quality_level_application *= 2
-        elif crit_fail:
-            quality_level = 0
-            quality_level_application = 0
+        Parameters
+        ----------
+        text : str
+            Message to display user in console.
+        legal_response : list
+            List of legal responses. Input is rejected iff it does not occure
+            in this list.
+
+        Returns
+        -------
+        val : str
+            Legal user response on displayed message.
+
+        """
+        clean_read = False
+        while not clean_read:
+            val = input(text)
+            if val in legal_response:
+                clean_read = True
+        return val
+
+    @staticmethod
+    def _tamper_designation(skill):
+        """Transform a given string for GUI concerns.
+
+        In general the given string is changed to lower cases and umlauts are
+        replaced. If the given `skill` corresponds to one of the formulated
+        special cases, then the special transformation is applied.
+
+        Parameters
+        ----------
+        skill : str
+            String to transform, expected to be a skill (`Fertikeit`) or
+            identifier of a spell-like (from derived Funzel).
+
+        Returns
+        -------
+        out : str
+            Transformed string.
+
+        """
+        special_cases = {'Bekehren & Überzeugen': 'bekehren',
+                         'Fischen & Angeln': 'angeln',
+                         'Brett- & Glücksspiel': 'brettspiel',
+                         'Götter & Kulte': 'kulte',
+                         'Sagen & Legenden': 'sagen',
+                         'Boote & Schiffe': 'boote',
+                         'Heilkunde Gift': 'heilenGift',
+                         'Heilkunde Krankheiten': 'heilenKrankheit',
+                         'Heilkunde Seele': 'heilenSeele',
+                         'Heilkunde Wunden': 'heilenWunden',
+                         'Fährtensuchen': 'faehrtensuche',
+                         'Alchimie': 'alchemie',
+                         'Malen & Zeichen': 'malen'}
+        if skill in special_cases.keys():
+            out = special_cases[skill]
         else:
-            quality_level = self.__determine_quality_level(spare)
-            quality_level_application = self.__determine_quality_level(
-                spare_application)
+            umlaute = {'ä': 'ae', 'ö': 'oe', 'ü': 'ue'}
+            out = skill.lower()
 
-        return success, critical, quality_level, quality_level_application
+            for u in umlaute:
+                out = out.replace(u, umlaute[u])
 
-    def _show_and_update_set(self, title, group):
-        """Initate command line dialogue (german) to update given set.
+        return out
 
-        User get `group` displayed and asked for an element to update. If the
-        given input is already in `group`, it will be removed from that set,
-        else the given input is added to the set. In both cases a confirmation
-        is asked for.
+    @staticmethod
+    def __determine_quality_level(spare_points):
+        """Discretize the success from spare points to quality level.
+
+        In DSA the success of a test is measured in terms of spare points,
+        whereby the inital points represent the skill value. For comparrability
+        and further evaluation these points are discretize into quality level.
+        See https://ulisses-regelwiki.de/index.php/GR_Proben.html for more
+        informations.
 
         Parameters
         ----------
-        title : str
-            Is displayed to user before `group` is shown.
-        group : set
-            Set to be updated.
+        spare_points : int
+          Amount of skill points, which were not used for comensation.
 
         Returns
         -------
-        group : set
-            Updated copy of `group`.
+        quality_level : int
+            Measurement of success. 0 <=> input messed up.
 
         """
-        group = group.copy()
-        print('{}\n{}'.format(title, '='*len(title)))
-        print(group)
-        val = input('Aktualisiere um Element: ')
-        if val in group:
-            confirm = self._clean_read('{} entfernen?\n(j/n) '.format(val),
-                                       ['j', 'n'])
-            if confirm == 'j':
-                group.discard(val)
+        if 0 <= spare_points <= 3:
+            quality_level = 1
+        elif 4 <= spare_points <= 6:
+            quality_level = 2
+        elif 7 <= spare_points <= 9:
+            quality_level = 3
+        elif 10 <= spare_points <= 12:
+            quality_level = 4
+        elif 13 <= spare_points <= 15:
+            quality_level = 5
+        elif 16 <= spare_points:
+            quality_level = 6
         else:
-            confirm = self._clean_read('{} hinzufügen?\n(j/n) '.format(val),
-                                       ['j', 'n'])
-            if confirm == 'j':
-                group.add(val)
-        return group
+            quality_level = 0
+        return quality_level
 
-    def _show_pretty_dicts(self, title, dictionary, alphabetical_order=True,
-                           depth=1):
-        """Formate dictionary to pleasant readable string.
+
+class Hero(HeroBase):
+    """Baseclass for characters from the rpg `Das Shwarze Auge` (DSA).
+
+    This class is motivated by the need for automatic evaluation of test,
+    which is executed via the roll of three dices with twenty faces. This
+    independent random vector of three components must be lower than the
+    heros values in the corresponding attributes. See official rules at
+    https://ulisses-regelwiki.de/index.php/GR_Proben.html
+
+    Basic funtionality
+    ------------------
+    >>> from held import Held
+    >>> mary = Held('Mary Sue')
+    ==-> Nun Eigenschaften eingeben <-==
+        ...
+    ==->  Nun Fertigkeiten eingeben  <-==
+        ...
+    >>> print(mary.absoviere('Zechen', modifikator=-1))
+    Mary Sue absolviert eine Probe auf Zechen (Fertigkeistwert 5), um 1
+    erschwert.
+    Eigenschaften:
+        Klugheit - Konstitution - Körperkraft
+    Zielwerte:
+        [12 11 12]
+    Würfelergebnis:
+        [3 2 9]
+    Ergebnis:   Erfolg mit 2 Qualitätsstufen
+
+    Parameters
+    ----------
+    name : str
+        Name of the hero.
+    attribute_values : list, optional
+        List of integer with lenght 8, representing the values for the
+        attributes. Are asked in command line dialogue if not specified.
+        The default is [].
+    skill_values : list, optional
+        List of integer with length 59, representing the values for the
+        skills/talents. Are asked in command line dialogue if not
+        specified.
+        The default is [].
+    incompetences : list or set or None, optional
+        String representation of incompetent skills/talents.
+        The default is None.
+    gifted : list or set or None, optional
+        String representation of gifted skills or spell-likes.
+        The default is None.
+    rng : int or numpy.random.Generator or None, optional
+        Source of all rolls of this hero, see `Hero.rng`.
+        The default is None.
+
+    Raises
+    ------
+    TypeError
+        Raised when `incompetences` or `gifted` are not given as set, list
+        or None.
+
+    """
+    __slots__ = ('_attributes', '_skills', '_incompetences', '_gifted')
+
+    def __init__(self, name, attribute_values=[], skill_values=[],
+                 incompetences=None, gifted=None, rng=None):
+        self.name = name
+        self.rng = rng
+        self._attributes = dict.fromkeys(self.ATTRIBUTES)
+        self._skills = dict.fromkeys(
+            list(self.SKILL_CHECKS.keys()))
+
+        if len(attribute_values) != len(self._attributes):
+            # User Interaction
+            print('==->  Nun Eigenschaften eingeben  <-==')
+            attribute_values = self.__ask_for_values(self._attributes, (1, 25))
+
+        if all([1 <= val <= 25 for val in attribute_values]):
+            # check given list of values
+            self._attributes = dict(zip(self.ATTRIBUTES, attribute_values))
+        else:
+            raise ValueError('Werte für Eigenschaften müssen'
+                             ' im Bereich von 1 bis 25 liegen.')
+        self._invalidate_objectives()
+
+        if len(skill_values) != len(self._skills):
+            print('==->  Nun Fertigkeiten eingeben  <-==')
+            skill_values = self.__ask_for_values(self._skills, (0, 25))
+
+        if all([0 <= val <= 25 for val in skill_values]):
+            self._skills = dict(zip(self.SKILL_CHECKS, skill_values))
+        else:
+            raise ValueError('Werte für Talente müssen im '
+                             'Bereich von 0 bis 25 liegen.')
+
+        if incompetences is None:
+            self._incompetences = set()
+        else:
+            if isinstance(incompetences, set):
+                self._incompetences = incompetences
+            elif isinstance(incompetences, list):
+                self._incompetences = set(incompetences)
+            else:
+                raise TypeError('`incompetences` is expected '
+                                'as set or list.')
+
+        if gifted is None:
+            self._gifted = set()
+        else:
+            if isinstance(gifted, set):
+                self._gifted = gifted
+            elif isinstance(gifted, list):
+                self._gifted = set(gifted)
+            else:
+                raise TypeError('`gifted` is expected as list.')
+
+    def _assemble(self, name, attributes, skills, incompetences, gifted,
+                  rng, attribute_vector):
+        """Set all values of a hero created by `from_arrays`."""
+        self.name = name
+        # bypass the setter, `rng` may be deferred, see _spawn_batch
+        self._rng = rng
+        self._dice = None
+        self._attributes = attributes
+        self._skills = skills
+        self._incompetences = incompetences
+        self._gifted = gifted
+        # same as _invalidate_objectives, but from the validated array
+        self._attribute_vector = attribute_vector
+        self._objective_cache = {}
+
+    def update_special_abilities(self, also_permitted=[]):
+        """Initiate command line dialogue to update gifted and incompetences.
+
+        After confirmation the corresponding sets are updated.
 
         Parameters
         ----------
-        title : str
-            Prefix and first line of formulated string.
-        dictionary : dict
-            Dictionary to display.
-        alphabetical_order : bool, optional
-            True <=> key-value-pairs are shown in the keys alphabetical order.
-            The default is True.
-        depth : int, optional
-            Used for nested dictionaries. Regulate underlines and indentation.
-            The default is 1.
+        also_permitted : list, optional
+            List of strings representing additional legal skills for gifted
+            and incompetences. Enable derived classes to allow spell-likes as
+            gifted skills.
+            The default is [].
+
+        Raises
+        ------
+        ValueError
+            Raised when user try to...
+                ...set more than 3 gifted skills.
+                ...set more than 2 incompetences.
+                ...set the same skill as gifted and incompetence.
+                ...choose a non legal option (typo, attributes, etc.)
 
         Returns
         -------
-        msg : str
-            Pretty print version of dictionary.
+        None.
 
         """
-        gifted = ' (+)'
-        incomp = ' (-)'
-        msg = ''
-        list_of_keys = list(dictionary.keys())
-        if alphabetical_order:
-            list_of_keys.sort()
-        if depth == 1:
-            underline = '\n' + '=' * len(title)
-        elif depth == 2:
-            underline = '\n' + '-' * len(title)
-        else:
-            underline = ''
-        msg += ('\n' + title + underline)
-        for key in list_of_keys:
-            if isinstance(dictionary[key], dict):
-                value = str(self._show_pretty_dicts(
-                    title=key,
-                    dictionary=dictionary[key],
-                    depth=depth+1))
-                msg += ('\t'*depth + value)
+        # Whether gifts shall be updated
+        val = self._clean_read(text='Begabungen aktualisieren?\n(j/n) ',
+                               legal_response=['j', 'n'])
+        if val == 'j':
+            temp = self._show_and_update_set(
+                f'{self.name}\'s Begabungen:',
+                self._gifted)
+            if len(temp) > 3:
+                raise ValueError('Nicht mehr als 3 Begabungen erlaubt.')
+            for t in temp:
+                in_skills = t in self.SKILL_CHECKS.keys()
+                in_further_skills = t in also_permitted
+                if not in_skills and not in_further_skills:
+                    raise ValueError(f'{t} ist keine zulässige Fertigkeit.')
+            if temp.isdisjoint(self._incompetences):
+                self._gifted = temp
             else:
-                value = str(dictionary[key])
-                if key in self._incompetences:
-                    msg += ('\n' + key + incomp + ':\n' + '\t'*depth + value)
-                elif key in self._gifted:
-                    msg += ('\n' + key + gifted + ':\n' + '\t'*depth + value)
-                else:
-                    msg += ('\n' + key + ':\n' + '\t'*depth + value)
-        return msg
+                raise ValueError('Begabungen und Unfähigkeiten'
+                                 ' dürfen sich nicht überlappen.')
 
-    @staticmethod
-    def _clean_read(text, legal_response):
-        """Helperfunction for command line interaction.
+        # whether inability shall be updated
+        val = self._clean_read(text='Unfähigkeiten aktualisieren?\n(j/n) ',
+                               legal_response=['j', 'n'])
+        if val == 'j':
+            temp = self._show_and_update_set(
+                f'{self.name}\'s Unfähigkeiten:',
+                self._incompetences)
+            if len(temp) > 2:
+                raise ValueError('Nicht mehr als 2 Unfähigkeiten erlaubt.')
+            for t in temp:
+                if t not in self.SKILL_CHECKS.keys():
+                    raise ValueError('{t} ist keine zulässige Fertigkeit.')
+            if temp.isdisjoint(self._gifted):
+                self._incompetences = temp
+            else:
+                raise ValueError('Begabungen und Unfähigkeiten'
+                                 ' dürfen sich nicht überlappen.')
+
+        val = self._clean_read(
+            text='Weitere Aktualisierungen vornehmen?\n(j/n) ',
+            legal_response=['j', 'n'])
+
+        # whether more updates shall be happen
+        if val == 'j':
+            self.update_special_abilities(
+                also_permitted=also_permitted)
+
+    def update_attribute(self, attribute: str, by=1):
+        """Update attribute value by given integer.
 
         Parameters
         ----------
-        text : str
-            Message to display user in console.
-        legal_response : list
-            List of legal responses. Input is rejected iff it does not occure
-            in this list.
+        attribute : str
+            Attribute to update.
+        by : int, optional
+            Value for additive manipulation.
+            The default is 1.
+
+        Raises
+        ------
+        ValueError
+            Iff updated attribute value would violent legal limits.
+        KeyError
+            Iff argument `attribute` is not among the attributes.
 
         Returns
         -------
-        val : str
-            Legal user response on displayed message.
+        None.
 
         """
-        clean_read = False
-        while not clean_read:
-            val = input(text)
-            if val in legal_response:
-                clean_read = True
-        return val
+        assert isinstance(by, int),\
+            'Entwicklungsdiffernez muss als ganze Zahl gegeben sein.'
 
-    @staticmethod
-    def _tamper_designation(skill):
-        """Transform a given string for GUI concerns.
+        try:
+            old_val = self._attributes[attribute]
+            new_val = old_val + by
+            if 1 <= new_val <= 25:
+                msg = (f'Attribut {attribute} von {old_val} auf {new_val} '
+                       'setzen?\n(j/n) ')
+                res = self._clean_read(msg, legal_response=['j', 'n'])
+                if res == 'j':
+                    self._attributes[attribute] = new_val
+                    self._invalidate_objectives()
+                    print('Wert angepasst.')
+                else:
+                    print('Keine Änderungen vorgenommen.')
+            else:
+                raise ValueError('Entwickelter Wert muss im '
+                                 'Bereich 1 bis 25 liegen.')
+        except KeyError:
+            raise KeyError(f'{attribute} ist kein gültiges Attribut.')
 
-        In general the given string is changed to lower cases and umlauts are
-        replaced. If the given `skill` corresponds to one of the formulated
-        special cases, then the special transformation is applied.
+    def update_talent(self, talent: str, by=1):
+        """Update talent value by given integer.
 
         Parameters
         ----------
-        skill : str
-            String to transform, expected to be a skill (`Fertikeit`) or
-            identifier of a spell-like (from derived Funzel).
+        talent : str
+            Talent/skill to update.
+        by : int, optional
+            Value for additive manipulation.
+            The default is 1.
+
+        Raises
+        ------
+        ValueError
+            Iff updated skill value would violent legal limits.
+        KeyError
+            Iff argument `talent` is not among the talents/skills.
 
         Returns
         -------
-        out : str
-            Transformed string.
+        None.
 
         """
-        special_cases = {'Bekehren & Überzeugen': 'bekehren',
-                         'Fischen & Angeln': 'angeln',
-                         'Brett- & Glücksspiel': 'brettspiel',
-                         'Götter & Kulte': 'kulte',
-                         'Sagen & Legenden': 'sagen',
-                         'Boote & Schiffe': 'boote',
-                         'Heilkunde Gift': 'heilenGift',
-                         'Heilkunde Krankheiten': 'heilenKrankheit',
-                         'Heilkunde Seele': 'heilenSeele',
-                         'Heilkunde Wunden': 'heilenWunden',
-                         'Fährtensuchen': 'faehrtensuche',
-                         'Alchimie': 'alchemie',
-                         'Malen & Zeichen': 'malen'}
-        if skill in special_cases.keys():
-            out = special_cases[skill]
-        else:
-            umlaute = {'ä': 'ae', 'ö': 'oe', 'ü': 'ue'}
-            out = skill.lower()
-
-            for u in umlaute:
-                out = out.replace(u, umlaute[u])
+        assert isinstance(by, int),\
+            'Entwicklungsdiffernez muss als ganze Zahl gegeben sein.'
 
-        return out
+        try:
+            old_val = self._skills[talent]
+            new_val = old_val + by
+            if 0 <= new_val <= 25:
+                msg = \
+                    (f'Fertigkeitswert von {talent} von {old_val} auf '
+                     f'{new_val} setzen?\n(j/n) ')
+                res = self._clean_read(msg, legal_response=['j', 'n'])
+                if res == 'j':
+                    self._skills[talent] = new_val
+                    print('Wert angepasst.')
+                else:
+                    print('Keine Änderungen vorgenommen.')
+            else:
+                raise ValueError('Entwickelter Wert muss im '
+                                 'Bereich 0 bis 25 liegen.')
+        except KeyError:
+            raise KeyError(f'{talent} ist kein gültiges Talent.')
 
     @staticmethod
     def __ask_for_values(dictionary, limits=(-float('inf'), float('inf'))):
@@ -1287,40 +3149,3 @@ class Hero():
                     print('Achtung:\tWert muss als Integer lesbar sein.')
             values.append(val)
         return values
-
-    @staticmethod
-    def __determine_quality_level(spare_points):
-        """Discretize the success from spare points to quality level.
-
-        In DSA the success of a test is measured in terms of spare points,
-        whereby the inital points represent the skill value. For comparrability
-        and further evaluation these points are discretize into quality level.
-        See https://ulisses-regelwiki.de/index.php/GR_Proben.html for more
-        informations.
-
-        Parameters
-        ----------
-        spare_points : int
-          Amount of skill points, which were not used for comensation.
-
-        Returns
-        -------
-        quality_level : int
-            Measurement of success. 0 <=> input messed up.
-
-        """
-        if 0 <= spare_points <= 3:
-            quality_level = 1
-        elif 4 <= spare_points <= 6:
-            quality_level = 2
-        elif 7 <= spare_points <= 9:
-            quality_level = 3
-        elif 10 <= spare_points <= 12:
-            quality_level = 4
-        elif 13 <= spare_points <= 15:
-            quality_level = 5
-        elif 16 <= spare_points:
-            quality_level = 6
-        else:
-            quality_level = 0
-        return quality_level
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Random non-player characters following archetype templates.
+
+An archetype states typical attribute values, typical skill levels for its
+specialties and a base level for all other skills. Values of each NPC are
+drawn from normal distributions around these and rounded and clipped to the
+legal ranges. NPCs are created in compact form, see `compact.CompactHero`,
+and work with every analysis, e.g. `roster.party_matrix`.
+
+Created on Sun Oct 18 14:22:16 2026
+
+@author: Mirko Ulrich
+"""
+
+import numpy as np
+
+from compact import CompactHero
+from hero import Hero, HeroValidationError
+
+
+ARCHETYPES = {
+    'Bauer': {
+        'Eigenschaften': {'Mut': 11, 'Klugheit': 10, 'Intuition': 11,
+                          'Charisma': 10, 'Fingerfertigkeit': 11,
+                          'Gewandtheit': 11, 'Konstitution': 13,
+                          'Körperkraft': 13},
+        'Fertigkeiten': {'Körperbeherrschung': 4, 'Kraftakt': 6,
+                         'Zechen': 5, 'Tierkunde': 7, 'Pflanzenkunde': 6,
+                         'Wildnisleben': 4, 'Holzbearbeitung': 4,
+                         'Lebensmittelbearbeitung': 5, 'Fahrzeuge': 5},
+        'Grundwert': 2},
+    'Wache': {
+        'Eigenschaften': {'Mut': 13, 'Klugheit': 10, 'Intuition': 12,
+                          'Charisma': 10, 'Fingerfertigkeit': 11,
+                          'Gewandtheit': 12, 'Konstitution': 13,
+                          'Körperkraft': 13},
+        'Fertigkeiten': {'Sinnesschärfe': 7, 'Selbstbeherrschung': 6,
+                         'Willenskraft': 5, 'Einschüchtern': 6,
+                         'Menschenkenntnis': 5, 'Körperbeherrschung': 5,
+                         'Kraftakt': 5, 'Zechen': 5, 'Kriegskunst': 3},
+        'Grundwert': 2},
+    'Händler': {
+        'Eigenschaften': {'Mut': 11, 'Klugheit': 12, 'Intuition': 13,
+                          'Charisma': 13, 'Fingerfertigkeit': 11,
+                          'Gewandtheit': 10, 'Konstitution': 11,
+                          'Körperkraft': 10},
+        'Fertigkeiten': {'Handel': 9, 'Überreden': 7, 'Menschenkenntnis': 7,
+                         'Rechnen': 7, 'Etikette': 5, 'Geographie': 5,
+                         'Fahrzeuge': 4, 'Willenskraft': 4},
+        'Grundwert': 2},
+    'Dieb': {
+        'Eigenschaften': {'Mut': 12, 'Klugheit': 11, 'Intuition': 13,
+                          'Charisma': 11, 'Fingerfertigkeit': 14,
+                          'Gewandtheit': 14, 'Konstitution': 11,
+                          'Körperkraft': 10},
+        'Fertigkeiten': {'Taschendiebstahl': 9, 'Verbergen': 8,
+                         'Schlösserknacken': 8, 'Sinnesschärfe': 6,
+                         'Klettern': 6, 'Gassenwissen': 7, 'Überreden': 5,
+                         'Körperbeherrschung': 6},
+        'Grundwert': 2},
+    'Gelehrter': {
+        'Eigenschaften': {'Mut': 10, 'Klugheit': 15, 'Intuition': 13,
+                          'Charisma': 11, 'Fingerfertigkeit': 11,
+                          'Gewandtheit': 10, 'Konstitution': 10,
+                          'Körperkraft': 9},
+        'Fertigkeiten': {'Geschichtswissen': 9, 'Rechnen': 8,
+                         'Sagen & Legenden': 7, 'Götter & Kulte': 7,
+                         'Magiekunde': 6, 'Sternkunde': 6,
+                         'Rechtskunde': 6, 'Geographie': 6, 'Etikette': 5},
+        'Grundwert': 1},
+    'Söldner': {
+        'Eigenschaften': {'Mut': 14, 'Klugheit': 10, 'Intuition': 12,
+                          'Charisma': 10, 'Fingerfertigkeit': 11,
+                          'Gewandtheit': 13, 'Konstitution': 14,
+                          'Körperkraft': 14},
+        'Fertigkeiten': {'Kraftakt': 7, 'Körperbeherrschung': 7,
+                         'Selbstbeherrschung': 7, 'Zechen': 7,
+                         'Einschüchtern': 6, 'Kriegskunst': 5,
+                         'Sinnesschärfe': 5, 'Wildnisleben': 4},
+        'Grundwert': 2},
+    }
+ATTRIBUTE_SPREAD = 1.5
+SKILL_SPREAD = 2.0
+
+
+def generate_npcs(archetype, count, seed=None, compact=True):
+    """Create NPCs of a single archetype.
+
+    Parameters
+    ----------
+    archetype : str or dict
+        Key of `ARCHETYPES` or a template of the same layout; NPCs of a
+        template are named 'NSC'.
+    count : int
+        Number of NPCs.
+    seed : int or numpy.random.SeedSequence or None, optional
+        Entropy for values and for the dice of all NPCs.
+        The default is None.
+    compact : bool, optional
+        Iff NPCs are created as CompactHero, otherwise as Hero.
+        The default is True.
+
+    Raises
+    ------
+    ValueError
+        Raised for an unknown archetype.
+    HeroValidationError
+        Raised for a template lacking any of its values.
+
+    Returns
+    -------
+    list
+        NPCs, named after the archetype and numbered from 1.
+
+    """
+    return generate_encounter([(archetype, count)], seed=seed,
+                              compact=compact)
+
+
+def generate_encounter(composition, seed=None, compact=True):
+    """Create NPCs of several archetypes, e.g. for an encounter.
+
+    Parameters
+    ----------
+    composition : dict or list
+        Number of NPCs for each archetype, either as dict or as list of
+        pairs (archetype, count), see `generate_npcs`.
+    seed : int or numpy.random.SeedSequence or None, optional
+        Entropy for values and for the dice of all NPCs.
+        The default is None.
+    compact : bool, optional
+        Iff NPCs are created as CompactHero, otherwise as Hero.
+        The default is True.
+
+    Raises
+    ------
+    ValueError
+        Raised for an unknown archetype.
+    HeroValidationError
+        Raised for a template lacking any of its values.
+
+    Returns
+    -------
+    list
+        NPCs in order of `composition`.
+
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    value_seed, dice_seed = seed.spawn(2)
+    rng = np.random.default_rng(value_seed)
+
+    names, attributes, skills = [], [], []
+    if isinstance(composition, dict):
+        composition = composition.items()
+    for archetype, count in composition:
+        label, template = _template(archetype)
+        attribute_values, skill_values = generate_values(template, count,
+                                                         rng)
+        names += [f'{label} {i}' for i in range(1, count + 1)]
+        attributes.append(attribute_values)
+        skills.append(skill_values)
+
+    cls = CompactHero if compact else Hero
+    if not names:
+        return []
+    return cls.from_arrays(names, np.concatenate(attributes),
+                           np.concatenate(skills), rng=dice_seed)
+
+
+def generate_values(template, count, rng):
+    """Draw attribute and skill values for an archetype.
+
+    Parameters
+    ----------
+    template : dict
+        Archetype, see `ARCHETYPES`.
+    count : int
+        Number of NPCs.
+    rng : numpy.random.Generator
+        Source of randomness.
+
+    Returns
+    -------
+    attribute_values : numpy.ndarray
+        Values with shape (`count`, 8), clipped to 1, ..., 25.
+    skill_values : numpy.ndarray
+        Values with shape (`count`, 59), clipped to 0, ..., 25.
+
+    """
+    attribute_mean = np.array([template['Eigenschaften'][att]
+                               for att in Hero.ATTRIBUTES])
+    skill_mean = np.array([template['Fertigkeiten'].get(
+        skill, template['Grundwert']) for skill in Hero.SKILL_CHECKS])
+
+    attribute_values = np.rint(rng.normal(
+        attribute_mean, ATTRIBUTE_SPREAD, (count, len(attribute_mean))))
+    skill_values = np.rint(rng.normal(
+        skill_mean, SKILL_SPREAD, (count, len(skill_mean))))
+    return (np.clip(attribute_values, 1, 25).astype(np.int8),
+            np.clip(skill_values, 0, 25).astype(np.int8))
+
+
+def _template(archetype):
+    """Resolve designation and template of an archetype."""
+    if isinstance(archetype, dict):
+        missing = [key for key in ('Eigenschaften', 'Fertigkeiten',
+                                   'Grundwert') if key not in archetype]
+        if missing:
+            raise HeroValidationError(
+                'Der Vorlage fehlen die Angaben: {}.'.format(
+                    ', '.join(missing)), missing[0])
+        missing = [attribute for attribute in Hero.ATTRIBUTES
+                   if attribute not in archetype['Eigenschaften']]
+        if missing:
+            raise HeroValidationError(
+                'Der Vorlage fehlen die Eigenschaften: {}.'.format(
+                    ', '.join(missing)), 'Eigenschaften')
+        return 'NSC', archetype
+    try:
+        return archetype, ARCHETYPES[archetype]
+    except (KeyError, TypeError):
+        raise ValueError(f'{archetype} ist kein bekannter Archetyp.')
@@ -1,13 +1,44 @@
 # -*- coding: utf-8 -*-
 """Helperfunctions for plotting concerns.
 
+Plots requested by analyses are drawn by a single, long-lived worker
+process (see `PlotWorker`), so matplotlib is imported once and the calling
+process is not blocked. Requests are sent as compact numpy arrays through a
+queue; the worker redraws one figure per kind of plot instead of opening a
+new window each time. Besides the 3D scatter of all rolls there are plots
+of aggregated arrays (heatmaps per pair of dice, bar chart of quality
+levels, chance of success over modifiers), which draw much faster. All
+`draw_*` functions take a figure, so they may be embedded, e.g. into a Qt
+canvas.
+
+Without display, e.g. on a server, plots are rendered headless to PNG or
+SVG (see `render_cube`). Rendered images are stored in a content-addressed
+cache, so the same distribution is drawn only once.
+
+matplotlib is only imported when something is actually drawn, so
+requesting a plot from the worker does not load it into the calling
+process.
+
 Created on Fri Mar  5 12:03:49 2021
 
 @author: 49162
 """
 
-from matplotlib import pyplot as plt
-from pylab import cm
+import atexit
+import hashlib
+import io
+import multiprocessing
+import os
+import pathlib
+import queue
+import tempfile
+
+import numpy as np
+
+
+CUBE_FIGURE = 'Verteilung der Qualitätsstufen'
+CACHE_DIRECTORY = pathlib.Path.home() / '.dsa_calculator' / 'plots'
+IMAGE_FORMATS = ('png', 'svg')
 
 
 def plot_cube_of_success(table, title=''):
@@ -28,22 +59,547 @@ def plot_cube_of_success(table, title=''):
     None.
 
     """
+    from matplotlib import pyplot as plt
+
     header = list(table.columns)
 
     fig = plt.figure()
-    ax = fig.add_subplot(111, projection='3d')
+    _draw_cube(fig, table[header[0]], table[header[1]], table[header[2]],
+               table[header[3]], header[:3], title)
+    plt.show()
+
+
+def plot(kind, *payload):
+    """Draw a plot by the plot worker, without blocking.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of plot, one of 'cube', 'heatmap', 'bars' and 'curve'.
+    *payload
+        Arguments of the drawing function of `kind` following the figure,
+        see `draw_cube`, `draw_heatmaps`, `draw_qs_bars` and
+        `draw_success_curve`.
+
+    Returns
+    -------
+    None.
+
+    """
+    get_worker().submit(kind, _checked_payload(kind, payload))
+
+
+def plot_cube(qualities, labels, title=''):
+    """Draw the cube of success by the plot worker, without blocking.
+
+    Parameters
+    ----------
+    qualities : array_like
+        Quality levels with shape (20, 20, 20), indexed by the rolls of the
+        first, second and third dice minus one.
+    labels : sequence of str
+        Designation of the three axes, e.g. the tested attributes.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+
+    Returns
+    -------
+    None.
+
+    """
+    plot('cube', qualities, labels, title)
+
+
+def render(kind, *payload, fmt='png', path=None,
+           cache_directory=CACHE_DIRECTORY, dpi=100):
+    """Render a plot headless as image.
+
+    No window is opened and no interactive backend is needed. The image is
+    looked up in the cache first, whose key covers kind and payload of the
+    plot, format and resolution.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of plot, see `plot`.
+    *payload
+        Arguments of the drawing function of `kind`, see `plot`.
+    fmt : str, optional
+        Image format, one of `IMAGE_FORMATS`.
+        The default is 'png'.
+    path : str or pathlib.Path or None, optional
+        File to write the image to additionally.
+        The default is None.
+    cache_directory : str or pathlib.Path or None, optional
+        Directory of the cache, None disables caching.
+        The default is CACHE_DIRECTORY.
+    dpi : int, optional
+        Resolution of PNG images.
+        The default is 100.
+
+    Raises
+    ------
+    ValueError
+        Raised for an unknown kind or format or a payload of wrong shape.
+
+    Returns
+    -------
+    bytes
+        Content of the image.
+
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f'{fmt} ist kein unterstütztes Bildformat.')
+    payload = _checked_payload(kind, payload)
+
+    cached = None
+    if cache_directory is not None:
+        key = _cache_key(kind, payload, fmt, dpi)
+        cached = pathlib.Path(cache_directory, f'{kind}_{key}.{fmt}')
+    if cached is not None and cached.is_file():
+        image = cached.read_bytes()
+    else:
+        from matplotlib.figure import Figure
 
-    x = table[header[0]]
-    y = table[header[1]]
-    z = table[header[2]]
-    q = table[header[3]]
+        # a bare Figure is not managed by pyplot and needs no display
+        fig = Figure(figsize=_PLOTS[kind][2])
+        _PLOTS[kind][0](fig, *payload)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi)
+        image = buffer.getvalue()
+        if cached is not None:
+            _write_atomic(cached, image)
 
-    colors = cm.Spectral(q / max(q))
+    if path is not None:
+        pathlib.Path(path).write_bytes(image)
+    return image
 
-    ax.set_xlabel(header[0])
-    ax.set_ylabel(header[1])
-    ax.set_zlabel(header[2])
+
+def render_cube(qualities, labels, title='', fmt='png', path=None,
+                cache_directory=CACHE_DIRECTORY, dpi=100):
+    """Render the cube of success headless as image, see `render`.
+
+    Parameters
+    ----------
+    qualities : array_like
+        Quality levels with shape (20, 20, 20), see `plot_cube`.
+    labels : sequence of str
+        Designation of the three axes, e.g. the tested attributes.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+    fmt : str, optional
+        Image format, one of `IMAGE_FORMATS`.
+        The default is 'png'.
+    path : str or pathlib.Path or None, optional
+        File to write the image to additionally.
+        The default is None.
+    cache_directory : str or pathlib.Path or None, optional
+        Directory of the cache, None disables caching.
+        The default is CACHE_DIRECTORY.
+    dpi : int, optional
+        Resolution of PNG images.
+        The default is 100.
+
+    Returns
+    -------
+    bytes
+        Content of the image.
+
+    """
+    return render('cube', qualities, labels, title, fmt=fmt, path=path,
+                  cache_directory=cache_directory, dpi=dpi)
+
+
+def draw_cube(fig, qualities, labels, title=''):
+    """Scatter all 8000 rolls in 3D, coloured by quality level.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to draw into, e.g. of a Qt canvas.
+    qualities : numpy.ndarray
+        Quality levels with shape (20, 20, 20), see `plot_cube`.
+    labels : sequence of str
+        Designation of the three dice.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+
+    Returns
+    -------
+    None.
+
+    """
+    first, second, third = np.indices(qualities.shape) + 1
+    _draw_cube(fig, first.ravel(), second.ravel(), third.ravel(),
+               qualities.ravel(), labels, title)
+
+
+def draw_heatmaps(fig, qualities, labels, title=''):
+    """Show the mean quality level for each pair of dice as heatmap.
+
+    The remaining dice is averaged out, so three 20 x 20 images replace the
+    scatter of 8000 points.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to draw into, e.g. of a Qt canvas.
+    qualities : numpy.ndarray
+        Quality levels with shape (20, 20, 20), see `plot_cube`.
+    labels : sequence of str
+        Designation of the three dice.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+
+    Returns
+    -------
+    None.
+
+    """
+    vmax = max(qualities.max(), 1e-12)
+    # fixed margins, a layout engine would take longer than the drawing
+    axes = fig.subplots(1, 3, gridspec_kw={'left': .06, 'right': .88,
+                                           'bottom': .15, 'wspace': .35})
+    for ax, (row, col) in zip(axes, ((0, 1), (0, 2), (1, 2))):
+        # average over the dice which is not shown
+        other = 3 - row - col
+        image = ax.imshow(qualities.mean(axis=other), origin='lower',
+                          extent=(.5, 20.5, .5, 20.5), cmap='Spectral',
+                          vmin=0, vmax=vmax)
+        ax.set_xlabel(labels[col])
+        ax.set_ylabel(labels[row])
+        ax.set_xticks((1, 5, 10, 15, 20))
+        ax.set_yticks((1, 5, 10, 15, 20))
+    fig.colorbar(image, ax=axes, shrink=.6, label='mittlere #QS')
+    fig.suptitle(title)
+
+
+def draw_qs_bars(fig, qs_prob, qs_app_prob=None, title=''):
+    """Show the distribution of quality levels as bar chart.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to draw into, e.g. of a Qt canvas.
+    qs_prob : numpy.ndarray
+        P(#QS=q) for q = 0, ..., 12.
+    qs_app_prob : numpy.ndarray or None, optional
+        Same w.r.t. `field of application` rule, drawn next to `qs_prob`.
+        The default is None.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+
+    Returns
+    -------
+    None.
+
+    """
+    ax = fig.add_subplot(111)
+    levels = np.arange(len(qs_prob))
+    if qs_app_prob is None:
+        ax.bar(levels, qs_prob * 100, color='tab:blue')
+    else:
+        ax.bar(levels - .2, qs_prob * 100, width=.4, label='Probe')
+        ax.bar(levels + .2, qs_app_prob * 100, width=.4,
+               label='Anwendungsgebiet')
+        ax.legend()
+    ax.set_xticks(levels)
+    ax.set_xlabel('#QS')
+    ax.set_ylabel('P(#QS=q) [in Prozent]')
+    ax.set_title(title)
+
+
+def draw_success_curve(fig, modifiers, success_prob, expected_value=None,
+                       title='', highlight=None):
+    """Show the chance of success over modifiers.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to draw into, e.g. of a Qt canvas.
+    modifiers : numpy.ndarray
+        Evaluated modifications, shape (K,).
+    success_prob : numpy.ndarray
+        Probability to pass the test for each modifier, shape (K,).
+    expected_value : numpy.ndarray or None, optional
+        Expected quality level for each modifier, drawn on a second axis.
+        The default is None.
+    title : str, optional
+        Title to display for the plot.
+        Default is ''.
+    highlight : int or None, optional
+        Modifier to mark, e.g. the one of the current test.
+        The default is None.
+
+    Returns
+    -------
+    None.
+
+    """
+    ax = fig.add_subplot(111)
+    ax.plot(modifiers, success_prob * 100, marker='o', color='tab:blue')
+    ax.set_ylim(0, 100)
+    ax.set_xlabel('Modifikator')
+    ax.set_ylabel('Erfolgswahrscheinlichkeit [in Prozent]',
+                  color='tab:blue')
+    ax.grid(alpha=.3)
+    if expected_value is not None:
+        twin = ax.twinx()
+        twin.plot(modifiers, expected_value, ls='--', color='tab:orange')
+        twin.set_ylabel('Erwartungswert #QS', color='tab:orange')
+        twin.set_ylim(bottom=0)
+    if highlight is not None:
+        ax.axvline(highlight, color='grey', lw=1)
+    ax.set_title(title)
+
+
+def clear_cache(cache_directory=CACHE_DIRECTORY):
+    """Delete all cached images.
+
+    Parameters
+    ----------
+    cache_directory : str or pathlib.Path, optional
+        Directory of the cache.
+        The default is CACHE_DIRECTORY.
+
+    Returns
+    -------
+    int
+        Number of deleted images.
+
+    """
+    deleted = 0
+    for fmt in IMAGE_FORMATS:
+        for image in pathlib.Path(cache_directory).glob(f'*_*.{fmt}'):
+            # only images named by `_cache_key`
+            if len(image.stem.rsplit('_', 1)[1]) == 40:
+                image.unlink()
+                deleted += 1
+    return deleted
+
+
+class PlotWorker():
+    """Long-lived process drawing plots which are requested via a queue.
+
+    The process is started with the first request and stopped on exit of
+    the interpreter, whereby open figures are kept until closed. Each
+    request holds the kind of plot and its payload; the figure of each kind
+    is reused.
+
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._process = None
+
+    @property
+    def alive(self):
+        """bool: Iff the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def submit(self, kind, payload):
+        """Request a plot, the worker is (re)started if necessary.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of plot, see `plot`.
+        payload : tuple
+            Arguments of the drawing function of `kind`.
+
+        Returns
+        -------
+        None.
+
+        """
+        if kind not in _PLOTS:
+            raise ValueError(f'{kind} ist keine bekannte Darstellung.')
+        if not self.alive:
+            self._start()
+        self._queue.put((kind, payload))
+
+    def shutdown(self, wait=True, timeout=None):
+        """Stop the worker.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Iff open figures stay until closed by the user, otherwise the
+            worker is terminated right away.
+            The default is True.
+        timeout : float or None, optional
+            Seconds to wait for the worker before it is terminated.
+            The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self._process is None:
+            return
+        atexit.unregister(self.shutdown)
+        if wait and self._process.is_alive():
+            self._queue.put(None)
+            self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._queue.close()
+        self._queue.join_thread()
+        self._process = None
+        self._queue = None
+
+    def _start(self):
+        self._queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self._queue,), name='plottery',
+            daemon=True)
+        self._process.start()
+        # registered after multiprocessing's own exit handler, hence called
+        # before daemonic processes are terminated
+        atexit.register(self.shutdown)
+
+
+_WORKER = None
+
+
+def get_worker():
+    """Return the plot worker of this process, see `PlotWorker`.
+
+    Returns
+    -------
+    PlotWorker
+        Shared worker, shut down on exit of the interpreter.
+
+    """
+    global _WORKER
+    if _WORKER is None:
+        _WORKER = PlotWorker()
+    return _WORKER
+
+
+def shutdown_worker(wait=True, timeout=None):
+    """Stop the shared plot worker, see `PlotWorker.shutdown`.
+
+    Parameters
+    ----------
+    wait : bool, optional
+        Iff open figures stay until closed by the user.
+        The default is True.
+    timeout : float or None, optional
+        Seconds to wait for the worker before it is terminated.
+        The default is None.
+
+    Returns
+    -------
+    None.
+
+    """
+    if _WORKER is not None:
+        _WORKER.shutdown(wait=wait, timeout=timeout)
+
+
+def _serve(requests, interval=.1):
+    """Main loop of the worker, keeps figures responsive between requests."""
+    from matplotlib import pyplot as plt
+
+    plt.ion()
+    while True:
+        try:
+            request = requests.get(timeout=interval)
+        except queue.Empty:
+            if plt.get_fignums():
+                plt.pause(interval)
+            continue
+        if request is None:
+            break
+        _redraw(*request)
+        plt.pause(.001)
+    # let the user close remaining figures
+    plt.ioff()
+    if plt.get_fignums():
+        plt.show()
+    plt.close('all')
+
+
+def _redraw(kind, payload):
+    """Draw a request into the reused figure of its kind."""
+    from matplotlib import pyplot as plt
+
+    draw, designation, size = _PLOTS[kind]
+    fig = plt.figure(designation, figsize=size)
+    fig.clf()
+    draw(fig, *payload)
+    fig.canvas.draw_idle()
+
+
+def _draw_cube(fig, x, y, z, q, labels, title):
+    """Scatter all rolls, coloured by quality level."""
+    from matplotlib import cm
+
+    ax = fig.add_subplot(111, projection='3d')
+
+    colors = cm.Spectral(q / max(q.max(), 1e-12))
+
+    ax.set_xlabel(labels[0])
+    ax.set_ylabel(labels[1])
+    ax.set_zlabel(labels[2])
     ax.set_title(title)
 
     ax.scatter(x, y, z, c=colors, s=20, alpha=.5)
-    plt.show()
+
+
+def _checked_payload(kind, payload):
+    """Validate a payload and convert its arrays to compact numpy arrays."""
+    if kind not in _PLOTS:
+        raise ValueError(f'{kind} ist keine bekannte Darstellung.')
+    if kind in ('cube', 'heatmap'):
+        qualities, labels, *rest = payload
+        qualities = np.asarray(qualities, dtype=np.float32)
+        if qualities.shape != (20, 20, 20):
+            raise ValueError('Es werden 20 x 20 x 20 Qualitätsstufen'
+                             ' benötigt.')
+        return (qualities, tuple(labels), *rest)
+    return tuple(np.asarray(item, dtype=float)
+                 if isinstance(item, (list, np.ndarray)) else item
+                 for item in payload)
+
+
+def _cache_key(kind, payload, *details):
+    """Content hash over kind, payload and further details of a plot."""
+    digest = hashlib.sha1(kind.encode())
+    for item in payload:
+        if isinstance(item, np.ndarray):
+            digest.update(f'{item.dtype}{item.shape}'.encode())
+            digest.update(np.ascontiguousarray(item).tobytes())
+        else:
+            digest.update(repr(item).encode())
+    digest.update(repr(details).encode())
+    return digest.hexdigest()
+
+
+def _write_atomic(path, content):
+    """Write via a temporary file, so readers never see partial images."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(content)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+# drawing function, designation and size of the reused figure by kind of plot
+_PLOTS = {'cube': (draw_cube, CUBE_FIGURE, None),
+          'heatmap': (draw_heatmaps, 'Qualitätsstufen je Würfelpaar',
+                      (12, 4)),
+          'bars': (draw_qs_bars, 'Verteilung der #QS', None),
+          'curve': (draw_success_curve, 'Erfolgsaussichten', None)}
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""Precomputed distributions of quality levels for every possible test.
+
+The objective of a 3D20 test is capped at 19 and must be at least 1, while
+skill levels range from 0 to 25. Hence all tests can be tabulated once and
+analyzing a test becomes a lookup in a memory mapped numpy array.
+
+Tables are generated via command line
+    python qs_table.py [directory]
+or `generate_tables`. Each file name carries a hash of the rules (see
+`Hero._rule_hash`), so outdated tables are not picked up after a change of
+the rules.
+
+Created on Sun Oct 18 09:12:40 2026
+
+@author: Mirko Ulrich
+"""
+
+import argparse
+import itertools
+import pathlib
+
+import numpy as np
+
+
+DEFAULT_DIRECTORY = pathlib.Path.home() / '.dsa_calculator'
+VARIANTS = ('plain', 'gifted', 'incompetent')
+
+# layout of the last axis: counts of #QS, of #QS w.r.t. field of
+# application, of critical successes and of botches
+_QS_SLICE = slice(0, 13)
+_QS_APP_SLICE = slice(13, 26)
+_CRIT = 26
+_BOTCH = 27
+_FIELDS = 28
+_SKILL_LEVELS = 26
+MAX_AIM = 19
+
+
+def table_path(directory, variant, rule_hash):
+    """Determine file of a table.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory of the tables.
+    variant : str
+        One of `VARIANTS`.
+    rule_hash : str
+        Fingerprint of the rules, see `Hero._rule_hash`.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the .npy file.
+
+    """
+    return pathlib.Path(directory, f'qs_table_{variant}_{rule_hash}.npy')
+
+
+def generate_tables(directory=DEFAULT_DIRECTORY, chunk_size=128,
+                    max_aim=MAX_AIM):
+    """Compute and store the tables for all variants.
+
+    Without rerolls the distribution does not depend on the order of the
+    objective, so the table of the variant `plain` only holds sorted aims.
+    For gifted skills and incompetences the rerolled dice is chosen by
+    position in case of ties, therefore these tables hold all 19**3 ordered
+    aims.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path, optional
+        Directory to store the tables, is created if necessary.
+        The default is DEFAULT_DIRECTORY.
+    chunk_size : int, optional
+        Number of objectives processed at once; limits memory usage.
+        The default is 128.
+    max_aim : int, optional
+        Largest objective of the tables; tests with larger objectives are
+        computed instead of looked up.
+        The default is MAX_AIM.
+
+    Returns
+    -------
+    list
+        Paths of the written tables.
+
+    """
+    from hero import Hero
+
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rule_hash = Hero._rule_hash()
+    skill_levels = np.arange(_SKILL_LEVELS)
+
+    written = []
+    for variant in VARIANTS:
+        aims = (_sorted_aims(max_aim) if variant == 'plain'
+                else _ordered_aims(max_aim))
+        table = np.empty((len(aims), _SKILL_LEVELS, _FIELDS),
+                         dtype=np.uint32)
+        for start in range(0, len(aims), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            joint = Hero._joint_distribution(
+                aims[chunk],
+                gifted=(variant == 'gifted'),
+                incompetent=(variant == 'incompetent'))
+            qs, qs_app, crit, botch = Hero._rate_joint(
+                joint[:, None], skill_levels, normalize=False)
+            table[chunk, :, _QS_SLICE] = qs
+            table[chunk, :, _QS_APP_SLICE] = qs_app
+            table[chunk, :, _CRIT] = crit
+            table[chunk, :, _BOTCH] = botch
+
+        # write to temporary file first, readers never see partial tables
+        path = table_path(directory, variant, rule_hash)
+        temporary = path.with_name('tmp_' + path.name)
+        np.save(temporary, table)
+        temporary.replace(path)
+        written.append(path)
+    return written
+
+
+class QSTable():
+    """Read-only access to tables written by `generate_tables`.
+
+    Parameters
+    ----------
+    rule_hash : str
+        Fingerprint of the rules, see `Hero._rule_hash`.
+    directory : str or pathlib.Path, optional
+        Directory of the tables.
+        The default is DEFAULT_DIRECTORY.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised when any variant is missing for the given `rule_hash`.
+
+    """
+
+    def __init__(self, rule_hash, directory=DEFAULT_DIRECTORY):
+        self._tables = {}
+        for variant in VARIANTS:
+            path = table_path(directory, variant, rule_hash)
+            if not path.is_file():
+                raise FileNotFoundError(
+                    f'Keine Tabelle {path.name} in {directory} gefunden.')
+            self._tables[variant] = np.load(path, mmap_mode='r')
+        # the ordered tables hold max_aim**3 rows
+        self._max_aim = round(len(self._tables['gifted']) ** (1 / 3))
+        self._sorted_rows = _sorted_rows(self._max_aim)
+
+    def covers(self, aims, skill_level):
+        """Check whether the given tests are tabulated.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3).
+        skill_level : int or numpy.ndarray
+            Skill level(s), scalar or shape (M,).
+
+        Returns
+        -------
+        bool
+            True iff all tests can be looked up.
+
+        """
+        aims = np.asarray(aims)
+        skill_level = np.asarray(skill_level)
+        return (aims.shape[-1:] == (3,)
+                and bool(np.all((1 <= aims) & (aims <= self._max_aim)))
+                and bool(np.all((0 <= skill_level)
+                                & (skill_level < _SKILL_LEVELS))))
+
+    def lookup(self, aims, skill_level, gifted=False, incompetent=False):
+        """Look up the distribution of quality levels.
+
+        Parameters
+        ----------
+        aims : numpy.ndarray
+            Objective(s) with shape (3,) or (M, 3), values in 1, ..., 19
+            (or the largest objective of the tables).
+        skill_level : int or numpy.ndarray
+            Skill level(s) in 0, ..., 25, scalar or shape (M,).
+        gifted : bool, optional
+            Iff the tested skill is gifted. The default is False.
+        incompetent : bool, optional
+            Iff the tested skill is an incompetence. The default is False.
+
+        Returns
+        -------
+        tuple
+            Same as `Hero._qs_distribution`.
+
+        """
+        aims = np.asarray(aims) - 1
+        if gifted:
+            variant, total = 'gifted', 20**4
+        elif incompetent:
+            variant, total = 'incompetent', 20**4
+        else:
+            variant, total = 'plain', 20**3
+
+        if variant == 'plain':
+            rows = self._sorted_rows[aims[..., 0], aims[..., 1], aims[..., 2]]
+        else:
+            size = self._max_aim
+            rows = (aims[..., 0] * size + aims[..., 1]) * size + aims[..., 2]
+        counts = self._tables[variant][rows, skill_level] / total
+
+        return (counts[..., _QS_SLICE], counts[..., _QS_APP_SLICE],
+                counts[..., _CRIT], counts[..., _BOTCH])
+
+
+def _sorted_aims(max_aim=MAX_AIM):
+    """All objectives with ascending values, 1330 rows by default."""
+    return np.array(list(itertools.combinations_with_replacement(
+        range(1, max_aim + 1), 3)), dtype=np.int16)
+
+
+def _ordered_aims(max_aim=MAX_AIM):
+    """All `max_aim`**3 objectives, last value changes fastest."""
+    return np.array(list(itertools.product(range(1, max_aim + 1),
+                                           repeat=3)), dtype=np.int16)
+
+
+def _sorted_rows(max_aim=MAX_AIM):
+    """Map every ordered objective (minus one) to its row in `_sorted_aims`."""
+    aims = np.sort(_ordered_aims(max_aim), axis=-1) - 1
+    # rank of each sorted triple among all sorted triples
+    keys = (aims[:, 0] * max_aim + aims[:, 1]) * max_aim + aims[:, 2]
+    sorted_aims = _sorted_aims(max_aim) - 1
+    sorted_keys = ((sorted_aims[:, 0] * max_aim + sorted_aims[:, 1])
+                   * max_aim + sorted_aims[:, 2])
+    rows = np.searchsorted(sorted_keys, keys)
+    return rows.astype(np.int16).reshape((max_aim,) * 3)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Berechnet die Tabellen der Qualitätsstufen vorab.')
+    parser.add_argument('directory', nargs='?', default=DEFAULT_DIRECTORY,
+                        help='Zielverzeichnis der Tabellen.')
+    args = parser.parse_args()
+    for path in generate_tables(args.directory):
+        print(f'{path} geschrieben.')
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""Structured results of rolls and of analyses.
+
+Results carry all values of a roll or of a quality level distribution; the
+German text known from `Hero.execute` and `Hero.analyze_talent` is only
+built when the result is converted via `str()`.
+
+Created on Sun Oct 18 15:05:44 2026
+
+@author: Mirko Ulrich
+"""
+
+import json
+
+import numpy as np
+
+
+class RollResult():
+    """Outcome of a single test, either 3D20 on a skill or 1D20 on an attr.
+
+    Parameters
+    ----------
+    name : str
+        Name of the hero.
+    skill : str
+        Tested skill, spell-like or attribute.
+    aims : numpy.ndarray or None
+        Objective(s) rolled against; None for impossible tests.
+    rolls : numpy.ndarray or None
+        Rolled dice; None for impossible tests.
+    success : bool
+        Iff test was accomplished.
+    critical : bool, optional
+        Iff result is outstanding (either success or failure).
+        The default is False.
+    quality_level : int, optional
+        Measurement of success.
+        The default is 0.
+    quality_level_application : int, optional
+        Measurement of success w.r.t. `field of application` rule.
+        The default is 0.
+    modifier : int, optional
+        Modification set to the test.
+        The default is 0.
+    skill_level : int or None, optional
+        Skill level of a 3D20 test, None for an attribute check.
+        The default is None.
+    attributes : tuple, optional
+        Designation of the attributes of a 3D20 test.
+        The default is ().
+    attribute_value : int or None, optional
+        Unmodified value of the checked attribute of a 1D20 check.
+        The default is None.
+    kind_of_test : str, optional
+        Verb phrase for the text, e.g. 'vollführt' for spell-likes.
+        The default is 'absolviert eine Probe auf'.
+    kind_of_result : str, optional
+        Heading of the result, states gifted skills and incompetences.
+        The default is 'Ergebnis'.
+    impossible : bool, optional
+        Iff the test was not rolled due to the modifier.
+        The default is False.
+
+    """
+
+    __slots__ = ('name', 'skill', 'aims', 'rolls', 'success', 'critical',
+                 'quality_level', 'quality_level_application', 'modifier',
+                 'skill_level', 'attributes', 'attribute_value',
+                 'kind_of_test', 'kind_of_result', 'impossible')
+
+    def __init__(self, name, skill, aims, rolls, success, critical=False,
+                 quality_level=0, quality_level_application=0, modifier=0,
+                 skill_level=None, attributes=(), attribute_value=None,
+                 kind_of_test='absolviert eine Probe auf',
+                 kind_of_result='Ergebnis', impossible=False):
+        self.name = name
+        self.skill = skill
+        self.aims = aims
+        self.rolls = rolls
+        self.success = success
+        self.critical = critical
+        self.quality_level = quality_level
+        self.quality_level_application = quality_level_application
+        self.modifier = modifier
+        self.skill_level = skill_level
+        self.attributes = attributes
+        self.attribute_value = attribute_value
+        self.kind_of_test = kind_of_test
+        self.kind_of_result = kind_of_result
+        self.impossible = impossible
+
+    def __repr__(self):
+        return (f'RollResult({self.name!r}, {self.skill!r},'
+                f' success={self.success}, critical={self.critical},'
+                f' quality_level={self.quality_level})')
+
+    def __str__(self):
+        if self.impossible:
+            return (f'Die Erschwernis von {abs(self.modifier)} '
+                    'macht diese Probe unmöglich.')
+        if self.skill_level is None:
+            return self._attribute_text()
+        return self._skill_text()
+
+    def to_dict(self):
+        """Plain values, e.g. for json.
+
+        Returns
+        -------
+        dict
+            All fields; arrays as lists.
+
+        """
+        def plain(value):
+            return value.tolist() if hasattr(value, 'tolist') else value
+
+        return {field: plain(getattr(self, field))
+                for field in self.__slots__}
+
+    def to_json(self, **kwargs):
+        """Serialize `to_dict`, keyword arguments are passed to json.dumps.
+
+        Returns
+        -------
+        str
+            JSON representation.
+
+        """
+        kwargs.setdefault('ensure_ascii', False)
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def _attribute_text(self):
+        """Text of an attribute check, see `Hero.test`."""
+        msg = f'{self.name} testet {self.skill} ({self.attribute_value})'
+        if self.modifier == 0:
+            msg += ':\n'
+        elif self.modifier > 0:
+            msg += f', erleichtert um {abs(self.modifier)}:\n'
+        else:
+            msg += f', erschwert um {abs(self.modifier)}:\n'
+
+        if self.success:
+            msg += '\nGeschafft mit einem Wurf von {}.'.format(*self.rolls)
+        else:
+            msg += '\nNicht geschafft mit einem Wurf von {}.'.format(
+                *self.rolls)
+        return msg
+
+    def _skill_text(self):
+        """Text of a 3D20 test, see `Hero.execute`."""
+        out = ''
+        if self.modifier == 0:
+            test = '{} {} {} (Fertigkeitswert {}).'
+        else:
+            if self.modifier < 0:
+                test = '{} {} {} (Fertigkeitswert {}), um ' +\
+                    str(abs(self.modifier)) + ' erschwert.'
+            else:
+                test = '{} {} {} (Fertigkeitswert {}), um ' +\
+                    str(abs(self.modifier)) + ' erleichtert.'
+        out += test.format(self.name, self.kind_of_test, self.skill,
+                           self.skill_level)
+
+        goal_to_aim = ('\nEigenschaften:\n\t{} - {} -'
+                       ' {}\nZielwerte:\n\t{}').format(
+            *self.attributes, self.aims)
+        out += '\n' + goal_to_aim
+
+        outcome_rng = 'Würfelergebnis:\n\t{}\n'.format(self.rolls)
+        out += '\n' + outcome_rng
+
+        if self.success:
+            if self.critical:
+                final_result = ('{}:\nKritischer Erfolg mit {} ({})'
+                                'Qualitätsstufen.\t:-D'.format(
+                                    self.kind_of_result,
+                                    self.quality_level,
+                                    self.quality_level_application))
+            else:
+                final_result = ('{}:\nErfolg mit '
+                                '{} ({}) Qualitätsstufen.'.format(
+                                    self.kind_of_result,
+                                    self.quality_level,
+                                    self.quality_level_application))
+        else:
+            if self.critical:
+                final_result = '{}:\nPatzer\t>:-|'.format(
+                    self.kind_of_result)
+            else:
+                final_result = ('{}:\nFehlschlag ({} QS)').format(
+                    self.kind_of_result, self.quality_level_application)
+        out += '\n' + final_result
+
+        return out
+
+
+class QSDistribution():
+    """Exact distribution of quality levels of a test.
+
+    Parameters
+    ----------
+    name : str
+        Name of the hero.
+    skill : str
+        Analyzed skill or spell-like.
+    qs_prob : array_like
+        P(#QS=q) for q = 0, ..., 12, whereby q = 0 is a failed test.
+    qs_app_prob : array_like
+        Same as `qs_prob` w.r.t. `field of application` rule.
+    crit_prob : float
+        Probability of a critical success.
+    botch_prob : float
+        Probability of a botch (`Patzer`).
+    modifier : int, optional
+        Modification set to the test.
+        The default is 0.
+    impossible : bool, optional
+        Iff the test can not be taken due to the modifier.
+        The default is False.
+
+    """
+
+    __slots__ = ('name', 'skill', 'qs_prob', 'qs_app_prob', 'crit_prob',
+                 'botch_prob', 'modifier', 'impossible')
+
+    def __init__(self, name, skill, qs_prob, qs_app_prob, crit_prob,
+                 botch_prob, modifier=0, impossible=False):
+        self.name = name
+        self.skill = skill
+        self.qs_prob = np.asarray(qs_prob, dtype=float)
+        self.qs_app_prob = np.asarray(qs_app_prob, dtype=float)
+        self.crit_prob = float(crit_prob)
+        self.botch_prob = float(botch_prob)
+        self.modifier = modifier
+        self.impossible = impossible
+
+    @classmethod
+    def impossible_test(cls, name, skill, modifier):
+        """Distribution of a test, which can not be taken at all.
+
+        Parameters
+        ----------
+        name : str
+            Name of the hero.
+        skill : str
+            Analyzed skill or spell-like.
+        modifier : int
+            Modification set to the test.
+
+        Returns
+        -------
+        QSDistribution
+            Certain failure, flagged as impossible.
+
+        """
+        failure = np.zeros(13)
+        failure[0] = 1.
+        return cls(name, skill, failure, failure.copy(), 0., 0.,
+                   modifier=modifier, impossible=True)
+
+    @property
+    def success_prob(self):
+        """float: Probability to pass the test."""
+        return float(1. - self.qs_prob[0])
+
+    @property
+    def expected_value(self):
+        """float: Expected number of quality levels, failure counts 0."""
+        return float(np.arange(len(self.qs_prob)) @ self.qs_prob)
+
+    @property
+    def expected_value_application(self):
+        """float: Same as `expected_value` w.r.t. field of application."""
+        return float(np.arange(len(self.qs_app_prob)) @ self.qs_app_prob)
+
+    def __repr__(self):
+        return (f'QSDistribution({self.name!r}, {self.skill!r},'
+                f' success_prob={self.success_prob:.4f},'
+                f' expected_value={self.expected_value:.2f})')
+
+    def __str__(self):
+        if self.impossible:
+            return (f'Die Erschwernis von {abs(self.modifier)} '
+                    'macht diese Probe unmöglich.')
+
+        distribution = ('Erfolgsaussichten für ein Probe auf '
+                        f'{self.skill} mit Modifikator {self.modifier}:\n\n')
+
+        results = np.flatnonzero(self.qs_prob)
+        prob = self.qs_prob[results]
+
+        # following string formating
+        delimiter = ' | '
+        upper = '     q   ' + delimiter
+        lower = ' P(#QS=q)' + delimiter
+        for i in range(len(results)):
+            if results[i] < 10:
+                upper += ('  ' + str(results[i]) + '  ' + delimiter)
+            else:
+                upper += ('  ' + str(results[i]) + ' ' + delimiter)
+            lower += (
+                '{:5.2f}'.format(np.round(prob[i]*100, 2))
+                + delimiter)
+        # correct last char
+        upper = upper[:-1]
+        lower = lower[:-1]
+        line = '-' * len(upper)
+
+        distribution += upper + '\n' + line + '\n' + lower + '\n'
+        distribution += ' '*len(line[:-3]) + '[in Prozent]'
+        distribution += f'\nErwartungswert: {self.expected_value:.2f}'
+        return distribution
+
+    def to_dict(self):
+        """Plain values, e.g. for json.
+
+        Returns
+        -------
+        dict
+            Fields, histograms as lists, and the derived probabilities and
+            expected values.
+
+        """
+        return {'name': self.name,
+                'skill': self.skill,
+                # the modifier may be a numpy integer, e.g. from np.arange
+                'modifier': int(self.modifier),
+                'impossible': bool(self.impossible),
+                'qs_prob': self.qs_prob.tolist(),
+                'qs_app_prob': self.qs_app_prob.tolist(),
+                'success_prob': self.success_prob,
+                'crit_prob': self.crit_prob,
+                'botch_prob': self.botch_prob,
+                'expected_value': self.expected_value,
+                'expected_value_application':
+                    self.expected_value_application}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a distribution from `to_dict`.
+
+        Parameters
+        ----------
+        data : dict
+            Plain values, derived entries are ignored.
+
+        Returns
+        -------
+        QSDistribution
+            Restored distribution.
+
+        """
+        return cls(data['name'], data['skill'], data['qs_prob'],
+                   data['qs_app_prob'], data['crit_prob'],
+                   data['botch_prob'], modifier=data.get('modifier', 0),
+                   impossible=data.get('impossible', False))
+
+    def to_json(self, **kwargs):
+        """Serialize `to_dict`, keyword arguments are passed to json.dumps.
+
+        Returns
+        -------
+        str
+            JSON representation.
+
+        """
+        kwargs.setdefault('ensure_ascii', False)
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,448 @@
+# -*- coding: utf-8 -*-
+"""Handle a whole party of heroes, e.g. all characters of a table.
+
+Heroes are expected as <name>.json, written by `Hero.save` or
+`Twinkle.save`. A party-wide overview is available via command line
+    python roster.py [directory] [--modifikator M]
+
+Created on Sun Oct 18 10:02:15 2026
+
+@author: Mirko Ulrich
+"""
+
+import argparse
+import json
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from hero import Hero
+from twinkle import Twinkle
+
+
+def load_roster(directory=pathlib.Path.cwd(), workers=None):
+    """Load every hero stored in `directory`.
+
+    Files are read in parallel. Characters with a profession are loaded as
+    Twinkle, all others as Hero. Files not describing a complete hero are
+    skipped, thus no command line dialogue is started.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory holding <name>.json files.
+        The default is pathlib.Path.cwd(), i.e. current work directory.
+    workers : int or None, optional
+        Number of threads for reading; see
+        concurrent.futures.ThreadPoolExecutor.
+        The default is None.
+
+    Raises
+    ------
+    ValueError
+        Raised when `directory` is not an existing directory.
+
+    Returns
+    -------
+    heroes : list
+        Loaded heroes, sorted by file name.
+    skipped : dict
+        Reason for each skipped file by path.
+
+    """
+    directory = pathlib.Path(directory)
+    if not directory.is_dir():
+        raise ValueError(f'{directory} ist kein gültiges Verzeichnis.')
+
+    files = sorted(directory.glob('*.json'))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        loaded = list(executor.map(_load_file, files))
+    heroes = [hero for hero, _ in loaded if hero is not None]
+    skipped = {file: reason for file, (hero, reason) in zip(files, loaded)
+               if hero is None}
+    return heroes, skipped
+
+
+def party_matrix(heroes, modifier=0):
+    """Determine the chances of every hero for every skill.
+
+    The tests of all heroes are stacked and evaluated in one batched pass,
+    see `Hero._distribution_matrix`.
+
+    Parameters
+    ----------
+    heroes : list
+        Instances of HeroBase, e.g. Hero or CompactHero.
+    modifier : int, optional
+        Modification set to all tests; negative values for a more difficult,
+        positve values for an easier test
+        The default is 0.
+
+    Returns
+    -------
+    success : pandas.DataFrame
+        Probability of success with one row per skill and one column per
+        hero.
+    expected_value : pandas.DataFrame
+        Expected quality level, same layout as `success`.
+
+    """
+    import pandas as pd
+
+    skills = list(Hero.SKILL_CHECKS.keys())
+    names = [hero.name for hero in heroes]
+    if not heroes:
+        empty = pd.DataFrame(index=pd.Index(skills, name='Probe'))
+        return empty, empty.copy()
+
+    matrices = [hero._test_matrix(
+        attribute_source=Hero.SKILL_CHECKS,
+        skill_value_source=hero._skills,
+        modifier=modifier,
+        attribute_index=Hero._SKILL_ATTRIBUTE_INDEX)[1:]
+        for hero in heroes]
+    aims, skill_levels, gifted, incompetent = (
+        np.concatenate(part) for part in zip(*matrices))
+
+    qs_prob, _, _ = Hero._distribution_matrix(aims, skill_levels,
+                                              gifted, incompetent)
+    qs_prob = qs_prob.reshape(len(heroes), len(skills), -1)
+
+    index = pd.Index(skills, name='Probe')
+    success = pd.DataFrame((1 - qs_prob[..., 0]).T,
+                           index=index, columns=names)
+    expected_value = pd.DataFrame(
+        (qs_prob @ np.arange(qs_prob.shape[-1])).T,
+        index=index, columns=names)
+    return success, expected_value
+
+
+def party_table(heroes, modifier=0):
+    """Determine for each skill who is the party's best choice.
+
+    Parameters
+    ----------
+    heroes : list
+        Instances of HeroBase, e.g. Hero or CompactHero, at least one.
+    modifier : int, optional
+        Modification set to all tests.
+        The default is 0.
+
+    Raises
+    ------
+    ValueError
+        Raised when `heroes` is empty.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per skill, naming the hero with the best chance of success
+        and the hero with the best expected quality level, each with the
+        corresponding value.
+
+    """
+    import pandas as pd
+
+    if not heroes:
+        raise ValueError('Keine Helden angegeben.')
+
+    success, expected_value = party_matrix(heroes, modifier)
+    names = np.array(success.columns)
+    best_success = success.to_numpy().argmax(axis=1)
+    best_expected = expected_value.to_numpy().argmax(axis=1)
+    rows = np.arange(len(success))
+    return pd.DataFrame(
+        {'Beste Erfolgschance': names[best_success],
+         'Erfolg': success.to_numpy()[rows, best_success],
+         'Bester Erwartungswert': names[best_expected],
+         'Erwartungswert': expected_value.to_numpy()[rows, best_expected]},
+        index=success.index)
+
+
+def distributions(entries):
+    """Determine the distributions of quality levels of single tests.
+
+    All tests are evaluated in one batched pass.
+
+    Parameters
+    ----------
+    entries : list
+        Tuples (hero, talent, modifier) with any skill or spell-like of the
+        hero, see `Hero._test_row`.
+
+    Returns
+    -------
+    numpy.ndarray
+        P(#QS=q) for q = 0, ..., 12 with shape (len(`entries`), 13).
+
+    """
+    rows = [hero._test_row(talent, modifier)
+            for hero, talent, modifier in entries]
+    aims, skill_levels, gifted, incompetent = (
+        np.array(part) for part in zip(*rows))
+    qs_prob, _, _ = Hero._distribution_matrix(aims, skill_levels,
+                                              gifted, incompetent)
+    return qs_prob
+
+
+def group_test(entries, threshold):
+    """Determine the chances of a group test (Gruppenprobe).
+
+    The quality levels of all members are summed up. An entry may also be a
+    list of tuples for assistance by "best of N": these heroes test
+    simultaneously and only the best result counts.
+
+    Parameters
+    ----------
+    entries : list
+        Tuples (hero, talent, modifier) or lists of such tuples.
+    threshold : int
+        Summed quality levels needed.
+
+    Raises
+    ------
+    ValueError
+        Raised when `entries` is empty.
+
+    Returns
+    -------
+    reach_prob : float
+        Probability to reach at least `threshold` quality levels.
+    sum_prob : numpy.ndarray
+        P(sum of #QS = s) for s = 0, ..., 12 * len(`entries`).
+
+    """
+    if not entries:
+        raise ValueError('Keine Helden angegeben.')
+
+    groups = [entry if isinstance(entry, list) else [entry]
+              for entry in entries]
+    qs_prob = distributions([test for group in groups for test in group])
+
+    sum_prob = np.ones(1)
+    start = 0
+    for group in groups:
+        member_prob = qs_prob[start:start + len(group)]
+        start += len(group)
+        # distribution of the maximum via product of the cumulative ones
+        cumulative = np.cumsum(member_prob, axis=-1).prod(axis=0)
+        best_prob = np.diff(cumulative, prepend=0)
+        sum_prob = np.convolve(sum_prob, best_prob)
+    return float(sum_prob[max(threshold, 0):].sum()), sum_prob
+
+
+def crowd_check(heroes, talent, modifier=0, rng=None):
+    """Perform the same skill test for many heroes at once.
+
+    All rolls are drawn and evaluated in one vectorized pass, e.g. for a
+    whole troop of guards rolling Sinnesschärfe. Impossible tests fail.
+
+    Parameters
+    ----------
+    heroes : list
+        Instances of HeroBase, e.g. Hero or CompactHero from `npc`.
+    talent : str
+        Skill to be tested, key of `Hero.SKILL_CHECKS`.
+    modifier : int or array_like, optional
+        Modification for all heroes or one per hero.
+        The default is 0.
+    rng : int or numpy.random.Generator or None, optional
+        Source of the rolls for the whole crowd.
+        The default is None.
+
+    Raises
+    ------
+    ValueError
+        Raised when `talent` is not a skill.
+
+    Returns
+    -------
+    outcome : pandas.DataFrame
+        One row per hero with the dice used after any reroll ('W1', 'W2',
+        'W3'), 'Erfolg', 'Kritisch' and 'QS'.
+    summary : pandas.Series
+        Counts of successes, failures, critical successes and botches as
+        well as of each quality level.
+
+    """
+    import pandas as pd
+
+    aims, skill_levels, gifted, incompetent = _crowd_matrix(
+        heroes, talent, modifier)
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    events = rng.integers(1, 21, (len(heroes), 3))
+    rerolls = rng.integers(1, 21, (len(heroes), 1))
+    # the outcome shows the dice after the rerolls of gifts and incompetences
+    events = Hero._apply_rerolls(events, aims, gifted, incompetent, rerolls)
+
+    success, critical, quality_level, _ = Hero._perform_test_batch(
+        aims, events, skill_levels)
+    # impossible tests are not even rolled
+    possible = np.all(aims >= 1, axis=-1)
+    success &= possible
+    critical &= possible
+    quality_level = np.where(possible, quality_level, 0)
+
+    outcome = pd.DataFrame(
+        {'W1': events[:, 0], 'W2': events[:, 1], 'W3': events[:, 2],
+         'Erfolg': success, 'Kritisch': critical, 'QS': quality_level},
+        index=pd.Index([hero.name for hero in heroes], name='Held'))
+    histogram = np.bincount(quality_level, minlength=Hero._QS_BINS)
+    summary = pd.Series(
+        [success.sum(), (~success).sum(), (critical & success).sum(),
+         (critical & ~success).sum()] + histogram.tolist(),
+        index=['Erfolge', 'Misserfolge', 'Kritische Erfolge', 'Patzer']
+        + [f'QS {q}' for q in range(len(histogram))])
+    return outcome, summary
+
+
+def crowd_analysis(heroes, talent, modifier=0):
+    """Determine the chances of many heroes for the same skill test.
+
+    Identical tests, frequent among NPCs, are evaluated only once, see
+    `Hero._distribution_matrix`.
+
+    Parameters
+    ----------
+    heroes : list
+        Instances of HeroBase, e.g. Hero or CompactHero from `npc`.
+    talent : str
+        Skill to be tested, key of `Hero.SKILL_CHECKS`.
+    modifier : int or array_like, optional
+        Modification for all heroes or one per hero.
+        The default is 0.
+
+    Raises
+    ------
+    ValueError
+        Raised when `talent` is not a skill.
+
+    Returns
+    -------
+    chances : pandas.DataFrame
+        One row per hero with 'Erfolg', 'Erwartungswert',
+        'Kritischer Erfolg' and 'Patzer'.
+    summary : pandas.Series
+        Expected number of successes, critical successes and botches with
+        the standard deviation of the number of successes.
+
+    """
+    import pandas as pd
+
+    aims, skill_levels, gifted, incompetent = _crowd_matrix(
+        heroes, talent, modifier)
+    qs_prob, crit_prob, botch_prob = Hero._distribution_matrix(
+        aims, skill_levels, gifted, incompetent)
+
+    success_prob = 1 - qs_prob[:, 0]
+    chances = pd.DataFrame(
+        {'Erfolg': success_prob,
+         'Erwartungswert': qs_prob @ np.arange(Hero._QS_BINS),
+         'Kritischer Erfolg': crit_prob,
+         'Patzer': botch_prob},
+        index=pd.Index([hero.name for hero in heroes], name='Held'))
+    summary = pd.Series(
+        [success_prob.sum(),
+         np.sqrt(np.sum(success_prob * (1 - success_prob))),
+         crit_prob.sum(), botch_prob.sum()],
+        index=['Erwartete Erfolge', 'Standardabweichung Erfolge',
+               'Erwartete kritische Erfolge', 'Erwartete Patzer'])
+    return chances, summary
+
+
+def _crowd_matrix(heroes, talent, modifier=0):
+    """Collect the test of one skill for many heroes.
+
+    Parameters
+    ----------
+    heroes : list
+        Instances of HeroBase, e.g. Hero or CompactHero.
+    talent : str
+        Skill to be tested.
+    modifier : int or array_like, optional
+        Modification for all heroes or one per hero.
+        The default is 0.
+
+    Raises
+    ------
+    ValueError
+        Raised when `talent` is not a skill.
+
+    Returns
+    -------
+    aims : numpy.ndarray
+        Modified and capped objectives with shape (N, 3).
+    skill_levels : numpy.ndarray
+        Skill levels with shape (N,).
+    gifted : numpy.ndarray
+        Boolean mask of gifted tests with shape (N,).
+    incompetent : numpy.ndarray
+        Boolean mask of incompetent tests with shape (N,).
+
+    """
+    if talent not in Hero._SKILL_ROWS:
+        raise ValueError('{} ist keine'
+                         ' gültige Fertigkeit.'.format(talent))
+    index = Hero._SKILL_ATTRIBUTE_INDEX[Hero._SKILL_ROWS[talent]]
+    attributes = np.array([hero._attribute_vector for hero in heroes],
+                          dtype=int).reshape(-1, len(Hero.ATTRIBUTES))
+    modifier = np.asarray(modifier)
+    aims = np.minimum(attributes[:, index] + modifier[..., None], 19)
+    skill_levels = np.array([hero._skills[talent] for hero in heroes],
+                            dtype=int)
+    gifted = np.array([talent in hero._gifted for hero in heroes],
+                      dtype=bool)
+    incompetent = np.array([talent in hero._incompetences
+                            for hero in heroes], dtype=bool)
+    return aims, skill_levels, gifted, incompetent
+
+
+def _load_file(file):
+    """Load a single hero from json without command line dialogue.
+
+    Parameters
+    ----------
+    file : pathlib.Path
+        File written by `Hero.save` or `Twinkle.save`.
+
+    Returns
+    -------
+    hero : Hero or Twinkle or None
+        Initiated hero, None if `file` does not describe a complete hero.
+    reason : str or None
+        Why `file` was skipped.
+
+    """
+    try:
+        with open(file, 'r') as source:
+            record = dict(json.load(source), Name=file.stem.replace('_', ' '))
+        # incomplete values raise instead of starting a dialogue
+        kind = Twinkle if 'Profession' in record else Hero
+        hero, = kind.from_records([record])
+    except (OSError, ValueError, TypeError) as error:
+        return None, str(error)
+    return hero, None
+
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(
+        description='Übersicht über die Fertigkeiten einer Heldengruppe.')
+    parser.add_argument('directory', nargs='?', default=pathlib.Path.cwd(),
+                        help='Verzeichnis mit den <name>.json Dateien.')
+    parser.add_argument('-m', '--modifikator', type=int, default=0,
+                        help='Modifikator für alle Proben.')
+    args = parser.parse_args()
+
+    party, skipped = load_roster(args.directory)
+    for file, reason in skipped.items():
+        print(f'{file.name} übersprungen: {reason}')
+    if party:
+        with pd.option_context('display.max_rows', None,
+                               'display.width', None):
+            print(party_table(party, args.modifikator))
+    else:
+        print('Keine Helden gefunden.')
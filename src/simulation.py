@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Monte Carlo estimation of outcomes which are not enumerated exactly.
+
+Trials are run in chunks on a pool of processes. Every chunk rolls from its
+own stream spawned off a single numpy.random.SeedSequence, so a seeded
+simulation yields identical results regardless of the number of workers.
+Only histograms of outcomes (e.g. quality levels) travel between processes,
+thus memory usage is bounded by the chunk size and not by the number of
+trials.
+
+Created on Sun Oct 18 11:48:31 2026
+
+@author: Mirko Ulrich
+"""
+
+import collections
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dice import DiceBuffer
+from hero import Hero
+
+
+class TestScenario():
+    """A single 3D20 test, evaluated like `Hero._perform_test`.
+
+    Instances are picklable and may be passed to `simulate`.
+
+    Parameters
+    ----------
+    aims : numpy.ndarray
+        Objective with shape (3,), already modified and capped.
+    skill_level : int
+        Number of points to compensate high rolls.
+    gifted : bool, optional
+        Iff the tested skill is gifted. The default is False.
+    incompetent : bool, optional
+        Iff the tested skill is an incompetence. The default is False.
+
+    """
+
+    def __init__(self, aims, skill_level, gifted=False, incompetent=False):
+        self.aims = np.asarray(aims)
+        self.skill_level = skill_level
+        self.gifted = gifted
+        self.incompetent = incompetent
+
+    def __call__(self, dice, n):
+        """Roll `n` tests and return the quality level of each."""
+        events = dice.roll((n, 3))
+        rerolls = (dice.roll(n) if self.gifted or self.incompetent
+                   else None)
+        _, _, quality_level, _ = Hero._perform_test_batch(
+            self.aims, events, self.skill_level,
+            gifted=self.gifted, incompetent=self.incompetent,
+            rerolls=rerolls)
+        return quality_level
+
+
+def simulate(scenario, trials=1_000_000, chunk_size=100_000, workers=None,
+             seed=None, tolerance=None, confidence=0.95,
+             bins=Hero._QS_BINS):
+    """Estimate the distribution of outcomes of `scenario` by sampling.
+
+    Chunks are evaluated in order of submission, hence a simulation stopped
+    early by `tolerance` is reproducible as well.
+
+    Parameters
+    ----------
+    scenario : callable
+        Picklable callable `scenario(dice, n)`, returning an integer array of
+        shape (n,) with outcomes from 0 to `bins` - 1, e.g. quality levels;
+        `dice` is an instance of DiceBuffer. An outcome of 0 counts as
+        failure. See TestScenario.
+    trials : int, optional
+        Maximal number of trials.
+        The default is 1_000_000.
+    chunk_size : int, optional
+        Number of trials per chunk, bounds memory usage of each worker.
+        The default is 100_000.
+    workers : int or None, optional
+        Number of processes; 1 runs everything in the calling process.
+        The default is None, i.e. os.cpu_count().
+    seed : int or numpy.random.SeedSequence or None, optional
+        Entropy for all chunks.
+        The default is None.
+    tolerance : float or None, optional
+        Stop as soon as the half width of the confidence interval of the
+        probability of success is at most `tolerance`.
+        The default is None, i.e. always run all trials.
+    confidence : float, optional
+        Confidence level of the reported intervals.
+        The default is 0.95.
+    bins : int, optional
+        Number of distinct outcomes.
+        The default is 13, i.e. quality levels 0 to 12.
+
+    Raises
+    ------
+    ValueError
+        Raised when `trials` or `chunk_size` are not positive or
+        `confidence` is not in (0, 1).
+
+    Returns
+    -------
+    histogram : numpy.ndarray
+        Number of trials per outcome with shape (`bins`,).
+    summary : pandas.DataFrame
+        Estimates with confidence intervals, see `summarize`.
+
+    """
+    if trials < 1 or chunk_size < 1:
+        raise ValueError('Anzahl der Versuche muss positiv sein.')
+    if not 0 < confidence < 1:
+        raise ValueError('Konfidenzniveau muss zwischen 0 und 1 liegen.')
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    workers = workers or os.cpu_count() or 1
+
+    sizes = [min(chunk_size, trials - start)
+             for start in range(0, trials, chunk_size)]
+    histogram = np.zeros(bins, dtype=np.int64)
+
+    if workers == 1:
+        for size in sizes:
+            histogram += _run_chunk(scenario, seed.spawn(1)[0], size, bins)
+            if _converged(histogram, tolerance, confidence):
+                break
+        return histogram, summarize(histogram, confidence)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # at most two chunks per worker in flight
+        pending = collections.deque()
+        sizes = iter(sizes)
+        while True:
+            for size in sizes:
+                pending.append(executor.submit(
+                    _run_chunk, scenario, seed.spawn(1)[0], size, bins))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            histogram += pending.popleft().result()
+            if _converged(histogram, tolerance, confidence):
+                for future in pending:
+                    future.cancel()
+                break
+    return histogram, summarize(histogram, confidence)
+
+
+def summarize(histogram, confidence=0.95):
+    """Derive estimates with confidence intervals from a histogram.
+
+    Probabilities use the Wilson score interval, the expected value the
+    normal approximation.
+
+    Parameters
+    ----------
+    histogram : numpy.ndarray
+        Number of trials per outcome.
+    confidence : float, optional
+        Confidence level of the intervals.
+        The default is 0.95.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rows 'Erfolg', 'Erwartungswert' and 'P(QS=q)' for every outcome q,
+        columns 'Schätzung', 'Untere Grenze' and 'Obere Grenze'.
+
+    """
+    histogram = np.asarray(histogram)
+    trials = histogram.sum()
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+
+    outcomes = np.arange(len(histogram))
+    counts = np.append(trials - histogram[0], histogram)
+    estimate, lower, upper = _wilson(counts, trials, z)
+
+    mean = histogram @ outcomes / trials
+    variance = histogram @ (outcomes - mean)**2 / max(trials - 1, 1)
+    half_width = z * np.sqrt(variance / trials)
+
+    index = (['Erfolg'] + [f'P(QS={q})' for q in outcomes]
+             + ['Erwartungswert'])
+    return pd.DataFrame(
+        {'Schätzung': np.append(estimate, mean),
+         'Untere Grenze': np.append(lower, mean - half_width),
+         'Obere Grenze': np.append(upper, mean + half_width)},
+        index=index)
+
+
+def _run_chunk(scenario, seed, size, bins):
+    """Evaluate one chunk of trials; executed in a worker process."""
+    dice = DiceBuffer(np.random.default_rng(seed), size=4 * size)
+    outcomes = scenario(dice, size)
+    return np.bincount(outcomes, minlength=bins)[:bins]
+
+
+def _wilson(successes, trials, z):
+    """Wilson score interval; returns estimate, lower and upper bound."""
+    estimate = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (estimate + z**2 / (2 * trials)) / denominator
+    half_width = (z * np.sqrt(estimate * (1 - estimate) / trials
+                              + z**2 / (4 * trials**2)) / denominator)
+    return estimate, center - half_width, center + half_width
+
+
+def _converged(histogram, tolerance, confidence):
+    """Check whether the success interval is narrow enough."""
+    if tolerance is None:
+        return False
+    trials = histogram.sum()
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    _, lower, upper = _wilson(trials - histogram[0], trials, z)
+    return (upper - lower) / 2 <= tolerance
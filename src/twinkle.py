@@ -10,7 +10,8 @@ import pathlib
 
 import numpy as np
 
-from hero import Hero
+from hero import Hero, HeroValidationError
+from results import RollResult
 
 
 class Twinkle(Hero):
@@ -65,18 +66,22 @@ class Twinkle(Hero):
          and 'Fertigkeistwerte'. See __ask_for_twinkle_stuff for more details
          on format.
         The default is {}.
+    rng : int or numpy.random.Generator or None, optional
+        Source of all rolls of this hero, see `Hero.rng`.
+        The default is None.
 
         """
+    PROFESSIONS = ('Geweihter', 'Geweihte', 'Hexer', 'Hexe', 'Zauberer',
+                   'Zauberin')
 
     def __init__(self, name, twinkle_variant,
                  attribute_values=[], skill_values=[],
                  incompetences=None, gifted=None,
-                 twinkle_abilities={}):
-        assert twinkle_variant in ['Geweihter', 'Geweihte',
-                                   'Hexer', 'Hexe', 'Zauberer', 'Zauberin'],\
+                 twinkle_abilities={}, rng=None):
+        assert twinkle_variant in self.PROFESSIONS,\
             '{} ist keine unterstützte Rolle.'.format(twinkle_variant)
         super().__init__(name, attribute_values, skill_values,
-                         incompetences, gifted)
+                         incompetences, gifted, rng)
         self.profession = twinkle_variant
 
         if len(twinkle_abilities.keys()) == 0:
@@ -85,7 +90,7 @@ class Twinkle(Hero):
             self._twinkle_stuff = twinkle_abilities
 
     @classmethod
-    def _from_json(cls, name, stats):
+    def _from_json(cls, name, stats, rng=None):
         """Initate a object of Twinkle from given `name` and specified `stats`.
 
         Since incompetences and gifted skills are optional, `stats` is checked
@@ -102,6 +107,9 @@ class Twinkle(Hero):
             and stats:'Fertigkeiten' -> b=[int], with len(b)=59
             and stats:'Funzelfertigkeiten' -> dict;
             may contain Values for 'Unfähigkeiten' and 'Begabungen'.
+        rng : int or numpy.random.Generator or None, optional
+            Source of all rolls of the hero, see `Hero.rng`.
+            The default is None.
 
         Returns
         -------
@@ -125,10 +133,190 @@ class Twinkle(Hero):
                    list(stats['Fertigkeiten'].values()),
                    incompetences,
                    gifted_talents,
-                   stats['Funzelfertigkeiten'])
+                   stats['Funzelfertigkeiten'],
+                   rng=rng)
         return hero
 
-    def analyze_spelllike(self, spell, modifier=0):
+    @classmethod
+    def from_arrays(cls, names, professions, attribute_values, skill_values,
+                    twinkle_abilities, incompetences=None, gifted=None,
+                    rng=None):
+        """Create many twinkles at once, without any command line dialogue.
+
+        Extends `Hero.from_arrays` by profession and spell-likes; gifted
+        spell-likes are permitted.
+
+        Parameters
+        ----------
+        names : list
+            Names of the N twinkles.
+        professions : list
+            Category of supernaturality for each twinkle, see `PROFESSIONS`.
+        attribute_values : array_like
+            See `Hero.from_arrays`.
+        skill_values : array_like
+            See `Hero.from_arrays`.
+        twinkle_abilities : list
+            Spell-likes of each twinkle, dicts with keys 'Proben' and
+            'Fertigkeitswerte'.
+        incompetences : list or None, optional
+            See `Hero.from_arrays`.
+            The default is None.
+        gifted : list or None, optional
+            See `Hero.from_arrays`.
+            The default is None.
+        rng : int or numpy.random.Generator or None, optional
+            See `Hero.from_arrays`.
+            The default is None.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for invalid values, see `Hero.from_arrays`.
+
+        Returns
+        -------
+        list
+            Initiated twinkles.
+
+        """
+        count = len(names)
+        if len(professions) != count or len(twinkle_abilities) != count:
+            raise HeroValidationError(
+                f'Es werden {count} Professionen und Funzelfertigkeiten'
+                ' benötigt.', 'Profession')
+        rows = [row for row, profession in enumerate(professions)
+                if profession not in cls.PROFESSIONS]
+        if rows:
+            raise HeroValidationError('Nicht unterstützte Rolle.',
+                                      'Profession', rows)
+        cls._check_twinkle_abilities(twinkle_abilities)
+
+        attribute_values, skill_values, incompetences, gifted = \
+            cls._validate_arrays(
+                names, attribute_values, skill_values, incompetences, gifted,
+                permitted=[abilities['Proben']
+                           for abilities in twinkle_abilities])
+        rngs = cls._spawn_batch(rng, count)
+
+        twinkles = []
+        for i, name in enumerate(names):
+            twinkle = cls.__new__(cls)
+            twinkle._assemble(
+                name, dict(zip(cls.ATTRIBUTES, attribute_values[i].tolist())),
+                dict(zip(cls.SKILL_CHECKS, skill_values[i].tolist())),
+                incompetences[i], gifted[i], rngs[i], attribute_values[i])
+            twinkle.profession = professions[i]
+            # a copy, later changes by the caller would bypass
+            # _invalidate_objectives
+            abilities = twinkle_abilities[i]
+            twinkle._twinkle_stuff = dict(
+                abilities,
+                Proben={spell: tuple(check) for spell, check
+                        in abilities['Proben'].items()},
+                Fertigkeitswerte={spell: int(level) for spell, level
+                                  in abilities['Fertigkeitswerte'].items()})
+            twinkles.append(twinkle)
+        return twinkles
+
+    @classmethod
+    def from_records(cls, records, rng=None):
+        """Create many twinkles from dictionaries, e.g. parsed json.
+
+        Parameters
+        ----------
+        records : list
+            Dictionaries as written by `save`, additionally with key 'Name'.
+        rng : int or numpy.random.Generator or None, optional
+            See `Hero.from_arrays`.
+            The default is None.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for missing keys or invalid values.
+
+        Returns
+        -------
+        list
+            Initiated twinkles.
+
+        """
+        records = list(records)
+        for field in ('Profession', 'Funzelfertigkeiten'):
+            rows = [row for row, record in enumerate(records)
+                    if field not in record]
+            if rows:
+                raise HeroValidationError(f'{field} fehlt.', field, rows)
+        names, attributes, skills, incompetences, gifted = \
+            cls._collect_records(records)
+        return cls.from_arrays(
+            names, [record['Profession'] for record in records],
+            attributes, skills,
+            [record['Funzelfertigkeiten'] for record in records],
+            incompetences, gifted, rng=rng)
+
+    @classmethod
+    def _check_twinkle_abilities(cls, twinkle_abilities):
+        """Validate spell-likes of a batch, see `from_arrays`.
+
+        Parameters
+        ----------
+        twinkle_abilities : list
+            Spell-likes of each twinkle.
+
+        Raises
+        ------
+        HeroValidationError
+            Raised for missing keys, unknown attributes or skill levels,
+            which are no integers or out of range.
+
+        Returns
+        -------
+        None.
+
+        """
+        field = 'Funzelfertigkeiten'
+        rows = []
+        for row, abilities in enumerate(twinkle_abilities):
+            try:
+                checks = abilities['Proben']
+                levels = abilities['Fertigkeitswerte']
+                legal = (checks.keys() == levels.keys()
+                         and all(len(check) == 3
+                                 and set(check) <= set(cls.ATTRIBUTES)
+                                 for check in checks.values()))
+            except (KeyError, TypeError, AttributeError):
+                legal = False
+            if not legal:
+                rows.append(row)
+        if rows:
+            raise HeroValidationError(
+                f'{field} benötigen gleiche Einträge in Proben und'
+                ' Fertigkeitswerte mit je drei Eigenschaften.', field, rows)
+
+        levels = [value for abilities in twinkle_abilities
+                  for value in abilities['Fertigkeitswerte'].values()]
+        owners = np.repeat(np.arange(len(twinkle_abilities)),
+                           [len(abilities['Fertigkeitswerte'])
+                            for abilities in twinkle_abilities])
+        # same as _checked_matrix, but values come as single objects
+        integral = np.array([isinstance(value, (int, np.integer))
+                             and not isinstance(value, bool)
+                             for value in levels], dtype=bool)
+        rows = np.unique(owners[~integral])
+        if rows.size:
+            raise HeroValidationError(
+                f'{field} müssen ganze Zahlen sein.', field, rows.tolist())
+
+        levels = np.array(levels, dtype=int)
+        rows = np.unique(owners[(levels < 0) | (levels > 25)])
+        if rows.size:
+            raise HeroValidationError(
+                'Werte für Funzelfertigkeiten müssen im Bereich von 0 bis 25'
+                ' liegen.', field, rows.tolist())
+
+    def analyze_spelllike(self, spell, modifier=0, mode='cube'):
         """Visualize the probability of spell-like with plot and string.
 
         Wrapper for `Hero._analyze_success`, specifies the source for the
@@ -142,6 +330,9 @@ class Twinkle(Hero):
             Modification set to the test; negative values for a more difficult,
             positve values for an easier test
             The default is 0.
+        mode : str, optional
+            Kind of plot, see `Hero.analyze_talent`.
+            The default is 'cube'.
 
         Returns
         -------
@@ -151,11 +342,250 @@ class Twinkle(Hero):
 
         """
         return self._analyze_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifier=modifier, mode=mode)
+
+    def analyze_spelllike_result(self, spell, modifier=0):
+        """Determine the distribution of `analyze_spelllike` without plot.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be analyzed.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        QSDistribution
+            Distribution of quality levels, formatted by `str()`.
+
+        """
+        return self._distribution_result(
             spell,
             attribute_source=self._twinkle_stuff['Proben'],
             skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
             modifier=modifier)
 
+    def render_spelllike(self, spell, modifier=0, fmt='png', path=None,
+                         mode='cube'):
+        """Render the plot of `analyze_spelllike` headless as image.
+
+        Wrapper for `Hero._render_success`, see `Hero.render_talent`.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be analyzed.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+        fmt : str, optional
+            Image format, 'png' or 'svg'.
+            The default is 'png'.
+        path : str or pathlib.Path or None, optional
+            File to write the image to additionally.
+            The default is None.
+        mode : str, optional
+            Kind of plot, see `Hero.analyze_talent`.
+            The default is 'cube'.
+
+        Returns
+        -------
+        bytes
+            Content of the image.
+
+        """
+        return self._render_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifier=modifier, fmt=fmt, path=path, mode=mode)
+
+    def sweep_spelllike(self, spell, modifiers=range(-10, 6)):
+        """Determine the chances of a spell-like for a range of modifiers.
+
+        Wrapper for `Hero._sweep_success`, specifies the source for the
+        combination of attributes.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be analyzed.
+        modifiers : iterable of int, optional
+            Modifications to evaluate; negative values for a more difficult,
+            positve values for an easier test.
+            The default is range(-10, 6).
+
+        Returns
+        -------
+        tuple
+            See `Hero._sweep_success`.
+
+        """
+        return self._sweep_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifiers=modifiers)
+
+    def simulate_spelllike(self, spell, modifier=0, **options):
+        """Estimate the chances of a spell-like by Monte Carlo simulation.
+
+        Wrapper for `Hero._simulate_success`, specifies the source for the
+        combination of attributes.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be simulated.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+        **options
+            Passed to `simulation.simulate`.
+
+        Returns
+        -------
+        tuple
+            See `simulation.simulate`.
+
+        """
+        return self._simulate_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifier=modifier, **options)
+
+    def extended_spelllike(self, spell, target, attempts, modifier=0,
+                           penalty=0, abort_on_botch=True):
+        """Determine the chances of an extended test on a spell-like.
+
+        Wrapper for `Hero._extended_success`, specifies the source for the
+        combination of attributes.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be tested.
+        target : int
+            Accumulated quality levels needed.
+        attempts : int
+            Maximal number of tests.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each further test.
+            The default is 0.
+        abort_on_botch : bool, optional
+            Iff a botch fails the whole extended test.
+            The default is True.
+
+        Returns
+        -------
+        tuple
+            See `Hero._extended_success`.
+
+        """
+        return self._extended_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            target=target, attempts=attempts, modifier=modifier,
+            penalty=penalty, abort_on_botch=abort_on_botch)
+
+    def retry_spelllike(self, spell, modifier=0, penalty=1, attempts=None,
+                        abort_on_botch=True):
+        """Determine the chances of retrying a failed spell-like.
+
+        Wrapper for `Hero._retry_success`, specifies the source for the
+        combination of attributes.
+
+        Parameters
+        ----------
+        spell : str
+            State the spell-like to be tested.
+        modifier : int, optional
+            Modification set to the first test.
+            The default is 0.
+        penalty : int, optional
+            Additional difficulty for each retry.
+            The default is 1.
+        attempts : int or None, optional
+            Maximal number of tests.
+            The default is None, i.e. until the test becomes impossible.
+        abort_on_botch : bool, optional
+            Iff a botch prevents any further retry.
+            The default is True.
+
+        Returns
+        -------
+        tuple
+            See `Hero._retry_success`.
+
+        """
+        return self._retry_success(
+            spell,
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifier=modifier, penalty=penalty, attempts=attempts,
+            abort_on_botch=abort_on_botch)
+
+    def analyze_all_spelllikes(self, modifier=0):
+        """Summarize the chances of all spell-likes, without any plot.
+
+        Wrapper for `Hero._analyze_all`, specifies the source for the
+        combination of attributes.
+
+        Parameters
+        ----------
+        modifier : int, optional
+            Modification set to all tests; negative values for a more
+            difficult, positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        pandas.DataFrame
+            See `Hero._analyze_all`.
+
+        """
+        return self._analyze_all(
+            attribute_source=self._twinkle_stuff['Proben'],
+            skill_value_source=self._twinkle_stuff['Fertigkeitswerte'],
+            modifier=modifier)
+
+    def _ability_sources(self, talent):
+        """Look up dictionaries for skills as well as spell-likes.
+
+        Parameters
+        ----------
+        talent : str
+            Skill or spell-like to be tested.
+
+        Raises
+        ------
+        ValueError
+            Raised when `talent` is neither a skill nor a known spell-like.
+
+        Returns
+        -------
+        tuple
+            See `Hero._ability_sources`.
+
+        """
+        if talent in self._twinkle_stuff['Proben']:
+            return (self._twinkle_stuff['Proben'],
+                    self._twinkle_stuff['Fertigkeitswerte'])
+        return super()._ability_sources(talent)
+
     def update_special_abilities(self, also_permitted=[]):
         """Initiate command line dialogue to update gifted and incompetences.
 
@@ -221,6 +651,7 @@ class Twinkle(Hero):
         if response == 'j':
             self._twinkle_stuff['Proben'].pop(spell)
             self._twinkle_stuff['Fertigkeitswerte'].pop(spell)
+            self._invalidate_objectives()
             print('{} wurde gelöscht.'.format(spell))
         else:
             print('Keine Werte gelöscht.')
@@ -229,6 +660,7 @@ class Twinkle(Hero):
         """Initiate command line dialog to add new spell-like; may see init."""
         self._twinkle_stuff = self.__ask_for_twinkle_stuff(
             twinkle_dict=self._twinkle_stuff)
+        self._invalidate_objectives()
 
     def update_spelllike(self, spell: str, by=1):
         """Update value for specified spell-like by given integer.
@@ -297,6 +729,26 @@ class Twinkle(Hero):
         str
             Formatted result of the skill test.
 
+        """
+        return str(self.perform_result(spell_like, modifier))
+
+    def perform_result(self, spell_like: str, modifier=0):
+        """Perform a spell-like like `perform`, but keep the values.
+
+        Parameters
+        ----------
+        spell_like : str
+            State the spell-like to be tested.
+        modifier : int, optional
+            Modification set to the test; negative values for a more difficult,
+            positve values for an easier test
+            The default is 0.
+
+        Returns
+        -------
+        RollResult
+            Dice, objectives, success, crit and quality levels of the test.
+
         """
         # estimate objectives for rolling
         objective, impossible = self._estimae_objective(
@@ -304,11 +756,14 @@ class Twinkle(Hero):
             attribute_source=self._twinkle_stuff['Proben'])
 
         if impossible:
-            msg = ('Die Erschwernis von {} '
-                   'macht diese Probe unmöglich.'.format(abs(modifier)))
-            return msg
+            return RollResult(
+                self.name, spell_like, None, None, False, modifier=modifier,
+                skill_level=self._twinkle_stuff[
+                    'Fertigkeitswerte'][spell_like],
+                attributes=tuple(self._twinkle_stuff['Proben'][spell_like]),
+                kind_of_test='vollführt', impossible=True)
 
-        _3w20 = np.random.randint(1, 21, 3)
+        _3w20 = self.dice.roll(3)
 
         # Zufallsereignis auswerten
         succ, crit, quality_level, _ = self._perform_test(
@@ -316,8 +771,7 @@ class Twinkle(Hero):
             skill_level=self._twinkle_stuff['Fertigkeitswerte'][spell_like],
             gifted=(spell_like in self._gifted))
 
-        # Ausgabe bestimmen
-        out = self._format_outcome(
+        return self._roll_result(
             skill=spell_like,
             goals=objective,
             random_event=_3w20,
@@ -328,7 +782,6 @@ class Twinkle(Hero):
             quality_level=(quality_level, quality_level),
             kind_of_test='vollführt',
             modification=modifier)
-        return out
 
     def save(self, directory='C:/Users/49162/Documents/RolePlay/PnP/DSA'):
         """Store character describing dictionaries as json on harddrive.
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Make the modules of src importable, they are not installed as package."""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / 'src'))
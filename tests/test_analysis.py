@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Analyses of a single hero over modifiers, skills and attempts."""
+
+import numpy as np
+import pytest
+
+from hero import Hero
+
+
+TALENTS = ['Klettern', 'Zechen', 'Schwimmen']
+
+
+def _hero():
+    rng = np.random.default_rng(8)
+    return Hero('A', rng.integers(8, 16, 8).tolist(),
+                rng.integers(0, 16, 59).tolist(), incompetences={'Zechen'},
+                gifted={'Klettern'}, rng=1)
+
+
+@pytest.mark.parametrize('talent', TALENTS)
+def test_sweep_is_monotonic_and_matches_single_tests(talent):
+    hero = _hero()
+    modifiers, qs_prob, success_prob, expected_value = hero.sweep_talent(
+        talent, range(-20, 8))
+    np.testing.assert_array_equal(modifiers, np.arange(-20, 8))
+    assert np.all(np.diff(success_prob) >= -1e-12)
+    assert np.all(np.diff(expected_value) >= -1e-12)
+    assert success_prob[0] == 0
+    for i in (0, 10, 20, 27):
+        single = hero.analyze_talent_result(talent, modifiers[i])
+        np.testing.assert_allclose(qs_prob[i], single.qs_prob, atol=1e-12)
+        assert success_prob[i] == pytest.approx(single.success_prob)
+
+
+@pytest.mark.parametrize('modifier', [-3, 0, 2])
+def test_analyze_all_rows_match_single_analyses(modifier):
+    hero = _hero()
+    table = hero.analyze_all(modifier)
+    assert len(table) == len(Hero.SKILL_CHECKS)
+    for talent in TALENTS:
+        row, single = table.loc[talent], hero.analyze_talent_result(
+            talent, modifier)
+        assert row['Fertigkeitswert'] == hero._skills[talent]
+        assert row['Erfolg'] == pytest.approx(single.success_prob)
+        assert row['Erwartungswert'] == pytest.approx(single.expected_value)
+        assert row['Kritischer Erfolg'] == pytest.approx(single.crit_prob)
+        assert row['Patzer'] == pytest.approx(single.botch_prob)
+
+
+@pytest.mark.parametrize('talent', TALENTS)
+def test_retry_without_penalty_repeats_the_single_test(talent):
+    hero = _hero()
+    success = hero.analyze_talent_result(talent, -1).success_prob
+    attempt_prob, success_prob, _ = hero.retry_talent(talent, -1, penalty=0,
+                                                      attempts=1)
+    assert success_prob == pytest.approx(success)
+    np.testing.assert_allclose(attempt_prob, [success])
+    # independent attempts when botches do not end the series
+    attempt_prob, success_prob, _ = hero.retry_talent(
+        talent, -1, penalty=0, attempts=3, abort_on_botch=False)
+    np.testing.assert_allclose(
+        attempt_prob, success * (1 - success) ** np.arange(3))
+    assert success_prob == pytest.approx(1 - (1 - success) ** 3)
+
+
+def test_retry_needs_a_limit():
+    with pytest.raises(ValueError):
+        _hero().retry_talent('Klettern', penalty=0)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Bulk construction via `Hero.from_arrays` and `Twinkle.from_arrays`."""
+
+import numpy as np
+import pytest
+
+from compact import CompactHero
+from hero import Hero, HeroValidationError
+import npc
+from twinkle import Twinkle
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int8])
+def test_small_dtypes_allow_negative_modifiers(dtype):
+    attributes = np.full((1, 8), 12, dtype=dtype)
+    skills = np.full((1, 59), 5, dtype=dtype)
+    hero, = Hero.from_arrays(['A'], attributes, skills, rng=1)
+
+    assert hero._attribute_vector.dtype == np.int_
+    np.testing.assert_array_equal(hero.execute_result('Zechen', -1).aims,
+                                  [11, 11, 11])
+    assert hero.execute_result('Zechen', -130).impossible
+    assert hero.analyze_talent_result('Zechen', -12).impossible
+
+
+def test_npcs_allow_large_penalties():
+    guard, = npc.generate_npcs('Wache', 1, seed=3, compact=False)
+    assert 'unmöglich' in guard.execute('Zechen', -130)
+
+
+def test_empty_batches():
+    assert Hero.from_arrays([], [], []) == []
+    assert CompactHero.from_arrays([], np.empty((0, 8)), []) == []
+    assert Twinkle.from_arrays([], [], [], [], []) == []
+    with pytest.raises(HeroValidationError):
+        Hero.from_arrays(['A'], [], [])
+
+
+def test_gifted_and_incompetent_at_once_is_rejected():
+    with pytest.raises(HeroValidationError) as error:
+        Hero.from_arrays(['A', 'B'], np.full((2, 8), 12),
+                         np.full((2, 59), 5),
+                         incompetences=[set(), {'Zechen'}],
+                         gifted=[{'Zechen'}, {'Zechen'}])
+    assert error.value.rows == [1]
+
+
+def test_distribution_matrix_refuses_combined_case():
+    with pytest.raises(ValueError):
+        Hero._distribution_matrix(np.full((1, 3), 12), np.array([5]),
+                                  gifted=[True], incompetent=[True])
+
+
+def _abilities(level):
+    return {'Proben': {'Hexenblick': ['Mut', 'Intuition', 'Charisma']},
+            'Fertigkeitswerte': {'Hexenblick': level}}
+
+
+def test_spell_like_levels_must_be_integers():
+    with pytest.raises(HeroValidationError) as error:
+        Twinkle.from_arrays(['A', 'B'], ['Hexe', 'Hexe'],
+                            np.full((2, 8), 12), np.full((2, 59), 5),
+                            [_abilities(7), _abilities(7.5)])
+    assert error.value.rows == [1]
+
+
+def test_spell_likes_are_copied():
+    abilities = _abilities(7)
+    twinkle, = Twinkle.from_arrays(['A'], ['Hexe'], np.full((1, 8), 12),
+                                   np.full((1, 59), 5), [abilities])
+    before = twinkle.analyze_spelllike_result('Hexenblick')
+
+    abilities['Fertigkeitswerte']['Hexenblick'] = 0
+    abilities['Proben']['Hexenblick'][0] = 'Klugheit'
+
+    after = twinkle.analyze_spelllike_result('Hexenblick')
+    np.testing.assert_array_equal(before.qs_prob, after.qs_prob)
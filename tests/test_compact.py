@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Array-backed heroes of `compact.CompactHero`."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from compact import CompactHero
+from hero import Hero, HeroValidationError
+
+
+def _hero():
+    rng = np.random.default_rng(5)
+    return Hero('A', rng.integers(8, 16, 8).tolist(),
+                rng.integers(0, 15, 59).tolist(),
+                incompetences={'Zechen'}, gifted={'Klettern'}, rng=1)
+
+
+def test_compact_hero_has_no_dictionary_slots():
+    compact = CompactHero.from_hero(_hero())
+    slots = {slot for cls in type(compact).__mro__
+             for slot in getattr(cls, '__slots__', ())}
+
+    assert slots.isdisjoint(Hero.__slots__)
+    assert not hasattr(compact, '__dict__')
+
+
+def test_round_trip_keeps_values():
+    hero = _hero()
+    compact = CompactHero.from_hero(hero)
+    again = compact.to_hero()
+
+    assert dict(compact._attributes) == hero._attributes
+    assert dict(compact._skills) == hero._skills
+    assert again._attributes == hero._attributes
+    assert again._skills == hero._skills
+    assert again._gifted == hero._gifted
+    assert again._incompetences == hero._incompetences
+
+
+def test_pickle_round_trip():
+    compact = CompactHero.from_hero(_hero())
+    clone = pickle.loads(pickle.dumps(compact))
+
+    assert dict(clone._skills) == dict(compact._skills)
+    assert set(clone._gifted) == {'Klettern'}
+    np.testing.assert_array_equal(
+        clone.analyze_talent_result('Zechen').qs_prob,
+        compact.analyze_talent_result('Zechen').qs_prob)
+
+
+def test_compact_analysis_matches_hero():
+    hero = _hero()
+    compact = CompactHero.from_hero(hero)
+    for talent in ('Zechen', 'Klettern', 'Schwimmen'):
+        for modifier in (-3, 0, 2):
+            expected = hero.analyze_talent_result(talent, modifier)
+            result = compact.analyze_talent_result(talent, modifier)
+            np.testing.assert_array_equal(result.qs_prob, expected.qs_prob)
+            assert result.botch_prob == expected.botch_prob
+    assert compact.analyze_all().equals(hero.analyze_all())
+
+
+@pytest.mark.parametrize('attributes, skills, options', [
+    ([12.7] + [12] * 7, [5] * 59, {}),
+    ([12] * 8, [5] * 58 + [26], {}),
+    ([12] * 7, [5] * 59, {}),
+    ([12] * 8, [5] * 59, {'gifted': ['Zechen'],
+                          'incompetences': ['Zechen']}),
+    ([12] * 8, [5] * 59, {'gifted': ['Flugsalbe']}),
+])
+def test_compact_hero_refuses_what_hero_refuses(attributes, skills,
+                                                options):
+    with pytest.raises(HeroValidationError):
+        CompactHero('A', attributes, skills, **options)
+    with pytest.raises(HeroValidationError):
+        Hero.from_arrays(['A'], [attributes], [skills],
+                         **{key: [value] for key, value in options.items()})
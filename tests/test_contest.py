@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Competitive tests of `contest` against all combinations of results."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from contest import contest, contest_roster
+from hero import Hero
+
+
+def _heroes():
+    rng = np.random.default_rng(11)
+    return [Hero(name, rng.integers(9, 16, 8).tolist(),
+                 rng.integers(2, 14, 59).tolist(), gifted=gifted, rng=1)
+            for name, gifted in [('A', {'Klettern'}), ('B', None),
+                                 ('C', {'Zechen'})]]
+
+
+def _qs_prob(hero, talent, modifier):
+    return hero.analyze_talent_result(talent, modifier).qs_prob
+
+
+@pytest.mark.parametrize('modifiers', [(0, 0), (2, -3)])
+def test_contest_matches_enumeration(modifiers):
+    hero, opponent, _ = _heroes()
+    mine = _qs_prob(hero, 'Klettern', modifiers[0])
+    theirs = _qs_prob(opponent, 'Zechen', modifiers[1])
+
+    outcome = np.zeros(3)
+    difference = np.zeros(25)
+    for q, r in itertools.product(range(13), repeat=2):
+        prob = mine[q] * theirs[r]
+        outcome[0 if q > r else 1 if q == r else 2] += prob
+        difference[q - r + 12] += prob
+
+    *result, difference_prob = contest(hero, 'Klettern', opponent,
+                                       'Zechen', *modifiers)
+    np.testing.assert_allclose(result, outcome, atol=1e-12)
+    np.testing.assert_allclose(difference_prob, difference, atol=1e-12)
+
+
+def test_contest_roster_matches_single_contests():
+    hero, *opponents = _heroes()
+    table = contest_roster(hero, 'Klettern', opponents, 'Zechen', 1, -1)
+    for opponent in opponents:
+        win, draw, loss, difference = contest(hero, 'Klettern', opponent,
+                                              'Zechen', 1, -1)
+        row = table.loc[opponent.name]
+        assert row['Sieg'] == pytest.approx(win)
+        assert row['Unentschieden'] == pytest.approx(draw)
+        assert row['Niederlage'] == pytest.approx(loss)
+        assert row['Erwartete Differenz'] == pytest.approx(
+            difference @ np.arange(-12, 13))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Pre-generated dice of `dice.DiceBuffer`."""
+
+import pickle
+import threading
+
+import numpy as np
+import pytest
+
+from dice import DiceBuffer
+
+
+def _plain(seed, size, refills):
+    """Dice of the generator itself, drawn `size` at a time."""
+    rng = np.random.default_rng(seed)
+    return np.concatenate([rng.integers(1, 21, size)
+                           for _ in range(refills)])
+
+
+def test_rolls_follow_the_generator():
+    dice = DiceBuffer(np.random.default_rng(4), size=5)
+    # requests end before, exactly at and behind the refills
+    rolls = [dice.roll(3), dice.roll(2), dice.roll((2, 2)), dice.roll(1),
+             dice.roll(12), dice.roll(3)]
+    assert [roll.shape for roll in rolls] == [(3,), (2,), (2, 2), (1,),
+                                              (12,), (3,)]
+    np.testing.assert_array_equal(
+        np.concatenate([roll.ravel() for roll in rolls]),
+        _plain(4, 5, 5))
+    assert dice.remaining() == 0
+
+
+def test_roll_across_two_refills():
+    dice = DiceBuffer(7, size=4)
+    first = dice.roll(3)
+    spanning = dice.roll(6)
+    np.testing.assert_array_equal(np.concatenate([first, spanning]),
+                                  _plain(7, 4, 3)[:9])
+    assert dice.remaining() == 3
+
+
+def test_rolls_are_copies():
+    dice = DiceBuffer(1, size=8)
+    dice.roll(3)[:] = 0
+    np.testing.assert_array_equal(dice.roll(5), _plain(1, 8, 1)[3:])
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        DiceBuffer(size=0)
+
+
+def test_threads_share_a_buffer():
+    dice = DiceBuffer(2, size=7)
+    rolls = []
+
+    def roll():
+        for _ in range(500):
+            rolls.append(dice.roll(3))
+
+    threads = [threading.Thread(target=roll) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # every die is handed out exactly once
+    handed_out = np.sort(np.concatenate(rolls))
+    np.testing.assert_array_equal(handed_out,
+                                  np.sort(_plain(2, 7, 6000 // 7 + 1)[:6000]))
+
+
+def test_buffer_can_be_pickled():
+    dice = DiceBuffer(3, size=6)
+    dice.roll(4)
+    clone = pickle.loads(pickle.dumps(dice))
+    np.testing.assert_array_equal(clone.roll(5), dice.roll(5))
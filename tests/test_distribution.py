@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Exact distributions of quality levels, see `Hero._qs_distribution`."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from hero import Hero
+
+
+KINDS = [(False, False), (True, False), (False, True)]
+
+
+@pytest.mark.parametrize('gifted, incompetent', KINDS)
+def test_cached_joint_matches_direct_computation(gifted, incompetent):
+    aims = np.array([[12, 14, 9], [19, 1, 5], [12, 14, 9], [3, 3, 18]])
+    direct = Hero._joint_distribution(aims, gifted, incompetent)
+    cached = Hero._cached_joint(aims, gifted, incompetent)
+    np.testing.assert_array_equal(cached, direct)
+    # served from memory on the second call
+    np.testing.assert_array_equal(
+        Hero._cached_joint(aims[1], gifted, incompetent), direct[1])
+
+
+AIMS = [[12, 14, 9], [19, 1, 5], [3, 3, 18], [10, 10, 10]]
+
+
+def _enumerate(aims, skill_level, gifted, incompetent):
+    """Rate every roll, including the reroll dice, one by one."""
+    events = np.stack(np.meshgrid(*[np.arange(1, 21)] * 3, indexing='ij'),
+                      axis=-1).reshape(-1, 3)
+    if gifted or incompetent:
+        events = np.repeat(events, 20, axis=0)
+        rerolls = np.tile(np.arange(1, 21), 20**3)
+    else:
+        rerolls = None
+    success, critical, qs, qs_app = Hero._perform_test_batch(
+        np.array(aims), events, skill_level, gifted, incompetent,
+        rerolls=rerolls)
+    total = len(events)
+    return (np.bincount(qs, minlength=13) / total,
+            np.bincount(qs_app, minlength=13) / total,
+            np.count_nonzero(critical & success) / total,
+            np.count_nonzero(critical & ~success) / total)
+
+
+@pytest.mark.parametrize('gifted, incompetent', KINDS)
+@pytest.mark.parametrize('aims', AIMS)
+@pytest.mark.parametrize('skill_level', [0, 7, 18])
+def test_qs_distribution_matches_enumeration(aims, skill_level, gifted,
+                                             incompetent):
+    expected = _enumerate(aims, skill_level, gifted, incompetent)
+    result = Hero._qs_distribution(np.array(aims), skill_level, gifted,
+                                   incompetent)
+    for computed, enumerated in zip(result, expected):
+        np.testing.assert_allclose(computed, enumerated, atol=1e-12)
+
+
+@pytest.mark.parametrize('aims', AIMS[:2])
+def test_plain_distribution_matches_scalar_tests(aims):
+    hero = Hero('A', [12] * 8, [5] * 59, rng=1)
+    counts = np.zeros(13)
+    crit = botch = 0
+    for event in itertools.product(range(1, 21), repeat=3):
+        success, critical, qs, _ = hero._perform_test(
+            np.array(aims), np.array(event), skill_level=7)
+        counts[qs] += 1
+        crit += critical and success
+        botch += critical and not success
+    qs_prob, _, crit_prob, botch_prob = Hero._qs_distribution(
+        np.array(aims), 7)
+    np.testing.assert_allclose(qs_prob, counts / 20**3, atol=1e-12)
+    assert crit_prob == pytest.approx(crit / 20**3)
+    assert botch_prob == pytest.approx(botch / 20**3)
+
+
+@pytest.mark.parametrize('gifted, incompetent', KINDS)
+def test_all_events_follow_cube_order(gifted, incompetent):
+    aims = np.array(AIMS[0])
+    rerolls = 20 if gifted or incompetent else 1
+    result = Hero._evaluate_all_events(aims, 6, gifted, incompetent)
+    expected = Hero._perform_test_batch(
+        aims, Hero._EVENTS_3W20[:, None, :], 6, gifted, incompetent,
+        rerolls=np.arange(1, rerolls + 1)[None, :])
+    for computed, batch in zip(result, expected):
+        np.testing.assert_array_equal(computed,
+                                      np.broadcast_to(batch, (8000, rerolls)))
+
+
+def test_distribution_matrix_matches_single_tests():
+    aims = np.array(AIMS * 3)
+    skill_levels = np.arange(len(aims)) % 19
+    gifted = np.arange(len(aims)) % 3 == 1
+    incompetent = np.arange(len(aims)) % 3 == 2
+    qs_prob, crit_prob, botch_prob = Hero._distribution_matrix(
+        aims, skill_levels, gifted, incompetent)
+    for row, aim in enumerate(aims):
+        single, _, crit, botch = Hero._qs_distribution(
+            aim, skill_levels[row], gifted[row], incompetent[row])
+        np.testing.assert_allclose(qs_prob[row], single, atol=1e-12)
+        assert crit_prob[row] == pytest.approx(crit)
+        assert botch_prob[row] == pytest.approx(botch)
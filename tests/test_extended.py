@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Markov chain of `Hero.extended_talent` against all sequences of tests."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from hero import Hero
+
+
+def _enumerate(hero, talent, target, attempts, modifier, penalty,
+               abort_on_botch):
+    """Walk through every sequence of results, outcome -1 is a botch."""
+    weights = []
+    for i in range(attempts):
+        single = hero.analyze_talent_result(talent, modifier - i * penalty)
+        weight = dict(enumerate(single.qs_prob))
+        if abort_on_botch:
+            weight[-1] = single.botch_prob
+            weight[0] -= single.botch_prob
+        weights.append(weight)
+
+    success_prob = np.zeros(attempts)
+    state = np.zeros(target + 1)
+    abort_prob = 0
+    for outcomes in itertools.product(*weights):
+        prob = np.prod([weights[i][q] for i, q in enumerate(outcomes)])
+        total, aborted = 0, False
+        for i, q in enumerate(outcomes):
+            if aborted or total >= target:
+                pass
+            elif q < 0:
+                aborted = True
+            else:
+                total += q
+            if total >= target and not aborted:
+                success_prob[i] += prob
+        if aborted:
+            abort_prob += prob
+        else:
+            state[min(total, target)] += prob
+    return success_prob, state, abort_prob
+
+
+@pytest.mark.parametrize('talent', ['Klettern', 'Zechen', 'Schwimmen'])
+@pytest.mark.parametrize('abort_on_botch', [True, False])
+def test_markov_chain_matches_enumeration(talent, abort_on_botch):
+    rng = np.random.default_rng(3)
+    hero = Hero('A', rng.integers(9, 16, 8).tolist(),
+                rng.integers(2, 12, 59).tolist(), incompetences={'Zechen'},
+                gifted={'Klettern'}, rng=1)
+    result = hero.extended_talent(talent, target=5, attempts=3, modifier=1,
+                                  penalty=1, abort_on_botch=abort_on_botch)
+    expected = _enumerate(hero, talent, 5, 3, 1, 1, abort_on_botch)
+    np.testing.assert_allclose(result[0], expected[0], atol=1e-12)
+    np.testing.assert_allclose(result[1], expected[1], atol=1e-12)
+    assert type(result[2]) is float
+    assert result[2] == pytest.approx(expected[2], abs=1e-12)
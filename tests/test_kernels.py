@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Vectorized `Hero._perform_test_batch` against the scalar rules."""
+
+import numpy as np
+import pytest
+
+from hero import Hero
+
+
+KINDS = [(False, False), (True, False), (False, True)]
+
+
+class _FixedDice():
+    """Stand-in for the DiceBuffer of a hero, rolls a given value."""
+
+    def __init__(self):
+        self.value = 1
+
+    def roll(self, shape=1):
+        return np.full(shape, self.value)
+
+
+@pytest.mark.parametrize('gifted, incompetent', KINDS)
+def test_batch_matches_scalar_test(gifted, incompetent):
+    rng = np.random.default_rng(7)
+    aims = rng.integers(1, 20, (3000, 3))
+    events = rng.integers(1, 21, (3000, 3))
+    # many ones and twenties to cover the critical results
+    events[::4, :2] = rng.choice([1, 20], (750, 2))
+    skill_levels = rng.integers(0, 20, 3000)
+    rerolls = rng.integers(1, 21, 3000)
+
+    batch = Hero._perform_test_batch(aims, events, skill_levels, gifted,
+                                     incompetent, rerolls=rerolls)
+
+    hero = Hero('A', [12] * 8, [5] * 59, rng=1)
+    hero._dice = _FixedDice()
+    for row in range(len(aims)):
+        hero._dice.value = rerolls[row]
+        scalar = hero._perform_test(aims[row].copy(), events[row].copy(),
+                                    int(skill_levels[row]), gifted,
+                                    incompetent)
+        assert scalar == tuple(result[row] for result in batch), row
+
+
+def test_batch_leaves_input_untouched():
+    events = np.array([[1, 17, 20], [5, 5, 5]])
+    original = events.copy()
+    Hero._perform_test_batch(np.array([10, 10, 10]), events, 3,
+                             incompetent=True, rerolls=np.array([20, 1]))
+    np.testing.assert_array_equal(events, original)
+
+
+def test_batch_refuses_gifted_and_incompetent():
+    with pytest.raises(ValueError):
+        Hero._perform_test_batch(np.array([10, 10, 10]),
+                                 np.array([5, 5, 5]), 3, gifted=True,
+                                 incompetent=True)
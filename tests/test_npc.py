@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Random non-player characters of `npc`."""
+
+import numpy as np
+import pytest
+
+from compact import CompactHero
+from hero import Hero, HeroValidationError
+import npc
+
+
+def _values(npcs):
+    return ([list(character._attributes.values()) for character in npcs],
+            [list(character._skills.values()) for character in npcs])
+
+
+def _rolls(npcs):
+    return [character.execute_result('Zechen').rolls.tolist()
+            for character in npcs]
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_same_seed_gives_same_npcs(compact):
+    first = npc.generate_npcs('Wache', 5, seed=7, compact=compact)
+    second = npc.generate_npcs('Wache', 5, seed=7, compact=compact)
+    assert all(isinstance(character, CompactHero if compact else Hero)
+               for character in first)
+    assert [character.name for character in first] == [
+        f'Wache {i}' for i in range(1, 6)]
+    assert _values(first) == _values(second)
+    assert _rolls(first) == _rolls(second)
+    assert _values(npc.generate_npcs('Wache', 5, seed=8)) != _values(first)
+
+
+def test_encounter_is_reproducible():
+    composition = {'Dieb': 3, 'Söldner': 2}
+    first = npc.generate_encounter(composition, seed=4)
+    second = npc.generate_encounter(list(composition.items()), seed=4)
+    assert [character.name for character in first] == [
+        'Dieb 1', 'Dieb 2', 'Dieb 3', 'Söldner 1', 'Söldner 2']
+    assert _values(first) == _values(second)
+    assert _rolls(first) == _rolls(second)
+    assert npc.generate_encounter({}, seed=4) == []
+
+
+@pytest.mark.parametrize('archetype', sorted(npc.ARCHETYPES))
+def test_values_follow_the_archetype(archetype):
+    template = npc.ARCHETYPES[archetype]
+    attributes, skills = map(np.array, _values(
+        npc.generate_npcs(archetype, 400, seed=2)))
+    attribute_mean = [template['Eigenschaften'][attribute]
+                      for attribute in Hero.ATTRIBUTES]
+    skill_mean = [template['Fertigkeiten'].get(skill, template['Grundwert'])
+                  for skill in Hero.SKILL_CHECKS]
+    # within five standard deviations and the legal ranges
+    assert np.all(np.abs(attributes - attribute_mean)
+                  <= 5 * npc.ATTRIBUTE_SPREAD)
+    assert np.all((attributes >= 1) & (attributes <= 25))
+    assert np.all(np.abs(skills - skill_mean) <= 5 * npc.SKILL_SPREAD)
+    assert np.all((skills >= 0) & (skills <= 25))
+    np.testing.assert_allclose(attributes.mean(axis=0), attribute_mean,
+                               atol=.5)
+
+
+def test_unknown_archetype_is_rejected():
+    with pytest.raises(ValueError):
+        npc.generate_npcs('Drache', 1)
+
+
+def test_incomplete_template_is_rejected():
+    template = {key: dict(value) if isinstance(value, dict) else value
+                for key, value in npc.ARCHETYPES['Bauer'].items()}
+    del template['Eigenschaften']['Mut']
+    with pytest.raises(HeroValidationError) as error:
+        npc.generate_npcs(template, 1)
+    assert error.value.field == 'Eigenschaften'
+    assert 'Mut' in str(error.value)
+
+    del template['Grundwert']
+    with pytest.raises(HeroValidationError) as error:
+        npc.generate_npcs(template, 1)
+    assert error.value.field == 'Grundwert'
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Cached objectives, see `Hero._estimae_objective`."""
+
+import numpy as np
+
+from hero import Hero
+
+
+def _hero():
+    return Hero('A', [10, 11, 12, 13, 14, 15, 16, 17], [5] * 59, rng=1)
+
+
+def test_cache_is_keyed_by_content_not_identity():
+    hero = _hero()
+    for attribute, value in (('Mut', 10), ('Klugheit', 11), ('Mut', 10)):
+        # transient sources may reuse the id of a collected one
+        objective, _ = hero._estimae_objective(
+            'X', 0, {'X': (attribute,) * 3})
+        np.testing.assert_array_equal(objective, [value] * 3)
+
+
+def test_cache_is_bounded():
+    hero = _hero()
+    for modifier in range(-2000, 2000):
+        hero._estimae_objective('Klettern', modifier, hero.SKILL_CHECKS)
+    assert len(hero._objective_cache) <= Hero._OBJECTIVE_CACHE_SIZE
+
+
+def test_cache_is_dropped_on_update(monkeypatch):
+    hero = _hero()
+    before, _ = hero._estimae_objective('Klettern', 0, hero.SKILL_CHECKS)
+    # confirm the command line dialogue
+    monkeypatch.setattr('builtins.input', lambda prompt='': 'j')
+    hero.update_attribute('Mut', 1)
+    after, _ = hero._estimae_objective('Klettern', 0, hero.SKILL_CHECKS)
+    assert after[0] == before[0] + 1
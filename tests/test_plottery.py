@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Cache of the headless rendering in `plottery`."""
+
+import numpy as np
+import pytest
+
+import plottery
+from hero import Hero
+
+pytest.importorskip('matplotlib')
+
+
+QS_PROB = np.full(13, 1 / 13)
+
+
+def test_image_is_served_from_cache(tmp_path):
+    image = plottery.render('bars', QS_PROB, fmt='png',
+                            cache_directory=tmp_path)
+    cached, = tmp_path.glob('bars_*.png')
+    assert cached.read_bytes() == image
+
+    # a second call does not draw again but reads the cached file
+    cached.write_bytes(b'cached')
+    assert plottery.render('bars', QS_PROB.tolist(), fmt='png',
+                           cache_directory=tmp_path) == b'cached'
+
+
+def test_key_covers_payload_format_and_resolution(tmp_path):
+    plottery.render('bars', QS_PROB, cache_directory=tmp_path)
+    plottery.render('bars', QS_PROB, cache_directory=tmp_path, dpi=50)
+    plottery.render('bars', QS_PROB, fmt='svg', cache_directory=tmp_path)
+    plottery.render('bars', np.roll(QS_PROB, 1) * .5,
+                    cache_directory=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_clear_cache_keeps_foreign_files(tmp_path):
+    plottery.render('bars', QS_PROB, cache_directory=tmp_path)
+    foreign = tmp_path / 'notes_2026.png'
+    foreign.write_bytes(b'')
+    assert plottery.clear_cache(tmp_path) == 1
+    assert list(tmp_path.iterdir()) == [foreign]
+
+
+def test_path_gets_a_copy_without_cache(tmp_path):
+    path = tmp_path / 'bars.png'
+    image = plottery.render('bars', QS_PROB, path=path,
+                            cache_directory=None)
+    assert path.read_bytes() == image
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize('mode', ['cube', 'heatmap', 'bars', 'curve'])
+def test_every_mode_writes_an_image(tmp_path, monkeypatch, mode):
+    monkeypatch.setitem(plottery.render.__kwdefaults__, 'cache_directory',
+                        tmp_path / 'cache')
+    hero = Hero('A', [12] * 8, [7] * 59, gifted={'Klettern'}, rng=1)
+    path = tmp_path / f'{mode}.svg'
+    image = hero.render_talent('Klettern', -1, fmt='svg', path=path,
+                               mode=mode)
+    assert path.read_bytes() == image
+    assert image.lstrip().startswith(b'<?xml')
+    assert len(list((tmp_path / 'cache').glob(f'{mode}_*.svg'))) == 1
+
+
+def test_unknown_mode_is_rejected():
+    hero = Hero('A', [12] * 8, [7] * 59, rng=1)
+    with pytest.raises(ValueError):
+        hero.render_talent('Klettern', mode='pie')
+
+
+def test_worker_draws_and_exits(monkeypatch):
+    # headless backend in the worker process
+    monkeypatch.setenv('MPLBACKEND', 'Agg')
+    worker = plottery.get_worker()
+    worker.submit('bars', (QS_PROB, QS_PROB, 'Test'))
+    process = worker._process
+    assert worker.alive
+    plottery.shutdown_worker(timeout=60)
+    # a failed drawing would have ended the process with an error
+    assert not process.is_alive() and process.exitcode == 0
+    assert not worker.alive
+    plottery.shutdown_worker()
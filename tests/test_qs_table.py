@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Precomputed tables of `qs_table` against the computed distributions."""
+
+import numpy as np
+import pytest
+
+from compact import CompactHero
+from hero import Hero, HeroBase
+import qs_table
+
+
+MAX_AIM = 6
+
+
+@pytest.fixture(scope='module')
+def directory(tmp_path_factory):
+    # objectives up to MAX_AIM only, the full tables take a while
+    directory = tmp_path_factory.mktemp('tables')
+    qs_table.generate_tables(directory, max_aim=MAX_AIM)
+    return directory
+
+
+@pytest.fixture
+def loaded(directory):
+    Hero.load_qs_table(directory)
+    yield Hero._QS_TABLE
+    Hero.unload_qs_table()
+
+
+def test_tables_hold_counts_of_all_outcomes(directory):
+    for variant, rows, total in [('plain', 56, 20**3),
+                                 ('gifted', MAX_AIM**3, 20**4),
+                                 ('incompetent', MAX_AIM**3, 20**4)]:
+        table = np.load(qs_table.table_path(directory, variant,
+                                            Hero._rule_hash()))
+        assert table.shape == (rows, 26, 28)
+        assert table.dtype == np.uint32
+        # each part of the last axis counts every outcome once
+        assert np.all(table[..., :13].sum(axis=-1) == total)
+        assert np.all(table[..., 13:26].sum(axis=-1) == total)
+        assert np.all(table[..., 26] + table[..., 27] <= total)
+
+
+@pytest.mark.parametrize('gifted, incompetent',
+                         [(False, False), (True, False), (False, True)])
+def test_lookup_matches_computation(directory, gifted, incompetent):
+    rng = np.random.default_rng(2)
+    aims = np.concatenate([rng.integers(1, MAX_AIM + 1, (40, 3)),
+                           [[1, 1, 1], [MAX_AIM] * 3, [MAX_AIM, 1, 4]]])
+    skill_levels = rng.integers(0, 26, len(aims))
+    computed = Hero._qs_distribution(aims, skill_levels, gifted,
+                                     incompetent)
+    table = qs_table.QSTable(Hero._rule_hash(), directory)
+    assert table.covers(aims, skill_levels)
+    looked_up = table.lookup(aims, skill_levels, gifted, incompetent)
+    for tabulated, direct in zip(looked_up, computed):
+        np.testing.assert_allclose(tabulated, direct, atol=1e-12)
+
+
+@pytest.mark.parametrize('kind', [Hero, CompactHero])
+def test_analysis_uses_loaded_table(loaded, monkeypatch, kind):
+    hero = kind('A', [5] * 8, [4] * 59, rng=1)
+    qs_prob, *_ = Hero._rate_joint(
+        Hero._joint_distribution(np.array([4, 4, 4])), 4)
+
+    def computed(*args, **kwargs):
+        raise AssertionError('covered tests are looked up')
+
+    monkeypatch.setattr(HeroBase, '_cached_joint', computed)
+    np.testing.assert_allclose(
+        hero.analyze_talent_result('Zechen', -1).qs_prob, qs_prob,
+        atol=1e-12)
+    # larger objectives are computed instead
+    monkeypatch.undo()
+    assert not loaded.covers(np.array([5, 5, MAX_AIM + 1]), 4)
+    assert not hero.analyze_talent_result('Zechen', 3).impossible
+
+
+def test_tables_of_other_rules_are_not_used(directory, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        qs_table.QSTable('0' * 12, directory)
+    with pytest.raises(FileNotFoundError):
+        Hero.load_qs_table(tmp_path)
+    assert Hero._QS_TABLE is None
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Structured results of `results` and the text of the string methods."""
+
+import json
+
+import numpy as np
+import pytest
+
+from hero import Hero
+from results import QSDistribution
+from twinkle import Twinkle
+
+
+def _hero():
+    return Hero('A', [13, 12, 14, 11, 12, 13, 14, 12], [9] * 59,
+                gifted=['Klettern'], incompetences=['Zechen'], rng=5)
+
+
+def _twinkle():
+    return Twinkle('T', 'Hexe', [12] * 8, [8] * 59, gifted=['X'],
+                   twinkle_abilities={
+                       'Proben': {'X': ('Mut', 'Mut', 'Klugheit')},
+                       'Fertigkeitswerte': {'X': 5}},
+                   rng=3)
+
+
+# text of the first rolls of the seeded heroes before the results existed
+BASELINE = [
+    'A absolviert eine Probe auf Klettern (Fertigkeitswert 9).\n\n'
+    'Eigenschaften:\n\tMut - Gewandtheit - Körperkraft\nZielwerte:\n'
+    '\t[13 13 12]\nWürfelergebnis:\n\t[14 17  1]\n\n'
+    'Ergebnis der Begabung:\nErfolg mit 2 (2) Qualitätsstufen.',
+    'A absolviert eine Probe auf Zechen (Fertigkeitswert 9), um 2'
+    ' erschwert.\n\nEigenschaften:\n\tKlugheit - Konstitution - Körperkraft'
+    '\nZielwerte:\n\t[10 12 10]\nWürfelergebnis:\n\t[ 6 11 13]\n\n'
+    'Ergebnis der Unfähigkeit:\nErfolg mit 2 (3) Qualitätsstufen.',
+    'A absolviert eine Probe auf Fliegen (Fertigkeitswert 9), um 3'
+    ' erleichtert.\n\nEigenschaften:\n\tMut - Intuition - Gewandtheit\n'
+    'Zielwerte:\n\t[16 17 16]\nWürfelergebnis:\n\t[20  2  6]\n\n'
+    'Ergebnis:\nErfolg mit 2 (3) Qualitätsstufen.',
+    'Die Erschwernis von 15 macht diese Probe unmöglich.',
+    'A testet Mut (13), erschwert um 2:\n\n'
+    'Geschafft mit einem Wurf von 8.',
+]
+TWINKLE_BASELINE = (
+    'T vollführt X (Fertigkeitswert 5), um 3 erschwert.\n\n'
+    'Eigenschaften:\n\tMut - Mut - Klugheit\nZielwerte:\n\t[9 9 9]\n'
+    'Würfelergebnis:\n\t[5 2 4]\n\n'
+    'Ergebnis der Begabung:\nErfolg mit 2 (2) Qualitätsstufen.')
+TESTS = [('Klettern', 0), ('Zechen', -2), ('Fliegen', 3), ('Fliegen', -15)]
+
+
+def test_text_matches_baseline():
+    hero = _hero()
+    texts = [hero.execute(talent, modifier) for talent, modifier in TESTS]
+    texts.append(hero.test('Mut', -2))
+    assert texts == BASELINE
+    assert _twinkle().perform('X', -3) == TWINKLE_BASELINE
+
+
+def test_text_is_built_from_result():
+    # same seed, so both heroes roll the same dice
+    hero, twin = _hero(), _hero()
+    for i in range(200):
+        for talent, modifier in TESTS:
+            result = twin.execute_result(talent, modifier)
+            assert hero.execute(talent, modifier) == str(result)
+        modifier = i % 5 - 2
+        assert hero.test('Mut', modifier) == str(
+            twin.test_result('Mut', modifier))
+
+    twinkle, twin = _twinkle(), _twinkle()
+    for i in range(200):
+        for modifier in (i % 7 - 3, -14):
+            result = twin.perform_result('X', modifier)
+            assert twinkle.perform('X', modifier) == str(result)
+
+
+def test_roll_result_carries_values():
+    hero = _hero()
+    # third roll of BASELINE
+    for talent, modifier in TESTS[:2]:
+        hero.execute_result(talent, modifier)
+    result = hero.execute_result('Fliegen', 3)
+    assert result.success and not result.critical
+    assert (result.quality_level, result.quality_level_application) == (2, 3)
+    np.testing.assert_array_equal(result.aims, [16, 17, 16])
+    np.testing.assert_array_equal(result.rolls, [20, 2, 6])
+    assert result.to_dict()['rolls'] == [20, 2, 6]
+    with pytest.raises(AttributeError):
+        result.comment = 'no further fields'
+
+
+def test_distribution_survives_json():
+    distribution = _hero().analyze_talent_result('Klettern', -2)
+    restored = QSDistribution.from_dict(json.loads(distribution.to_json()))
+    assert restored.to_dict() == distribution.to_dict()
+    np.testing.assert_array_equal(restored.qs_prob, distribution.qs_prob)
+    assert str(restored) == str(distribution)
+
+
+def test_numpy_scalars_are_serialized():
+    distribution = QSDistribution(
+        np.str_('A'), 'Zechen', np.full(13, 1 / 13), np.full(13, 1 / 13),
+        np.float64(.1), np.float32(.25), modifier=np.int64(-2),
+        impossible=np.bool_(False))
+    data = json.loads(distribution.to_json())
+    assert data['modifier'] == -2 and data['impossible'] is False
+    assert data['botch_prob'] == .25
+    assert QSDistribution.from_dict(data).to_dict() == data
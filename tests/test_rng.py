@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Seeded generators of heroes, see `Hero.rng`."""
+
+import numpy as np
+
+from compact import CompactHero
+from hero import Hero
+
+
+def _rolls(hero, count=50):
+    return [hero.execute_result('Zechen').rolls.tolist()
+            for _ in range(count)]
+
+
+def _hero(rng):
+    return Hero('A', [12] * 8, [5] * 59, gifted={'Klettern'}, rng=rng)
+
+
+def test_same_seed_gives_same_rolls():
+    first, second = _hero(42), _hero(42)
+    assert _rolls(first) == _rolls(second)
+    assert ([str(first.test('Mut')) for _ in range(20)]
+            == [str(second.test('Mut')) for _ in range(20)])
+    assert _rolls(_hero(43)) != _rolls(_hero(42))
+
+
+def test_setting_the_seed_replays_the_rolls():
+    hero = _hero(42)
+    rolls = _rolls(hero)
+    hero.rng = 42
+    assert _rolls(hero) == rolls
+
+
+def test_batch_gets_independent_reproducible_streams():
+    values = (np.full((4, 8), 12), np.full((4, 59), 5))
+    for kind in (Hero, CompactHero):
+        heroes = kind.from_arrays(list('ABCD'), *values, rng=9)
+        again = kind.from_arrays(list('ABCD'), *values, rng=9)
+        rolls = [_rolls(hero) for hero in heroes]
+        assert rolls == [_rolls(hero) for hero in again]
+        # no two heroes share their rolls, nor with the seed itself
+        rolls.append(_rolls(_hero(9)))
+        assert len({str(sequence) for sequence in rolls}) == len(rolls)
+
+
+def test_deferred_streams_equal_spawned_generators():
+    heroes = Hero.from_arrays(list('ABC'), np.full((3, 8), 12),
+                              np.full((3, 59), 5), rng=9)
+    root = np.random.SeedSequence(9).spawn(1)[0]
+    for hero, child in zip(heroes, root.spawn(3)):
+        expected = np.random.default_rng(child).integers(0, 2**32, 8)
+        np.testing.assert_array_equal(hero.rng.integers(0, 2**32, 8),
+                                      expected)
+
+
+def test_spawned_generators_are_reproducible():
+    first, second = _hero(5).spawn_rngs(3), _hero(5).spawn_rngs(3)
+    draws = [rng.integers(1, 21, 10).tolist() for rng in first]
+    assert draws == [rng.integers(1, 21, 10).tolist() for rng in second]
+    assert len({str(draw) for draw in draws}) == 3
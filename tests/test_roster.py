@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Analysis of parties and crowds in `roster`."""
+
+import itertools
+import json
+
+import numpy as np
+import pytest
+
+from hero import Hero
+from roster import crowd_analysis, crowd_check, group_test, load_roster
+from twinkle import Twinkle
+
+
+def _heroes():
+    rng = np.random.default_rng(11)
+    return [Hero(name, rng.integers(9, 16, 8).tolist(),
+                 rng.integers(2, 14, 59).tolist(), gifted=gifted, rng=1)
+            for name, gifted in [('A', {'Klettern'}), ('B', None),
+                                 ('C', {'Zechen'})]]
+
+
+def _qs_prob(hero, talent, modifier):
+    return hero.analyze_talent_result(talent, modifier).qs_prob
+
+
+def test_group_test_matches_enumeration():
+    a, b, c = _heroes()
+    entries = [(a, 'Klettern', 0), [(b, 'Klettern', 1), (c, 'Klettern', -2)],
+               (c, 'Zechen', 0)]
+    single = [_qs_prob(a, 'Klettern', 0), _qs_prob(b, 'Klettern', 1),
+              _qs_prob(c, 'Klettern', -2), _qs_prob(c, 'Zechen', 0)]
+
+    sum_prob = np.zeros(37)
+    for qs in itertools.product(range(13), repeat=4):
+        prob = np.prod([single[i][q] for i, q in enumerate(qs)])
+        # assistance: only the better of both helpers counts
+        sum_prob[qs[0] + max(qs[1], qs[2]) + qs[3]] += prob
+
+    reach_prob, result = group_test(entries, threshold=6)
+    np.testing.assert_allclose(result, sum_prob, atol=1e-12)
+    assert reach_prob == pytest.approx(sum_prob[6:].sum())
+
+
+def test_group_test_needs_entries():
+    with pytest.raises(ValueError):
+        group_test([], threshold=1)
+
+
+def test_load_roster_skips_incomplete_files(tmp_path, monkeypatch):
+    def dialogue(prompt=''):
+        raise AssertionError('no dialogue while loading a roster')
+
+    monkeypatch.setattr('builtins.input', dialogue)
+    hero, _, _ = _heroes()
+    hero.save(tmp_path)
+    abilities = {'Proben': {'Segen': ['Mut', 'Klugheit', 'Intuition']},
+                 'Fertigkeitswerte': {'Segen': 5}}
+    twinkle, = Twinkle.from_arrays(['Mary Sue'], ['Geweihte'],
+                                   [[12] * 8], [[4] * 59], [abilities])
+    twinkle.save(tmp_path)
+    stats = json.loads((tmp_path / 'Mary_Sue.json').read_text())
+    stats['Funzelfertigkeiten'] = {}
+    (tmp_path / 'Empty.json').write_text(json.dumps(stats))
+    stats['Eigenschaften'] = {'Mut': 12}
+    (tmp_path / 'Partial.json').write_text(json.dumps(stats))
+    (tmp_path / 'Broken.json').write_text('{')
+
+    heroes, skipped = load_roster(tmp_path)
+    assert [type(hero) for hero in heroes] == [Hero, Twinkle]
+    assert heroes[1].name == 'Mary Sue'
+    assert heroes[0]._skills == hero._skills
+    assert sorted(file.name for file in skipped) == [
+        'Broken.json', 'Empty.json', 'Partial.json']
+    assert all(skipped.values())
+
+
+def _crowd():
+    rng = np.random.default_rng(12)
+    flags = [({'Klettern'}, None), (None, {'Klettern'}), (None, None)] * 20
+    return [Hero(f'N{i}', rng.integers(9, 16, 8).tolist(),
+                 rng.integers(2, 14, 59).tolist(), gifted=gifted,
+                 incompetences=incompetences, rng=1)
+            for i, (gifted, incompetences) in enumerate(flags)]
+
+
+def test_crowd_analysis_matches_single_analyses():
+    heroes = _crowd()
+    modifiers = np.arange(len(heroes)) % 7 - 4
+    chances, _ = crowd_analysis(heroes, 'Klettern', modifiers)
+    for hero, modifier in zip(heroes, modifiers):
+        single = hero.analyze_talent_result('Klettern', modifier)
+        row = chances.loc[hero.name]
+        assert row['Erfolg'] == pytest.approx(single.success_prob)
+        assert row['Erwartungswert'] == pytest.approx(single.expected_value)
+        assert row['Kritischer Erfolg'] == pytest.approx(single.crit_prob)
+        assert row['Patzer'] == pytest.approx(single.botch_prob)
+
+
+def test_crowd_check_matches_single_tests():
+    heroes = _crowd()
+    outcome, summary = crowd_check(heroes, 'Klettern', -1, rng=3)
+    rng = np.random.default_rng(3)
+    events = rng.integers(1, 21, (len(heroes), 3))
+    rerolls = rng.integers(1, 21, len(heroes))
+    checks = Hero.SKILL_CHECKS['Klettern']
+    for hero, event, reroll in zip(heroes, events, rerolls):
+        aims = np.minimum([hero._attributes[a] - 1 for a in checks], 19)
+        gifted = 'Klettern' in hero._gifted
+        incompetent = 'Klettern' in hero._incompetences
+        success, critical, quality_level, _ = Hero._perform_test_batch(
+            aims, event, hero._skills['Klettern'], gifted=gifted,
+            incompetent=incompetent, rerolls=reroll)
+        row = outcome.loc[hero.name]
+        assert (row['Erfolg'], row['Kritisch'], row['QS']) == (
+            success, critical, quality_level)
+        # the dice shown are those used, at most one of them rerolled
+        dice = row[['W1', 'W2', 'W3']].to_numpy()
+        assert np.count_nonzero(dice != event) <= (gifted or incompetent)
+        assert Hero._perform_test_batch(
+            aims, dice, hero._skills['Klettern'])[2] == quality_level
+    assert (outcome[['W1', 'W2', 'W3']].to_numpy() != events).any()
+    assert summary['Erfolge'] == outcome['Erfolg'].sum()
+    assert summary['Erfolge'] + summary['Misserfolge'] == len(heroes)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Monte Carlo estimates of `simulation` against the exact distributions."""
+
+import numpy as np
+import pytest
+
+from hero import Hero
+
+
+OPTIONS = {'trials': 20_000, 'chunk_size': 5_000, 'seed': 1,
+           'confidence': 0.999}
+
+
+def _hero():
+    return Hero('A', [13, 12, 14, 11, 12, 13, 14, 12], [9] * 59,
+                gifted=['Klettern'], incompetences=['Zechen'], rng=5)
+
+
+@pytest.mark.parametrize('talent', ['Klettern', 'Zechen', 'Schwimmen'])
+def test_exact_chances_lie_within_the_intervals(talent):
+    hero = _hero()
+    exact = hero.analyze_talent_result(talent, -2)
+    histogram, summary = hero.simulate_talent(talent, -2, workers=1,
+                                              **OPTIONS)
+    assert histogram.sum() == OPTIONS['trials']
+    expected = [('Erfolg', exact.success_prob),
+                ('Erwartungswert', exact.expected_value)]
+    expected += [(f'P(QS={q})', p) for q, p in enumerate(exact.qs_prob)
+                 if p > 0]
+    for row, value in expected:
+        lower, upper = summary.loc[row, ['Untere Grenze', 'Obere Grenze']]
+        assert lower <= value <= upper, row
+
+
+def test_results_do_not_depend_on_the_workers():
+    hero = _hero()
+    histogram, summary = hero.simulate_talent('Zechen', workers=1,
+                                              **OPTIONS)
+    parallel, parallel_summary = hero.simulate_talent('Zechen', workers=2,
+                                                      **OPTIONS)
+    np.testing.assert_array_equal(parallel, histogram)
+    assert parallel_summary.equals(summary)
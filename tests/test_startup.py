@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""Deferred heavy dependencies at startup, see `bench_startup`."""
+
+import pytest
+
+import bench_startup
+
+
+@pytest.mark.parametrize('module', ['hero', 'twinkle', 'roster'])
+def test_import_defers_pandas_and_matplotlib(module):
+    _, loaded = bench_startup.measure(module, repeat=1)
+    assert loaded == []